@@ -1,74 +1,114 @@
 """FastAPI application wrapping all MCP server tools as REST API endpoints."""
 
+import asyncio
+import functools
+import logging
 import os
 import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import AsyncIterator
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict
 
+import uvicorn
 from dotenv import load_dotenv
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Response
 
-from db_context import MultiDatabaseContext
+from api.middleware import CORSMiddleware
+from api.responses import ORJSONResponse
 
-# Import routers
-from api.routes import crud, databases, schema, metadata, plsql, sql
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    _handler = logging.StreamHandler(sys.stderr)
+    _handler.setFormatter(logging.Formatter("%(levelname)s:     %(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
 
 # Load environment variables
 load_dotenv()
 
+# Snapshot the environment once; configuration is read from this dict
+_ENV = dict(os.environ)
+_getenv = _ENV.get
+
+_TRUE_VALUES = frozenset(('true', '1', 'yes'))
+_FALSE_VALUES = frozenset(('false', '0', 'no'))
+
+
+def _env_flag(value) -> bool:
+    """Interpret an environment value as a boolean flag."""
+    return (value or '').lower() in _TRUE_VALUES
+
 
+@functools.lru_cache(maxsize=1)
 def parse_database_configs():
-    """Parse database configurations from environment variables."""
-    from typing import Dict, Any
+    """Parse database configurations from environment variables.
     
-    db_names_str = os.getenv('DB_NAMES', '')
+    The environment is snapshotted at import, so the result is computed once
+    and returned as a read-only mapping.
+    """
+    db_names_str = _getenv('DB_NAMES', '')
     if not db_names_str:
-        single_conn = os.getenv('ORACLE_CONNECTION_STRING')
+        single_conn = _getenv('ORACLE_CONNECTION_STRING')
         if single_conn:
-            return {
-                "default": {
+            return MappingProxyType({
+                "default": MappingProxyType({
                     "connection_string": single_conn,
-                    "target_schema": os.getenv('TARGET_SCHEMA'),
-                    "use_thick_mode": os.getenv('THICK_MODE', '').lower() in ('true', '1', 'yes'),
-                    "lib_dir": os.getenv('ORACLE_CLIENT_LIB_DIR')
-                }
-            }
+                    "target_schema": _getenv('TARGET_SCHEMA'),
+                    "use_thick_mode": _env_flag(_getenv('THICK_MODE')),
+                    "lib_dir": _getenv('ORACLE_CLIENT_LIB_DIR')
+                })
+            })
         raise ValueError("Either DB_NAMES or ORACLE_CONNECTION_STRING must be set")
     
-    db_names = [name.strip() for name in db_names_str.split(',')]
+    # Names are dict keys on every request lookup; interning makes those hits identity checks
+    db_names = [sys.intern(name) for name in (n.strip() for n in db_names_str.split(',')) if name]
     databases: Dict[str, Dict[str, Any]] = {}
     
     for db_name in db_names:
         prefix = f"DB_{db_name.upper()}_"
-        conn_str = os.getenv(f"{prefix}CONNECTION_STRING")
+        conn_str = _getenv(f"{prefix}CONNECTION_STRING")
         
         if not conn_str:
             raise ValueError(f"Missing connection string for database '{db_name}': {prefix}CONNECTION_STRING")
         
-        databases[db_name] = {
+        databases[db_name] = MappingProxyType({
             "connection_string": conn_str,
-            "target_schema": os.getenv(f"{prefix}SCHEMA"),
-            "use_thick_mode": os.getenv(f"{prefix}THICK_MODE", '').lower() in ('true', '1', 'yes'),
-            "lib_dir": os.getenv(f"{prefix}CLIENT_LIB_DIR")
-        }
+            "target_schema": _getenv(f"{prefix}SCHEMA"),
+            "use_thick_mode": _env_flag(_getenv(f"{prefix}THICK_MODE")),
+            "lib_dir": _getenv(f"{prefix}CLIENT_LIB_DIR")
+        })
     
-    return databases
+    return MappingProxyType(databases)
+
 
+CACHE_DIR = _getenv('CACHE_DIR', '.cache')
+READ_ONLY_MODE = _getenv('READ_ONLY_MODE', 'true').lower() not in _FALSE_VALUES
+DB_POOL_MIN = int(_getenv('DB_POOL_MIN', '5'))
+DB_POOL_MAX = int(_getenv('DB_POOL_MAX', '20'))
+CORS_ORIGINS = _getenv("CORS_ORIGINS", "*").split(",")
 
-CACHE_DIR = os.getenv('CACHE_DIR', '.cache')
-READ_ONLY_MODE = os.getenv('READ_ONLY_MODE', 'true').lower() not in ('false', '0', 'no')
+# Static health payload, encoded once instead of on every probe
+_HEALTH_BODY = b'{"status":"healthy"}'
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Manage FastAPI application lifecycle."""
-    print("Initializing FastAPI Oracle Database Server", file=sys.stderr)
+    # Deferred: pulls in oracledb, only needed once the server actually starts
+    from db_context import MultiDatabaseContext
+    from api.dependencies import set_multi_db_context
+    
+    logger.info("Initializing FastAPI Oracle Database Server")
     
     databases = parse_database_configs()
-    print(f"Configured databases: {list(databases.keys())}", file=sys.stderr)
+    logger.info("Configured databases: %s", list(databases.keys()))
     
     cache_dir = Path(CACHE_DIR)
     cache_dir.mkdir(parents=True, exist_ok=True)
@@ -76,24 +116,33 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     multi_db_context = MultiDatabaseContext(
         databases=databases,
         cache_base_path=cache_dir,
-        read_only=READ_ONLY_MODE
+        read_only=READ_ONLY_MODE,
+        pool_min=DB_POOL_MIN,
+        pool_max=DB_POOL_MAX
     )
     
     try:
         await multi_db_context.initialize()
-        print("All database caches ready!", file=sys.stderr)
+        logger.info("All database caches ready!")
         
         # Store context in app state for access by routes
         app.state.multi_db_context = multi_db_context
+        set_multi_db_context(multi_db_context)
         
         yield
     finally:
-        print("Closing database connections...", file=sys.stderr)
+        set_multi_db_context(None)
+        logger.info("Closing database connections...")
         await multi_db_context.close()
 
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
+    # Routers pull in the models and the Oracle driver; import them only
+    # when an application is actually built.
+    from api.routes import crud, databases, schema, metadata, plsql, sql
+    from api.errors import register_error_handlers
+    
     app = FastAPI(
         title="Oracle MCP Server API",
         description="""
@@ -116,17 +165,25 @@ All endpoints require the database name as a path parameter.
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        # Rendered with orjson, which handles the Decimal/bytes values in raw
+        # row dicts via orjson_default
+        default_response_class=ORJSONResponse,
     )
     
     # Add CORS middleware
+    # Middleware wraps every route, mounted sub-apps included, so anything
+    # added here sits on the /sql hot path too: keep it pure ASGI.
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=os.getenv("CORS_ORIGINS", "*").split(","),
+        allow_origins=CORS_ORIGINS,
         allow_credentials=True,
-        allow_methods=["*"],
+        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
         allow_headers=["*"],
     )
     
+    # Driver and permission errors raised by any route map to 400/403 here
+    register_error_handlers(app)
+    
     # Include routers
     app.include_router(databases.router)
     app.include_router(crud.router)
@@ -139,7 +196,7 @@ All endpoints require the database name as a path parameter.
     @app.get("/health", tags=["Health"])
     async def health_check():
         """Health check endpoint."""
-        return JSONResponse({"status": "healthy"})
+        return Response(content=_HEALTH_BODY, media_type="application/json")
     
     # Root endpoint
     @app.get("/", tags=["Root"])
@@ -156,30 +213,51 @@ All endpoints require the database name as a path parameter.
     return app
 
 
-# Create the app instance for uvicorn
-app = create_app()
+_app = None
+
+
+def get_app() -> FastAPI:
+    """Return the shared application instance, creating it on first use."""
+    global _app
+    if _app is None:
+        _app = create_app()
+    return _app
+
+
+def __getattr__(name: str):
+    # `uvicorn api.app:app` resolves the instance through this hook, so
+    # importing api.app alone does not build the application.
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 async def run_fastapi_server(host: str = "127.0.0.1", port: int = 8080):
     """Run the FastAPI server with uvicorn."""
-    import uvicorn
-    
-    print(f"Starting FastAPI server on {host}:{port}", file=sys.stderr)
-    print(f"API Documentation: http://{host}:{port}/docs", file=sys.stderr)
-    print(f"Health check: http://{host}:{port}/health", file=sys.stderr)
+    logger.info("Starting FastAPI server on %s:%s", host, port)
+    logger.info("API Documentation: http://%s:%s/docs", host, port)
+    logger.info("Health check: http://%s:%s/health", host, port)
     
     config = uvicorn.Config(
-        app,
+        get_app(),
         host=host,
         port=port,
         log_level="info",
+        loop="uvloop" if uvloop is not None else "asyncio",
     )
     server = uvicorn.Server(config)
     await server.serve()
 
 
+def run_server(host: str = "127.0.0.1", port: int = 8080):
+    """Run the FastAPI server on a uvloop event loop, falling back to asyncio."""
+    if uvloop is not None:
+        uvloop.run(run_fastapi_server(host, port))
+    else:
+        asyncio.run(run_fastapi_server(host, port))
+
+
 if __name__ == "__main__":
-    import asyncio
     import argparse
     
     parser = argparse.ArgumentParser(description="Oracle MCP Server FastAPI")
@@ -187,4 +265,4 @@ if __name__ == "__main__":
     parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
     args = parser.parse_args()
     
-    asyncio.run(run_fastapi_server(args.host, args.port))
+    run_server(args.host, args.port)
@@ -1,26 +1,39 @@
 """Dependencies for FastAPI routes."""
 
-from typing import Annotated
-from fastapi import Depends, HTTPException, Request
+import sys
+from typing import Annotated, AsyncIterator, Optional
+from fastapi import Depends, HTTPException
 
 from db_context import MultiDatabaseContext, DatabaseContext
 
 
-async def get_multi_db_context(request: Request) -> MultiDatabaseContext:
-    """Get the MultiDatabaseContext from app state."""
-    multi_ctx = getattr(request.app.state, "multi_db_context", None)
-    if multi_ctx is None:
+# Set once by the application lifespan; read by every request
+_CTX: Optional[MultiDatabaseContext] = None
+
+
+def set_multi_db_context(multi_ctx: Optional[MultiDatabaseContext]) -> None:
+    """Register the MultiDatabaseContext served to route dependencies."""
+    global _CTX
+    _CTX = multi_ctx
+
+
+# Dependencies are declared async although they never await: FastAPI runs
+# plain-def dependencies in its threadpool, which would add a thread handoff
+# to every request for what is a global read and a dict lookup.
+async def get_multi_db_context() -> MultiDatabaseContext:
+    """Get the MultiDatabaseContext registered at startup."""
+    if _CTX is None:
         raise HTTPException(
             status_code=503,
             detail="Database context not initialized. Server may still be starting up."
         )
-    return multi_ctx
+    return _CTX
 
 
 def get_database_context(db_name: str, multi_ctx: MultiDatabaseContext) -> DatabaseContext:
     """Validate and return a specific database context."""
     try:
-        return multi_ctx.get_database(db_name)
+        return multi_ctx.get_database(sys.intern(db_name))
     except ValueError as e:
         available = ", ".join(multi_ctx.list_databases())
         raise HTTPException(
@@ -31,36 +44,25 @@ def get_database_context(db_name: str, multi_ctx: MultiDatabaseContext) -> Datab
 
 # Type aliases for dependency injection
 MultiDBContextDep = Annotated[MultiDatabaseContext, Depends(get_multi_db_context)]
-"""Dependencies for FastAPI routes."""
 
-from typing import Annotated
-from fastapi import Depends, HTTPException, Request
 
-from db_context import MultiDatabaseContext, DatabaseContext
+async def resolve_database_context(database_name: str, multi_ctx: MultiDBContextDep) -> DatabaseContext:
+    """Resolve the ``{database_name}`` path parameter to its DatabaseContext.
 
+    FastAPI caches dependency results per request, so routes and other
+    dependencies asking for it share one lookup.
+    """
+    return get_database_context(database_name, multi_ctx)
 
-async def get_multi_db_context(request: Request) -> MultiDatabaseContext:
-    """Get the MultiDatabaseContext from app state."""
-    multi_ctx = getattr(request.app.state, "multi_db_context", None)
-    if multi_ctx is None:
-        raise HTTPException(
-            status_code=503,
-            detail="Database context not initialized. Server may still be starting up."
-        )
-    return multi_ctx
 
+DatabaseContextDep = Annotated[DatabaseContext, Depends(resolve_database_context)]
 
-def get_database_context(db_name: str, multi_ctx: MultiDatabaseContext) -> DatabaseContext:
-    """Validate and return a specific database context."""
-    try:
-        return multi_ctx.get_database(db_name)
-    except ValueError as e:
-        available = ", ".join(multi_ctx.list_databases())
-        raise HTTPException(
-            status_code=404,
-            detail=f"{str(e)}. Available databases: {available}"
-        )
 
+async def pin_database_connection(db_context: DatabaseContextDep) -> AsyncIterator[None]:
+    """Keep every query of the request on one pooled connection.
 
-# Type aliases for dependency injection
-MultiDBContextDep = Annotated[MultiDatabaseContext, Depends(get_multi_db_context)]
+    For routes that issue many statements, so they hit the per-session
+    cursor and statement caches. Add via ``dependencies=[Depends(...)]``.
+    """
+    async with db_context.pinned_connection():
+        yield
@@ -0,0 +1,28 @@
+"""Application-wide translation of database errors into HTTP responses.
+
+Route handlers let driver and permission errors propagate instead of wrapping
+every call in its own try/except; the handlers registered here map them to
+the same ``{"detail": ...}`` body ``HTTPException`` produces. Anything not
+listed is a server bug and surfaces as a 500 with its traceback logged.
+"""
+
+import oracledb
+from fastapi import FastAPI, Request
+
+from api.responses import ORJSONResponse
+
+
+async def permission_error_handler(request: Request, exc: PermissionError) -> ORJSONResponse:
+    """Read-only mode and privilege errors: 403 Forbidden."""
+    return ORJSONResponse({"detail": str(exc)}, status_code=403)
+
+
+async def bad_request_handler(request: Request, exc: oracledb.Error) -> ORJSONResponse:
+    """Driver errors caused by the request itself (invalid SQL, bad object names): 400."""
+    return ORJSONResponse({"detail": str(exc)}, status_code=400)
+
+
+def register_error_handlers(app: FastAPI) -> None:
+    """Install the shared exception handlers on the application."""
+    app.add_exception_handler(PermissionError, permission_error_handler)
+    app.add_exception_handler(oracledb.Error, bad_request_handler)
@@ -0,0 +1,145 @@
+"""Pure ASGI middleware for the FastAPI application.
+
+These classes talk to the ASGI interface directly instead of going through
+``BaseHTTPMiddleware``, so no ``Request``/``Response`` objects are built per
+call and non-HTTP scopes pass straight through.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+
+Header = Tuple[bytes, bytes]
+
+
+class CORSMiddleware:
+    """Minimal CORS middleware with header values encoded once at init time.
+
+    Requests without an ``Origin`` header are forwarded untouched. Preflight
+    requests are answered directly; simple requests get the allow-origin
+    headers appended to the downstream ``http.response.start`` message.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Sequence[str] = ("*",),
+        allow_methods: Sequence[str] = ("*",),
+        allow_headers: Sequence[str] = ("*",),
+        allow_credentials: bool = False,
+        max_age: int = 600,
+    ) -> None:
+        self.app = app
+        self.allow_all_origins = "*" in allow_origins
+        self.allow_origins = frozenset(o.encode("latin-1") for o in allow_origins)
+        self.allow_all_headers = "*" in allow_headers
+        self.allow_headers = frozenset(h.lower() for h in allow_headers)
+        self.allow_credentials = allow_credentials
+
+        methods = ALL_METHODS if "*" in allow_methods else tuple(m.upper() for m in allow_methods)
+        self.allow_methods = frozenset(m.encode("latin-1") for m in methods)
+
+        # Wildcard origin may only be sent literally when credentials are off
+        self.echo_origin = not self.allow_all_origins or allow_credentials
+
+        simple: List[Header] = []
+        if self.allow_all_origins and not allow_credentials:
+            simple.append((b"access-control-allow-origin", b"*"))
+        if allow_credentials:
+            simple.append((b"access-control-allow-credentials", b"true"))
+        self.simple_headers = simple
+
+        preflight: List[Header] = list(simple)
+        preflight.append((b"access-control-allow-methods", ", ".join(methods).encode("latin-1")))
+        preflight.append((b"access-control-max-age", str(max_age).encode("latin-1")))
+        if not self.allow_all_headers:
+            preflight.append((b"access-control-allow-headers", ", ".join(sorted(self.allow_headers)).encode("latin-1")))
+        self.preflight_headers = preflight
+
+    def is_allowed_origin(self, origin: bytes) -> bool:
+        return self.allow_all_origins or origin in self.allow_origins
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin: Optional[bytes] = None
+        request_method: Optional[bytes] = None
+        request_headers: Optional[bytes] = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"access-control-request-method":
+                request_method = value
+            elif key == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self.preflight_response(origin, request_method, request_headers, send)
+            return
+
+        if not self.is_allowed_origin(origin):
+            await self.app(scope, receive, send)
+            return
+
+        await self.app(scope, receive, self.wrap_send(send, origin))
+
+    def wrap_send(self, send: Send, origin: bytes) -> Send:
+        extra = self.simple_headers
+        if self.echo_origin:
+            extra = extra + [(b"access-control-allow-origin", origin), (b"vary", b"Origin")]
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + extra
+            await send(message)
+
+        return send_with_cors
+
+    async def preflight_response(
+        self,
+        origin: bytes,
+        request_method: bytes,
+        request_headers: Optional[bytes],
+        send: Send,
+    ) -> None:
+        headers = list(self.preflight_headers)
+        failures = []
+
+        if self.is_allowed_origin(origin):
+            if self.echo_origin:
+                headers.append((b"access-control-allow-origin", origin))
+                headers.append((b"vary", b"Origin"))
+        else:
+            failures.append("origin")
+
+        if request_method.upper() not in self.allow_methods:
+            failures.append("method")
+
+        if request_headers is not None:
+            if self.allow_all_headers:
+                headers.append((b"access-control-allow-headers", request_headers))
+            else:
+                for header in request_headers.decode("latin-1").split(","):
+                    if header.strip().lower() not in self.allow_headers:
+                        failures.append("headers")
+                        break
+
+        if failures:
+            body = ("Disallowed CORS " + ", ".join(failures)).encode("latin-1")
+            status = 400
+        else:
+            body = b"OK"
+            status = 200
+
+        headers.append((b"content-type", b"text/plain; charset=utf-8"))
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,98 @@
+"""Response classes for the FastAPI application."""
+
+import hashlib
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any, Optional
+
+import orjson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse, Response
+
+
+def _iso_duration(value: timedelta) -> str:
+    """Format a timedelta as an ISO 8601 duration, the way Pydantic does ("P1DT2H")."""
+    micros = (value.days * 86400 + value.seconds) * 1_000_000 + value.microseconds
+    sign = "-" if micros < 0 else ""
+    days, micros = divmod(abs(micros), 86_400_000_000)
+    seconds, micros = divmod(micros, 1_000_000)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+
+    parts = [sign, "P"]
+    if days >= 365:
+        parts.append(f"{days // 365}Y")
+        days %= 365
+    if days:
+        parts.append(f"{days}D")
+    if hours or minutes or seconds or micros:
+        parts.append("T")
+        if hours:
+            parts.append(f"{hours}H")
+        if minutes:
+            parts.append(f"{minutes}M")
+        if seconds or micros:
+            fraction = f".{micros:06d}".rstrip("0") if micros else ""
+            parts.append(f"{seconds}{fraction}S")
+    elif len(parts) == 2:
+        parts.append("T0S")
+    return "".join(parts)
+
+
+def orjson_default(obj: Any) -> Any:
+    """Serialize driver values orjson does not handle natively.
+
+    Streamed bodies cannot report an error once the first chunk is sent, so
+    unknown types fall back to str() instead of raising.
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, (bytes, bytearray)):
+        return obj.decode("utf-8", errors="replace")
+    if isinstance(obj, timedelta):
+        # INTERVAL DAY TO SECOND
+        return _iso_duration(obj)
+    if isinstance(obj, tuple):
+        # INTERVAL YEAR TO MONTH comes back as oracledb.IntervalYM, a named
+        # tuple orjson rejects; Pydantic rendered it as [years, months]
+        return list(obj)
+    return str(obj)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Routes can return this directly with a plain dict payload to skip
+    Pydantic response-model validation on large result sets.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=orjson_default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+
+
+def etag_response(content: Any, if_none_match: Optional[str] = None) -> Response:
+    """Render content with an ETag, or answer 304 when the client copy matches.
+
+    The tag is a hash of the rendered body, so it only changes when the payload
+    does. Meant for metadata endpoints whose results are already TTL-cached.
+    """
+    if isinstance(content, BaseModel):
+        content = content.model_dump(by_alias=True)
+    response = ORJSONResponse(content)
+    etag = '"' + hashlib.blake2b(response.body, digest_size=16).hexdigest() + '"'
+    if etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Whether an If-None-Match header value covers the given (quoted) ETag."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
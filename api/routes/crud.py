@@ -1,8 +1,11 @@
-
 """CRUD operation routes - create, read, update, delete rows."""
 
+import re
+
+import orjson
 from fastapi import APIRouter, HTTPException
-from typing import Any, Dict
+from fastapi.responses import StreamingResponse
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from api.models import (
     APIResponse,
@@ -10,310 +13,263 @@ from api.models import (
     ReadRowsRequest,
     UpdateRowsRequest,
     DeleteRowsRequest,
-    SQLResultResponse,
 )
-from api.dependencies import MultiDBContextDep, get_database_context
-from db_context.schema.formatter import format_sql_query_result
+from api.dependencies import DatabaseContextDep
+from api.responses import orjson_default
+from api.sql_cache import build_sql
+from db_context import LOB_TYPES
+from db_context.utils import parse_object_name
 
 router = APIRouter(prefix="/crud", tags=["CRUD Operations"])
 
 
-@router.post("/{database_name}/create", response_model=APIResponse)
-async def create_row(
-    database_name: str,
-    request: CreateRowRequest,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Insert a new row into a table.
-    
-    Creates a single row with the provided column-value pairs.
-    Requires write mode to be enabled for the database.
-    """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    columns = ', '.join(request.data.keys())
-    placeholders = ', '.join(f":{k}" for k in request.data.keys())
-    sql = f"INSERT INTO {request.table_name} ({columns}) VALUES ({placeholders})"
-    
-    try:
-        result = await db_context.run_sql_query(sql, params=request.data)
-        return APIResponse(
-            success=True,
-            message=f"Inserted row into '{request.table_name}' in '{database_name}'. {result.get('message', '')}",
-            data={"row_count": result.get("row_count", 1)}
-        )
-    except PermissionError as e:
-        raise HTTPException(status_code=403, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error inserting row: {str(e)}")
+# Identifiers that can be written into SQL text without quotes
+_PLAIN_IDENTIFIER_RE = re.compile(r"[A-Z][A-Z0-9_$#]*")
 
+# Oracle SQL reserved words; columns named like these (e.g. DATE) must be quoted
+_RESERVED_WORDS = frozenset("""
+    ACCESS ADD ALL ALTER AND ANY AS ASC AUDIT BETWEEN BY CHAR CHECK CLUSTER
+    COLUMN COLUMN_VALUE COMMENT COMPRESS CONNECT CREATE CURRENT DATE DECIMAL
+    DEFAULT DELETE DESC DISTINCT DROP ELSE EXCLUSIVE EXISTS FILE FLOAT FOR FROM
+    GRANT GROUP HAVING IDENTIFIED IMMEDIATE IN INCREMENT INDEX INITIAL INSERT
+    INTEGER INTERSECT INTO IS LEVEL LIKE LOCK LONG MAXEXTENTS MINUS MLSLABEL
+    MODE MODIFY NESTED_TABLE_ID NOAUDIT NOCOMPRESS NOT NOWAIT NULL NUMBER OF
+    OFFLINE ON ONLINE OPTION OR ORDER PCTFREE PRIOR PUBLIC RAW RENAME RESOURCE
+    REVOKE ROW ROWID ROWNUM ROWS SELECT SESSION SET SHARE SIZE SMALLINT START
+    SUCCESSFUL SYNONYM SYSDATE TABLE THEN TO TRIGGER UID UNION UNIQUE UPDATE
+    USER VALIDATE VALUES VARCHAR VARCHAR2 VIEW WHENEVER WHERE WITH
+""".split())
 
-@router.post("/{database_name}/read", response_model=APIResponse)
-async def read_rows(
-    database_name: str,
-    request: ReadRowsRequest,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Read rows from a table with optional filters.
-    
-    Returns matching rows based on the provided filter conditions.
-    """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    where = ''
-    params: Dict[str, Any] = {}
-    if request.filters:
-        where = ' WHERE ' + ' AND '.join(f"{k} = :{k}" for k in request.filters.keys())
-        params = request.filters
+
+def _sql_identifier(name: str) -> str:
+    """Quote a canonical identifier unless Oracle would read it back unquoted."""
+    if _PLAIN_IDENTIFIER_RE.fullmatch(name) and name not in _RESERVED_WORDS:
+        return name
+    return f'"{name}"'
+
+
+def _sql_identifiers(names: Iterable[str]) -> Tuple[str, ...]:
+    """Write canonical column names as SQL identifiers, keeping their order."""
+    return tuple(_sql_identifier(name) for name in names)
+
+
+def _binds(values: Dict[str, Any], columns: Iterable[str], prefix: str) -> Dict[str, Any]:
+    """Key values by positional bind name (prefix + index) in column order."""
+    return {f"{prefix}{i}": values[col] for i, col in enumerate(columns)}
+
+
+async def _resolve_table(db_context, table_name: str) -> Tuple[str, Optional[str], Dict[str, str]]:
+    """Canonicalize an [owner.]table name against the database.
     
-    sql = f"SELECT * FROM {request.table_name}{where}"
+    Unquoted parts are upper-cased and "quoted" parts kept as written. Tables
+    of the own schema come from the schema cache; views and other schemas'
+    objects are looked up in the data dictionary. Identifiers are interpolated
+    into SQL text, so only names the database knows are allowed; this also
+    keeps one statement text per table regardless of input casing.
     
-    try:
-        result = await db_context.run_sql_query(sql, params=params, max_rows=request.max_rows)
-        
-        if not result.get("rows"):
-            return APIResponse(
-                success=True,
-                message=f"No rows found in '{request.table_name}' in '{database_name}'.",
-                data=SQLResultResponse(columns=result.get("columns", []), rows=[], row_count=0)
-            )
-        
-        return APIResponse(
-            success=True,
-            data=SQLResultResponse(
-                columns=result.get("columns", []),
-                rows=result.get("rows", []),
-                row_count=len(result.get("rows", []))
-            )
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error reading rows: {str(e)}")
+    Returns the name as written into SQL, the schema cache key (None when the
+    object is not in the cache) and a column name to data type mapping.
+    """
+    parsed = parse_object_name(table_name)
+    if parsed is None:
+        raise HTTPException(status_code=400, detail=f"Invalid table name '{table_name}'")
+    owner, name = parsed
+    
+    cache_key = None
+    # The cache upper-cases lookups, so quoted mixed-case names skip it
+    if owner is None and name == name.upper():
+        table_info = await db_context.get_schema_info(name)
+        if table_info is not None:
+            cache_key, columns = name, table_info.columns
+    if cache_key is None:
+        columns = await db_context.get_object_columns(name, owner)
+        if not columns:
+            raise HTTPException(status_code=400, detail=f"Unknown table '{table_name}'")
+    
+    sql_name = _sql_identifier(name) if owner is None else f"{_sql_identifier(owner)}.{_sql_identifier(name)}"
+    return sql_name, cache_key, {col["name"]: col.get("type") for col in columns}
 
 
-@router.post("/{database_name}/update", response_model=APIResponse)
-async def update_rows(
-    database_name: str,
-    request: UpdateRowsRequest,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Update rows in a table matching filters.
+def _resolve_columns(names: Iterable[str], known: Dict[str, str], table_name: str) -> List[str]:
+    """Canonicalize column names and reject any not present in the table.
     
-    Updates matching rows with the provided column-value pairs.
-    Requires write mode to be enabled for the database.
+    Names resolve case-insensitively to upper-case columns; columns created
+    with quoted names (mixed case, spaces) are matched exactly instead.
     """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    set_clause = ', '.join(f"{k} = :set_{k}" for k in request.updates.keys())
-    params = {f"set_{k}": v for k, v in request.updates.items()}
-    
-    where = ''
-    if request.filters:
-        where = ' WHERE ' + ' AND '.join(f"{k} = :where_{k}" for k in request.filters.keys())
-        params.update({f"where_{k}": v for k, v in request.filters.items()})
-    
-    sql = f"UPDATE {request.table_name} SET {set_clause}{where}"
-    
-    try:
-        result = await db_context.run_sql_query(sql, params=params)
-        return APIResponse(
-            success=True,
-            message=f"Updated rows in '{request.table_name}' in '{database_name}'. {result.get('message', '')}",
-            data={"row_count": result.get("row_count", 0)}
-        )
-    except PermissionError as e:
-        raise HTTPException(status_code=403, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error updating rows: {str(e)}")
+    columns = [name.upper() if name.upper() in known else name for name in names]
+    unknown = [col for col in columns if col not in known]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown columns for '{table_name}': {', '.join(unknown)}")
+    return columns
 
 
-@router.post("/{database_name}/delete", response_model=APIResponse)
-async def delete_rows(
-    database_name: str,
-    request: DeleteRowsRequest,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Delete rows from a table matching filters.
+def _resolve_values(values: Dict[str, Any], known: Dict[str, str], table_name: str) -> Dict[str, Any]:
+    """Re-key a column-value payload by canonical column name.
     
-    Deletes matching rows based on the provided filter conditions.
-    Requires write mode to be enabled for the database.
+    Keys that differ only in case name the same column; rather than letting one
+    value silently win, such payloads are rejected.
     """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    where = ''
-    params: Dict[str, Any] = {}
-    if request.filters:
-        where = ' WHERE ' + ' AND '.join(f"{k} = :{k}" for k in request.filters.keys())
-        params = request.filters
-    
-    sql = f"DELETE FROM {request.table_name}{where}"
-    
-    try:
-        result = await db_context.run_sql_query(sql, params=params)
-        return APIResponse(
-            success=True,
-            message=f"Deleted rows from '{request.table_name}' in '{database_name}'. {result.get('message', '')}",
-            data={"row_count": result.get("row_count", 0)}
-        )
-    except PermissionError as e:
-        raise HTTPException(status_code=403, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error deleting rows: {str(e)}")
-"""CRUD operation routes - create, read, update, delete rows."""
+    columns = _resolve_columns(values, known, table_name)
+    if len(set(columns)) < len(columns):
+        duplicates = sorted({col for col in columns if columns.count(col) > 1})
+        raise HTTPException(status_code=400, detail=f"Duplicate columns for '{table_name}': {', '.join(duplicates)}")
+    return dict(zip(columns, values.values()))
 
-from fastapi import APIRouter, HTTPException
-from typing import Any, Dict
-
-from api.models import (
-    APIResponse,
-    CreateRowRequest,
-    ReadRowsRequest,
-    UpdateRowsRequest,
-    DeleteRowsRequest,
-    SQLResultResponse,
-)
-from api.dependencies import MultiDBContextDep, get_database_context
-from db_context.schema.formatter import format_sql_query_result
 
-router = APIRouter(prefix="/crud", tags=["CRUD Operations"])
+async def _covers_key(db_context, table_name: str, filter_columns: Iterable[str]) -> bool:
+    """Whether the filter columns include every column of a PK or UNIQUE constraint."""
+    filter_columns = set(filter_columns)
+    for constraint in await db_context.get_table_constraints(table_name) or []:
+        if constraint.get("type") in ("PRIMARY KEY", "UNIQUE"):
+            key = constraint.get("columns") or []
+            if key and filter_columns.issuperset(key):
+                return True
+    return False
 
 
 @router.post("/{database_name}/create", response_model=APIResponse)
 async def create_row(
     database_name: str,
     request: CreateRowRequest,
-    multi_ctx: MultiDBContextDep,
+    db_context: DatabaseContextDep,
 ) -> APIResponse:
     """Insert a new row into a table.
     
     Creates a single row with the provided column-value pairs.
     Requires write mode to be enabled for the database.
     """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    columns = ', '.join(request.data.keys())
-    placeholders = ', '.join(f":{k}" for k in request.data.keys())
-    sql = f"INSERT INTO {request.table_name} ({columns}) VALUES ({placeholders})"
-    
-    try:
-        result = await db_context.run_sql_query(sql, params=request.data)
-        return APIResponse(
-            success=True,
-            message=f"Inserted row into '{request.table_name}' in '{database_name}'. {result.get('message', '')}",
-            data={"row_count": result.get("row_count", 1)}
-        )
-    except PermissionError as e:
-        raise HTTPException(status_code=403, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error inserting row: {str(e)}")
+    table, cache_key, known = await _resolve_table(db_context, request.table_name)
+    data = _resolve_values(request.data, known, request.table_name)
+    columns = sorted(data)
+    sql = build_sql("insert", table, _sql_identifiers(columns), ())
+    
+    result = await db_context.run_sql_query(sql, params=_binds(data, columns, "c"))
+    return APIResponse(
+        success=True,
+        message=f"Inserted row into '{request.table_name}' in '{database_name}'. {result.get('message', '')}",
+        data={"row_count": result.get("row_count", 1)}
+    )
 
 
 @router.post("/{database_name}/read", response_model=APIResponse)
 async def read_rows(
     database_name: str,
     request: ReadRowsRequest,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
+    db_context: DatabaseContextDep,
+) -> Union[APIResponse, StreamingResponse]:
     """Read rows from a table with optional filters.
     
     Returns matching rows based on the provided filter conditions.
+    Rows are streamed from the server cursor as they are fetched.
+    Only the requested columns are fetched; by default LOB columns are left out.
+    With sample_percent set, rows come from an approximate block sample.
+    With exists_only set, returns {"exists": bool} from a single-row key lookup.
     """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    where = ''
-    params: Dict[str, Any] = {}
-    if request.filters:
-        where = ' WHERE ' + ' AND '.join(f"{k} = :{k}" for k in request.filters.keys())
-        params = request.filters
-    
-    sql = f"SELECT * FROM {request.table_name}{where}"
-    
-    try:
-        result = await db_context.run_sql_query(sql, params=params, max_rows=request.max_rows)
-        
-        if not result.get("rows"):
-            return APIResponse(
-                success=True,
-                message=f"No rows found in '{request.table_name}' in '{database_name}'.",
-                data=SQLResultResponse(columns=result.get("columns", []), rows=[], row_count=0)
-            )
-        
-        return APIResponse(
-            success=True,
-            data=SQLResultResponse(
-                columns=result.get("columns", []),
-                rows=result.get("rows", []),
-                row_count=len(result.get("rows", []))
+    table, cache_key, known = await _resolve_table(db_context, request.table_name)
+    
+    if request.exists_only:
+        filters = _resolve_values(request.filters or {}, known, request.table_name)
+        # Only key lookups: an existence check must not turn into a full scan.
+        # Keys are known for cached tables only; views have none.
+        if cache_key is None or not await _covers_key(db_context, cache_key, filters):
+            raise HTTPException(
+                status_code=400,
+                detail=f"exists_only requires filters covering a primary or unique key of '{request.table_name}'"
             )
+        filter_columns = sorted(filters)
+        sql = build_sql("exists", table, (), _sql_identifiers(filter_columns))
+        result = await db_context.run_sql_query(
+            sql, params=_binds(filters, filter_columns, "where_"), max_rows=1
         )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error reading rows: {str(e)}")
+        return APIResponse(success=True, data={"exists": bool(result.get("rows"))})
+    
+    if request.columns:
+        columns = _resolve_columns(request.columns, known, request.table_name)
+    else:
+        columns = [col for col, data_type in known.items() if data_type not in LOB_TYPES]
+    
+    filters = _resolve_values(request.filters or {}, known, request.table_name)
+    filter_columns = sorted(filters)
+    sql = build_sql(
+        "select", table, _sql_identifiers(columns), _sql_identifiers(filter_columns), request.sample_percent
+    )
+    
+    stream = db_context.stream_sql_query(
+        sql,
+        params=_binds(filters, filter_columns, "where_"),
+        max_rows=request.max_rows,
+        batch_size=min(request.max_rows, 1000),
+    )
+    # Execute the statement before the response starts so errors map to HTTP codes
+    result_columns = await stream.__anext__()
+    
+    no_rows_message = f"No rows found in '{request.table_name}' in '{database_name}'."
+    
+    async def json_body():
+        # Same document as an APIResponse wrapping SQLResultResponse, written
+        # batch by batch so only one fetch is held in memory
+        row_count = 0
+        try:
+            yield b'{"success":true,"data":{"columns":' + orjson.dumps(result_columns) + b',"rows":['
+            async for batch in stream:
+                chunk = b",".join(orjson.dumps(row, default=orjson_default) for row in batch)
+                yield chunk if row_count == 0 else b"," + chunk
+                row_count += len(batch)
+            message = orjson.dumps(no_rows_message if row_count == 0 else None)
+            yield b'],"row_count":' + str(row_count).encode() + b',"message":null},"message":' + message + b',"error":null}'
+        finally:
+            await stream.aclose()
+    
+    return StreamingResponse(json_body(), media_type="application/json")
 
 
 @router.post("/{database_name}/update", response_model=APIResponse)
 async def update_rows(
     database_name: str,
     request: UpdateRowsRequest,
-    multi_ctx: MultiDBContextDep,
+    db_context: DatabaseContextDep,
 ) -> APIResponse:
     """Update rows in a table matching filters.
     
     Updates matching rows with the provided column-value pairs.
     Requires write mode to be enabled for the database.
     """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    set_clause = ', '.join(f"{k} = :set_{k}" for k in request.updates.keys())
-    params = {f"set_{k}": v for k, v in request.updates.items()}
-    
-    where = ''
-    if request.filters:
-        where = ' WHERE ' + ' AND '.join(f"{k} = :where_{k}" for k in request.filters.keys())
-        params.update({f"where_{k}": v for k, v in request.filters.items()})
-    
-    sql = f"UPDATE {request.table_name} SET {set_clause}{where}"
-    
-    try:
-        result = await db_context.run_sql_query(sql, params=params)
-        return APIResponse(
-            success=True,
-            message=f"Updated rows in '{request.table_name}' in '{database_name}'. {result.get('message', '')}",
-            data={"row_count": result.get("row_count", 0)}
-        )
-    except PermissionError as e:
-        raise HTTPException(status_code=403, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error updating rows: {str(e)}")
+    table, cache_key, known = await _resolve_table(db_context, request.table_name)
+    updates = _resolve_values(request.updates, known, request.table_name)
+    filters = _resolve_values(request.filters or {}, known, request.table_name)
+    update_columns, filter_columns = sorted(updates), sorted(filters)
+    params = _binds(updates, update_columns, "c")
+    params.update(_binds(filters, filter_columns, "where_"))
+    
+    sql = build_sql("update", table, _sql_identifiers(update_columns), _sql_identifiers(filter_columns))
+    
+    result = await db_context.run_sql_query(sql, params=params)
+    return APIResponse(
+        success=True,
+        message=f"Updated rows in '{request.table_name}' in '{database_name}'. {result.get('message', '')}",
+        data={"row_count": result.get("row_count", 0)}
+    )
 
 
 @router.post("/{database_name}/delete", response_model=APIResponse)
 async def delete_rows(
     database_name: str,
     request: DeleteRowsRequest,
-    multi_ctx: MultiDBContextDep,
+    db_context: DatabaseContextDep,
 ) -> APIResponse:
     """Delete rows from a table matching filters.
     
     Deletes matching rows based on the provided filter conditions.
     Requires write mode to be enabled for the database.
     """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    where = ''
-    params: Dict[str, Any] = {}
-    if request.filters:
-        where = ' WHERE ' + ' AND '.join(f"{k} = :{k}" for k in request.filters.keys())
-        params = request.filters
-    
-    sql = f"DELETE FROM {request.table_name}{where}"
-    
-    try:
-        result = await db_context.run_sql_query(sql, params=params)
-        return APIResponse(
-            success=True,
-            message=f"Deleted rows from '{request.table_name}' in '{database_name}'. {result.get('message', '')}",
-            data={"row_count": result.get("row_count", 0)}
-        )
-    except PermissionError as e:
-        raise HTTPException(status_code=403, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error deleting rows: {str(e)}")
+    table, cache_key, known = await _resolve_table(db_context, request.table_name)
+    filters = _resolve_values(request.filters or {}, known, request.table_name)
+    filter_columns = sorted(filters)
+    sql = build_sql("delete", table, (), _sql_identifiers(filter_columns))
+    
+    result = await db_context.run_sql_query(sql, params=_binds(filters, filter_columns, "where_"))
+    return APIResponse(
+        success=True,
+        message=f"Deleted rows from '{request.table_name}' in '{database_name}'. {result.get('message', '')}",
+        data={"row_count": result.get("row_count", 0)}
+    )
@@ -1,349 +1,203 @@
-
 """Table metadata routes - constraints, indexes, relationships, dependencies."""
 
-from fastapi import APIRouter, HTTPException
+from typing import Annotated, Any, Dict, List, Optional
+from fastapi import APIRouter, Header, Response
 
 from api.models import (
     APIResponse,
     ConstraintInfo,
     IndexInfo,
     RelatedTablesResponse,
+    TableMetadataResponse,
 )
-from api.dependencies import MultiDBContextDep, get_database_context
+from api.dependencies import DatabaseContextDep
+from api.responses import etag_response
 
 router = APIRouter(prefix="/metadata", tags=["Table Metadata"])
 
 
-@router.get("/{database_name}/constraints/{table_name}", response_model=APIResponse)
-async def get_table_constraints(
-    database_name: str,
-    table_name: str,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Get constraints for a table.
-    
-    Returns PK, FK, UNIQUE, and CHECK constraints.
-    Results are cached with TTL for performance.
-    """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    try:
-        constraints = await db_context.get_table_constraints(table_name)
-        
-        if not constraints:
-            return APIResponse(
-                success=True,
-                message=f"No constraints found for table '{table_name}'",
-                data={"constraints": [], "table_name": table_name}
-            )
-        
-        constraint_list = [
-            ConstraintInfo(
-                name=c.get("name", "UNNAMED"),
-                type=c.get("type", "UNKNOWN"),
-                columns=c.get("columns", []),
-                references=c.get("references"),
-                condition=c.get("condition"),
-            )
-            for c in constraints
-        ]
-        
-        return APIResponse(
-            success=True,
-            data={
-                "constraints": constraint_list,
-                "table_name": table_name,
-                "count": len(constraint_list)
-            }
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error retrieving constraints: {str(e)}")
+# Data-dictionary rows are trusted; model_construct skips re-validation
 
-
-@router.get("/{database_name}/indexes/{table_name}", response_model=APIResponse)
-async def get_table_indexes(
-    database_name: str,
-    table_name: str,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Get indexes for a table.
-    
-    Returns index names, columns, uniqueness, and status.
-    Results are cached with TTL for performance.
-    """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    try:
-        indexes = await db_context.get_table_indexes(table_name)
-        
-        if not indexes:
-            return APIResponse(
-                success=True,
-                message=f"No indexes found for table '{table_name}'",
-                data={"indexes": [], "table_name": table_name}
-            )
-        
-        index_list = [
-            IndexInfo(
-                name=idx.get("name", "UNNAMED"),
-                columns=idx.get("columns", []),
-                unique=idx.get("unique", False),
-                tablespace=idx.get("tablespace"),
-                status=idx.get("status"),
-            )
-            for idx in indexes
-        ]
-        
-        return APIResponse(
-            success=True,
-            data={
-                "indexes": index_list,
-                "table_name": table_name,
-                "count": len(index_list)
-            }
+def _constraint_list(constraints: List[Dict[str, Any]]) -> List[ConstraintInfo]:
+    return [
+        ConstraintInfo.model_construct(
+            name=c.get("name", "UNNAMED"),
+            type=c.get("type", "UNKNOWN"),
+            columns=c.get("columns", []),
+            references=c.get("references"),
+            condition=c.get("condition"),
+        )
+        for c in constraints
+    ]
+
+
+def _index_list(indexes: List[Dict[str, Any]]) -> List[IndexInfo]:
+    return [
+        IndexInfo.model_construct(
+            name=idx.get("name", "UNNAMED"),
+            columns=idx.get("columns", []),
+            unique=idx.get("unique", False),
+            tablespace=idx.get("tablespace"),
+            status=idx.get("status"),
         )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error retrieving indexes: {str(e)}")
+        for idx in indexes
+    ]
 
 
-@router.get("/{database_name}/related/{table_name}", response_model=APIResponse)
-async def get_related_tables(
-    database_name: str,
+@router.get("/{database_name}/all/{table_name}", response_model=APIResponse)
+async def get_table_all_metadata(
     table_name: str,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Get tables related by foreign keys.
-    
-    Returns tables referenced by this table (outgoing FK) and
-    tables that reference this table (incoming FK).
+    db_context: DatabaseContextDep,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
+    """Get constraints, indexes and related tables in one call.
+    
+    Replaces three round trips to /constraints, /indexes and /related.
+    The three lookups run concurrently and share the per-endpoint TTL caches.
+    Carries an ETag; a matching If-None-Match header gets 304 Not Modified.
     """
-    db_context = get_database_context(database_name, multi_ctx)
+    metadata = await db_context.get_table_all_metadata(table_name)
+    related = metadata["related"]
     
-    try:
-        related = await db_context.get_related_tables(table_name)
-        
-        response_data = RelatedTablesResponse(
+    return etag_response(APIResponse(
+        success=True,
+        data=TableMetadataResponse(
             table_name=table_name,
+            constraints=_constraint_list(metadata["constraints"] or []),
+            indexes=_index_list(metadata["indexes"] or []),
             referenced_tables=related.get("referenced_tables", []),
             referencing_tables=related.get("referencing_tables", []),
         )
-        
-        if not response_data.referenced_tables and not response_data.referencing_tables:
-            return APIResponse(
-                success=True,
-                message=f"No related tables found for '{table_name}'",
-                data=response_data
-            )
-        
-        return APIResponse(success=True, data=response_data)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error getting related tables: {str(e)}")
-
-
-@router.get("/{database_name}/dependencies/{object_name}", response_model=APIResponse)
-async def get_dependent_objects(
-    database_name: str,
-    object_name: str,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Get objects that depend on a table or object.
-    
-    Returns views, PL/SQL objects, and triggers that reference the specified object.
-    Useful for impact analysis before making changes.
-    """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    try:
-        dependencies = await db_context.get_dependent_objects(object_name.upper())
-        
-        if not dependencies:
-            return APIResponse(
-                success=True,
-                message=f"No objects found that depend on '{object_name}'",
-                data={"dependencies": [], "object_name": object_name}
-            )
-        
-        return APIResponse(
-            success=True,
-            data={
-                "dependencies": dependencies,
-                "object_name": object_name,
-                "count": len(dependencies)
-            }
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error retrieving dependencies: {str(e)}")
-"""Table metadata routes - constraints, indexes, relationships, dependencies."""
-
-from fastapi import APIRouter, HTTPException
-
-from api.models import (
-    APIResponse,
-    ConstraintInfo,
-    IndexInfo,
-    RelatedTablesResponse,
-)
-from api.dependencies import MultiDBContextDep, get_database_context
-
-router = APIRouter(prefix="/metadata", tags=["Table Metadata"])
+    ), if_none_match)
 
 
-@router.get("/{database_name}/constraints/{table_name}", response_model=APIResponse)
+@router.get("/{database_name}/constraints/{table_name}", response_model=APIResponse, deprecated=True)
 async def get_table_constraints(
     database_name: str,
     table_name: str,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
+    db_context: DatabaseContextDep,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
     """Get constraints for a table.
     
     Returns PK, FK, UNIQUE, and CHECK constraints.
-    Results are cached with TTL for performance.
+    Results are cached with TTL for performance and carry an ETag;
+    a matching If-None-Match header gets 304 Not Modified.
+    Deprecated: use /metadata/{database_name}/all/{table_name}.
     """
-    db_context = get_database_context(database_name, multi_ctx)
+    constraints = await db_context.get_table_constraints(table_name)
     
-    try:
-        constraints = await db_context.get_table_constraints(table_name)
-        
-        if not constraints:
-            return APIResponse(
-                success=True,
-                message=f"No constraints found for table '{table_name}'",
-                data={"constraints": [], "table_name": table_name}
-            )
-        
-        constraint_list = [
-            ConstraintInfo(
-                name=c.get("name", "UNNAMED"),
-                type=c.get("type", "UNKNOWN"),
-                columns=c.get("columns", []),
-                references=c.get("references"),
-                condition=c.get("condition"),
-            )
-            for c in constraints
-        ]
-        
-        return APIResponse(
+    if not constraints:
+        return etag_response(APIResponse(
             success=True,
-            data={
-                "constraints": constraint_list,
-                "table_name": table_name,
-                "count": len(constraint_list)
-            }
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error retrieving constraints: {str(e)}")
+            message=f"No constraints found for table '{table_name}'",
+            data={"constraints": [], "table_name": table_name}
+        ), if_none_match)
+    
+    constraint_list = _constraint_list(constraints)
+    
+    return etag_response(APIResponse(
+        success=True,
+        data={
+            "constraints": constraint_list,
+            "table_name": table_name,
+            "count": len(constraint_list)
+        }
+    ), if_none_match)
 
 
-@router.get("/{database_name}/indexes/{table_name}", response_model=APIResponse)
+@router.get("/{database_name}/indexes/{table_name}", response_model=APIResponse, deprecated=True)
 async def get_table_indexes(
     database_name: str,
     table_name: str,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
+    db_context: DatabaseContextDep,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
     """Get indexes for a table.
     
     Returns index names, columns, uniqueness, and status.
-    Results are cached with TTL for performance.
+    Results are cached with TTL for performance and carry an ETag;
+    a matching If-None-Match header gets 304 Not Modified.
+    Deprecated: use /metadata/{database_name}/all/{table_name}.
     """
-    db_context = get_database_context(database_name, multi_ctx)
+    indexes = await db_context.get_table_indexes(table_name)
     
-    try:
-        indexes = await db_context.get_table_indexes(table_name)
-        
-        if not indexes:
-            return APIResponse(
-                success=True,
-                message=f"No indexes found for table '{table_name}'",
-                data={"indexes": [], "table_name": table_name}
-            )
-        
-        index_list = [
-            IndexInfo(
-                name=idx.get("name", "UNNAMED"),
-                columns=idx.get("columns", []),
-                unique=idx.get("unique", False),
-                tablespace=idx.get("tablespace"),
-                status=idx.get("status"),
-            )
-            for idx in indexes
-        ]
-        
-        return APIResponse(
+    if not indexes:
+        return etag_response(APIResponse(
             success=True,
-            data={
-                "indexes": index_list,
-                "table_name": table_name,
-                "count": len(index_list)
-            }
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error retrieving indexes: {str(e)}")
+            message=f"No indexes found for table '{table_name}'",
+            data={"indexes": [], "table_name": table_name}
+        ), if_none_match)
+    
+    index_list = _index_list(indexes)
+    
+    return etag_response(APIResponse(
+        success=True,
+        data={
+            "indexes": index_list,
+            "table_name": table_name,
+            "count": len(index_list)
+        }
+    ), if_none_match)
 
 
-@router.get("/{database_name}/related/{table_name}", response_model=APIResponse)
+@router.get("/{database_name}/related/{table_name}", response_model=APIResponse, deprecated=True)
 async def get_related_tables(
     database_name: str,
     table_name: str,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
+    db_context: DatabaseContextDep,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
     """Get tables related by foreign keys.
     
     Returns tables referenced by this table (outgoing FK) and
     tables that reference this table (incoming FK).
+    Deprecated: use /metadata/{database_name}/all/{table_name}.
     """
-    db_context = get_database_context(database_name, multi_ctx)
+    related = await db_context.get_related_tables(table_name)
     
-    try:
-        related = await db_context.get_related_tables(table_name)
-        
-        response_data = RelatedTablesResponse(
-            table_name=table_name,
-            referenced_tables=related.get("referenced_tables", []),
-            referencing_tables=related.get("referencing_tables", []),
-        )
-        
-        if not response_data.referenced_tables and not response_data.referencing_tables:
-            return APIResponse(
-                success=True,
-                message=f"No related tables found for '{table_name}'",
-                data=response_data
-            )
-        
-        return APIResponse(success=True, data=response_data)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error getting related tables: {str(e)}")
+    response_data = RelatedTablesResponse(
+        table_name=table_name,
+        referenced_tables=related.get("referenced_tables", []),
+        referencing_tables=related.get("referencing_tables", []),
+    )
+    
+    if not response_data.referenced_tables and not response_data.referencing_tables:
+        return etag_response(APIResponse(
+            success=True,
+            message=f"No related tables found for '{table_name}'",
+            data=response_data
+        ), if_none_match)
+    
+    return etag_response(APIResponse(success=True, data=response_data), if_none_match)
 
 
 @router.get("/{database_name}/dependencies/{object_name}", response_model=APIResponse)
 async def get_dependent_objects(
-    database_name: str,
     object_name: str,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
+    db_context: DatabaseContextDep,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
     """Get objects that depend on a table or object.
     
     Returns views, PL/SQL objects, and triggers that reference the specified object.
     Useful for impact analysis before making changes.
+    Results are cached with TTL and carry an ETag for conditional requests.
     """
-    db_context = get_database_context(database_name, multi_ctx)
+    dependencies = await db_context.get_dependent_objects(object_name.upper())
     
-    try:
-        dependencies = await db_context.get_dependent_objects(object_name.upper())
-        
-        if not dependencies:
-            return APIResponse(
-                success=True,
-                message=f"No objects found that depend on '{object_name}'",
-                data={"dependencies": [], "object_name": object_name}
-            )
-        
-        return APIResponse(
+    if not dependencies:
+        return etag_response(APIResponse(
             success=True,
-            data={
-                "dependencies": dependencies,
-                "object_name": object_name,
-                "count": len(dependencies)
-            }
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error retrieving dependencies: {str(e)}")
+            message=f"No objects found that depend on '{object_name}'",
+            data={"dependencies": [], "object_name": object_name}
+        ), if_none_match)
+    
+    return etag_response(APIResponse(
+        success=True,
+        data={
+            "dependencies": dependencies,
+            "object_name": object_name,
+            "count": len(dependencies)
+        }
+    ), if_none_match)
@@ -1,8 +1,13 @@
-
 """Schema discovery routes - table schemas, search, cache management."""
 
+import hashlib
 import time
-from fastapi import APIRouter, HTTPException
+from collections import OrderedDict
+from typing import Annotated, Optional, Tuple, Union
+
+import orjson
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
 from api.models import (
     APIResponse,
@@ -12,17 +17,50 @@ from api.models import (
     SearchColumnsRequest,
     RebuildCacheRequest,
     ColumnInfo,
+    ConstraintInfo,
+    IndexInfo,
     TableSchemaResponse,
 )
-from api.dependencies import MultiDBContextDep, get_database_context
+from api.dependencies import DatabaseContextDep
+from api.responses import ORJSONResponse, etag_matches, orjson_default
+from db_context.models import TableInfo
+from db_context.utils import split_search_terms
 
 router = APIRouter(prefix="/schema", tags=["Schema Discovery"])
 
-
-def table_info_to_response(table_info) -> TableSchemaResponse:
-    """Convert TableInfo to TableSchemaResponse."""
+# Rendered single-table schema responses as (ETag, body), LRU keyed by
+# (database, table, schema cache version)
+_SCHEMA_BODY_CACHE: "OrderedDict[Tuple[str, str, str], Tuple[str, bytes]]" = OrderedDict()
+_SCHEMA_BODY_CACHE_SIZE = 256
+
+# Converted TableSchemaResponse per TableInfo instance. Loaded TableInfo objects
+# are replaced rather than mutated on rebuild, so identity is the cache key;
+# the entry keeps its TableInfo alive so the id cannot be reused meanwhile.
+_RESPONSE_CACHE: "OrderedDict[int, Tuple[TableInfo, TableSchemaResponse]]" = OrderedDict()
+_RESPONSE_CACHE_SIZE = 1024
+
+
+def table_info_to_response(table_info: TableInfo) -> TableSchemaResponse:
+    """Convert TableInfo to TableSchemaResponse, reusing the previous conversion."""
+    entry = _RESPONSE_CACHE.get(id(table_info))
+    if entry is not None and entry[0] is table_info:
+        _RESPONSE_CACHE.move_to_end(id(table_info))
+        return entry[1]
+    
+    response = _build_table_schema_response(table_info)
+    # Built synchronously, so concurrent requests cannot interleave here
+    if table_info.fully_loaded:
+        _RESPONSE_CACHE[id(table_info)] = (table_info, response)
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+    return response
+
+
+def _build_table_schema_response(table_info: TableInfo) -> TableSchemaResponse:
+    # TableInfo comes from the data dictionary via the schema cache and is
+    # trusted, so the models are built without re-validation
     columns = [
-        ColumnInfo(
+        ColumnInfo.model_construct(
             name=col.get("name", ""),
             type=col.get("type", ""),
             nullable=col.get("nullable", True),
@@ -33,13 +71,15 @@ def table_info_to_response(table_info) -> TableSchemaResponse:
         )
         for col in table_info.columns
     ]
+    constraints = table_info.constraints
+    indexes = table_info.indexes
     
-    return TableSchemaResponse(
+    return TableSchemaResponse.model_construct(
         table_name=table_info.table_name,
         columns=columns,
-        relationships=table_info.relationships or {},
-        constraints=table_info.constraints,
-        indexes=table_info.indexes,
+        relationships=table_info.relationships,
+        constraints=None if constraints is None else [ConstraintInfo.model_construct(**c) for c in constraints],
+        indexes=None if indexes is None else [IndexInfo.model_construct(**idx) for idx in indexes],
         table_stats=table_info.table_stats,
         comments=table_info.comments,
     )
@@ -49,47 +89,65 @@ def table_info_to_response(table_info) -> TableSchemaResponse:
 async def get_table_schema(
     database_name: str,
     table_name: str,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
+    db_context: DatabaseContextDep,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
     """Get schema for a single table.
     
     Returns columns, relationships, and cached metadata for the specified table.
     Lazy loads and caches the schema on first access.
+    The response carries an ETag that changes when the schema cache is rebuilt;
+    a matching If-None-Match header gets 304 Not Modified.
     """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    table_info = await db_context.get_schema_info(table_name)
-    
-    if not table_info:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Table '{table_name}' not found in database '{database_name}'"
-        )
+    # A loaded TableInfo does not change until the cache is rebuilt, so the
+    # cache version identifies the response; repeat reads skip the schema
+    # manager entirely. Cached table names are upper-case.
+    key = (database_name, table_name.upper(), db_context.schema_manager.cache_version)
+    entry = _SCHEMA_BODY_CACHE.get(key)
+    if entry is not None:
+        _SCHEMA_BODY_CACHE.move_to_end(key)
+    else:
+        table_info = await db_context.get_schema_info(table_name)
+        
+        if not table_info:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Table '{table_name}' not found in database '{database_name}'"
+            )
+        
+        # The lookup may have loaded the schema cache, which sets its version
+        key = (database_name, table_info.table_name, db_context.schema_manager.cache_version)
+        etag = '"' + hashlib.blake2b(":".join(key).encode(), digest_size=16).hexdigest() + '"'
+        body = APIResponse(
+            success=True,
+            data=table_info_to_response(table_info)
+        ).model_dump_json(by_alias=True).encode()
+        entry = (etag, body)
+        _SCHEMA_BODY_CACHE[key] = entry
+        if len(_SCHEMA_BODY_CACHE) > _SCHEMA_BODY_CACHE_SIZE:
+            _SCHEMA_BODY_CACHE.popitem(last=False)
     
-    return APIResponse(
-        success=True,
-        data=table_info_to_response(table_info)
-    )
+    etag, body = entry
+    if etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.post("/{database_name}/tables", response_model=APIResponse)
 async def get_batch_table_schemas(
-    database_name: str,
     request: GetBatchTableSchemasRequest,
-    multi_ctx: MultiDBContextDep,
+    db_context: DatabaseContextDep,
 ) -> APIResponse:
     """Get schemas for multiple tables at once.
     
     Returns schema information for all specified tables.
     More efficient than calling get_table_schema multiple times.
     """
-    db_context = get_database_context(database_name, multi_ctx)
-    
     results = {}
     not_found = []
     
-    for table_name in request.table_names:
-        table_info = await db_context.get_schema_info(table_name)
+    table_infos = await db_context.batch_get_schema_info(request.table_names)
+    for table_name, table_info in table_infos.items():
         if table_info:
             results[table_name] = table_info_to_response(table_info)
         else:
@@ -106,30 +164,35 @@ async def get_batch_table_schemas(
 
 @router.get("/{database_name}/search/tables", response_model=APIResponse)
 async def search_tables(
-    database_name: str,
     search_term: str,
-    multi_ctx: MultiDBContextDep,
+    db_context: DatabaseContextDep,
 ) -> APIResponse:
     """Search for tables by name pattern.
     
     Finds tables matching the search term (supports comma-separated terms).
     Returns up to 20 matching tables with their schemas.
     """
-    db_context = get_database_context(database_name, multi_ctx)
-    
     # Split search term by commas and whitespace
-    search_terms = [term.strip() for term in search_term.replace(',', ' ').split()]
-    search_terms = [term for term in search_terms if term]
+    search_terms = split_search_terms(search_term)
     
     if not search_terms:
         raise HTTPException(status_code=400, detail="No valid search terms provided")
     
-    # Track matching tables
-    matching_tables = set()
+    # Track matching tables (insertion-ordered, capped at 20)
+    matching_tables = {}
+    seen_terms = set()
     
     for term in search_terms:
-        tables = await db_context.search_tables(term, limit=20)
-        matching_tables.update(tables)
+        # Table search is case-insensitive, so repeated terms add nothing
+        folded = term.upper()
+        if folded in seen_terms:
+            continue
+        seen_terms.add(folded)
+        # Only ask for as many tables as are still missing
+        tables = await db_context.search_tables(term, limit=20 - len(matching_tables))
+        matching_tables.update(dict.fromkeys(tables))
+        if len(matching_tables) >= 20:
+            break
     
     matching_tables = list(matching_tables)[:20]
     
@@ -142,8 +205,8 @@ async def search_tables(
     
     # Load schemas for matching tables
     results = {}
-    for table_name in matching_tables:
-        table_info = await db_context.get_schema_info(table_name)
+    table_infos = await db_context.batch_get_schema_info(matching_tables)
+    for table_name, table_info in table_infos.items():
         if table_info:
             results[table_name] = table_info_to_response(table_info)
     
@@ -159,310 +222,111 @@ async def search_tables(
 
 @router.get("/{database_name}/search/columns", response_model=APIResponse)
 async def search_columns(
-    database_name: str,
     search_term: str,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
+    db_context: DatabaseContextDep,
+    stream: bool = False,
+    v: Annotated[int, Query(ge=1, le=2)] = 1,
+) -> Union[APIResponse, StreamingResponse]:
     """Search for columns across all tables.
     
     Finds columns matching the search term (substring match).
     Returns up to 50 matches with their hosting tables.
+    With stream set, tables are written out as the search finds them.
+    With v=2, data holds parallel "names", "tables" and "types" arrays with
+    one entry per matching column instead of column lists keyed by table.
     """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    try:
-        matching_columns = await db_context.search_columns(search_term, limit=50)
-        
-        if not matching_columns:
-            return APIResponse(
-                success=True,
-                message=f"No columns found matching '{search_term}'",
-                data={"columns": {}, "total": 0}
-            )
-        
-        return APIResponse(
-            success=True,
-            data={
-                "columns": matching_columns,
-                "total": len(matching_columns),
-                "search_term": search_term
-            }
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error searching columns: {str(e)}")
-
-
-@router.get("/{database_name}/info", response_model=APIResponse)
-async def get_db_info(
-    database_name: str,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Get database version and schema information.
-    
-    Returns Oracle version, schema context, and additional version details.
-    """
-    db_context = get_database_context(database_name, multi_ctx)
+    if v == 2:
+        return await _search_columns_arrays(search_term, db_context)
+    if stream:
+        return await _stream_search_columns(search_term, db_context)
     
-    try:
-        db_info = await db_context.get_database_info()
-        return APIResponse(success=True, data=db_info)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error getting database info: {str(e)}")
-
-
-@router.post("/{database_name}/rebuild-cache", response_model=APIResponse)
-async def rebuild_schema_cache(
-    database_name: str,
-    request: RebuildCacheRequest,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Rebuild the schema cache for a database.
+    matching_columns = await db_context.search_columns(search_term, limit=50)
     
-    Forces a full refresh of the schema index.
-    Use after DDL changes that add/drop/rename tables.
-    
-    Set fetch_all_metadata=True for comprehensive indexing (slower but complete).
-    """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    try:
-        start_time = time.time()
-        
-        await db_context.rebuild_cache(fetch_all_metadata=request.fetch_all_metadata)
-        
-        elapsed = time.time() - start_time
-        cache_size = len(db_context.schema_manager.cache.all_table_names) if db_context.schema_manager.cache else 0
-        fully_loaded = sum(1 for t in db_context.schema_manager.cache.tables.values() if t.fully_loaded) if db_context.schema_manager.cache else 0
-        
+    if not matching_columns:
         return APIResponse(
             success=True,
-            message=f"Schema cache rebuilt in {elapsed:.2f} seconds",
-            data={
-                "tables_indexed": cache_size,
-                "fully_loaded": fully_loaded,
-                "fetch_all_metadata": request.fetch_all_metadata,
-                "elapsed_seconds": round(elapsed, 2)
-            }
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to rebuild cache: {str(e)}")
-"""Schema discovery routes - table schemas, search, cache management."""
-
-import time
-from fastapi import APIRouter, HTTPException
-
-from api.models import (
-    APIResponse,
-    GetTableSchemaRequest,
-    GetBatchTableSchemasRequest,
-    SearchTablesRequest,
-    SearchColumnsRequest,
-    RebuildCacheRequest,
-    ColumnInfo,
-    TableSchemaResponse,
-)
-from api.dependencies import MultiDBContextDep, get_database_context
-
-router = APIRouter(prefix="/schema", tags=["Schema Discovery"])
-
-
-def table_info_to_response(table_info) -> TableSchemaResponse:
-    """Convert TableInfo to TableSchemaResponse."""
-    columns = [
-        ColumnInfo(
-            name=col.get("name", ""),
-            type=col.get("type", ""),
-            nullable=col.get("nullable", True),
-            length=col.get("length"),
-            precision=col.get("precision"),
-            scale=col.get("scale"),
-            default=col.get("default"),
-        )
-        for col in table_info.columns
-    ]
-    
-    return TableSchemaResponse(
-        table_name=table_info.table_name,
-        columns=columns,
-        relationships=table_info.relationships or {},
-        constraints=table_info.constraints,
-        indexes=table_info.indexes,
-        table_stats=table_info.table_stats,
-        comments=table_info.comments,
-    )
-
-
-@router.get("/{database_name}/table/{table_name}", response_model=APIResponse)
-async def get_table_schema(
-    database_name: str,
-    table_name: str,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Get schema for a single table.
-    
-    Returns columns, relationships, and cached metadata for the specified table.
-    Lazy loads and caches the schema on first access.
-    """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    table_info = await db_context.get_schema_info(table_name)
-    
-    if not table_info:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Table '{table_name}' not found in database '{database_name}'"
+            message=f"No columns found matching '{search_term}'",
+            data={"columns": {}, "total": 0}
         )
     
-    return APIResponse(
-        success=True,
-        data=table_info_to_response(table_info)
-    )
-
-
-@router.post("/{database_name}/tables", response_model=APIResponse)
-async def get_batch_table_schemas(
-    database_name: str,
-    request: GetBatchTableSchemasRequest,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Get schemas for multiple tables at once.
-    
-    Returns schema information for all specified tables.
-    More efficient than calling get_table_schema multiple times.
-    """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    results = {}
-    not_found = []
-    
-    for table_name in request.table_names:
-        table_info = await db_context.get_schema_info(table_name)
-        if table_info:
-            results[table_name] = table_info_to_response(table_info)
-        else:
-            not_found.append(table_name)
-    
     return APIResponse(
         success=True,
         data={
-            "tables": results,
-            "not_found": not_found
+            "columns": matching_columns,
+            "total": len(matching_columns),
+            "search_term": search_term
         }
     )
 
 
-@router.get("/{database_name}/search/tables", response_model=APIResponse)
-async def search_tables(
-    database_name: str,
-    search_term: str,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Search for tables by name pattern.
-    
-    Finds tables matching the search term (supports comma-separated terms).
-    Returns up to 20 matching tables with their schemas.
-    """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    # Split search term by commas and whitespace
-    search_terms = [term.strip() for term in search_term.replace(',', ' ').split()]
-    search_terms = [term for term in search_terms if term]
-    
-    if not search_terms:
-        raise HTTPException(status_code=400, detail="No valid search terms provided")
-    
-    # Track matching tables
-    matching_tables = set()
-    
-    for term in search_terms:
-        tables = await db_context.search_tables(term, limit=20)
-        matching_tables.update(tables)
-    
-    matching_tables = list(matching_tables)[:20]
-    
-    if not matching_tables:
-        return APIResponse(
-            success=True,
-            message=f"No tables found matching: {', '.join(search_terms)}",
-            data={"tables": [], "total": 0}
-        )
-    
-    # Load schemas for matching tables
-    results = {}
-    for table_name in matching_tables:
-        table_info = await db_context.get_schema_info(table_name)
-        if table_info:
-            results[table_name] = table_info_to_response(table_info)
+async def _search_columns_arrays(search_term: str, db_context) -> APIResponse:
+    """search_columns in the v=2 layout: one array per column attribute."""
+    names, tables, types = [], [], []
+    async for table_name, columns in db_context.iter_search_columns(search_term, limit=50):
+        for column in columns:
+            names.append(column.get("name"))
+            tables.append(table_name)
+            types.append(column.get("type"))
     
     return APIResponse(
         success=True,
+        message=None if names else f"No columns found matching '{search_term}'",
         data={
-            "tables": results,
-            "total": len(results),
-            "search_terms": search_terms
+            "names": names,
+            "tables": tables,
+            "types": types,
+            "total": len(names),
+            "search_term": search_term
         }
     )
 
 
-@router.get("/{database_name}/search/columns", response_model=APIResponse)
-async def search_columns(
-    database_name: str,
-    search_term: str,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Search for columns across all tables.
-    
-    Finds columns matching the search term (substring match).
-    Returns up to 50 matches with their hosting tables.
-    """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    try:
-        matching_columns = await db_context.search_columns(search_term, limit=50)
-        
-        if not matching_columns:
-            return APIResponse(
-                success=True,
-                message=f"No columns found matching '{search_term}'",
-                data={"columns": {}, "total": 0}
-            )
-        
-        return APIResponse(
-            success=True,
-            data={
-                "columns": matching_columns,
-                "total": len(matching_columns),
-                "search_term": search_term
-            }
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error searching columns: {str(e)}")
+async def _stream_search_columns(search_term: str, db_context) -> StreamingResponse:
+    """Stream the search_columns document one table at a time."""
+    matches = db_context.iter_search_columns(search_term, limit=50)
+    # Start the search before the response so setup errors still map to HTTP codes
+    first = await anext(matches, None)
+    
+    async def json_body():
+        # Same document as the non-streaming APIResponse
+        total = 0
+        try:
+            yield b'{"success":true,"data":{"columns":{'
+            pending = first
+            while pending is not None:
+                table_name, columns = pending
+                prefix = b"," if total else b""
+                yield prefix + orjson.dumps(table_name) + b":" + orjson.dumps(columns, default=orjson_default)
+                total += 1
+                pending = await anext(matches, None)
+            if total:
+                tail = b',"search_term":' + orjson.dumps(search_term) + b'},"message":null'
+            else:
+                tail = b'},"message":' + orjson.dumps(f"No columns found matching '{search_term}'")
+            yield b'},"total":' + str(total).encode() + tail + b',"error":null}'
+        finally:
+            await matches.aclose()
+    
+    return StreamingResponse(json_body(), media_type="application/json")
 
 
 @router.get("/{database_name}/info", response_model=APIResponse)
 async def get_db_info(
-    database_name: str,
-    multi_ctx: MultiDBContextDep,
+    db_context: DatabaseContextDep,
 ) -> APIResponse:
     """Get database version and schema information.
     
     Returns Oracle version, schema context, and additional version details.
     """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    try:
-        db_info = await db_context.get_database_info()
-        return APIResponse(success=True, data=db_info)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error getting database info: {str(e)}")
+    db_info = await db_context.get_database_info()
+    return APIResponse(success=True, data=db_info)
 
 
 @router.post("/{database_name}/rebuild-cache", response_model=APIResponse)
 async def rebuild_schema_cache(
-    database_name: str,
     request: RebuildCacheRequest,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
+    db_context: DatabaseContextDep,
+) -> ORJSONResponse:
     """Rebuild the schema cache for a database.
     
     Forces a full refresh of the schema index.
@@ -470,26 +334,23 @@ async def rebuild_schema_cache(
     
     Set fetch_all_metadata=True for comprehensive indexing (slower but complete).
     """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    try:
-        start_time = time.time()
-        
-        await db_context.rebuild_cache(fetch_all_metadata=request.fetch_all_metadata)
-        
-        elapsed = time.time() - start_time
-        cache_size = len(db_context.schema_manager.cache.all_table_names) if db_context.schema_manager.cache else 0
-        fully_loaded = sum(1 for t in db_context.schema_manager.cache.tables.values() if t.fully_loaded) if db_context.schema_manager.cache else 0
-        
-        return APIResponse(
-            success=True,
-            message=f"Schema cache rebuilt in {elapsed:.2f} seconds",
-            data={
-                "tables_indexed": cache_size,
-                "fully_loaded": fully_loaded,
-                "fetch_all_metadata": request.fetch_all_metadata,
-                "elapsed_seconds": round(elapsed, 2)
-            }
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to rebuild cache: {str(e)}")
+    start_time = time.perf_counter()
+    
+    await db_context.rebuild_cache(fetch_all_metadata=request.fetch_all_metadata)
+    
+    elapsed = round(time.perf_counter() - start_time, 2)
+    cache_size = len(db_context.schema_manager.cache.all_table_names) if db_context.schema_manager.cache else 0
+    fully_loaded = db_context.schema_manager.cache.fully_loaded_count if db_context.schema_manager.cache else 0
+    
+    # Only scalars, so the APIResponse document is written directly
+    return ORJSONResponse({
+        "success": True,
+        "data": {
+            "tables_indexed": cache_size,
+            "fully_loaded": fully_loaded,
+            "fetch_all_metadata": request.fetch_all_metadata,
+            "elapsed_seconds": elapsed
+        },
+        "message": f"Schema cache rebuilt in {elapsed:.2f} seconds",
+        "error": None,
+    })
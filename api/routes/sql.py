@@ -1,1847 +1,25 @@
-
-"""SQL execution routes - query, write, explain, samples."""
-
-import sys
-import oracledb
-from fastapi import APIRouter, HTTPException
-
-from api.models import (
-    APIResponse,
-    ExecuteSQLRequest,
-    ExecuteWriteSQLRequest,
-    ExplainQueryRequest,
-    SQLResultResponse,
-    ExecutionPlanResponse,
-    SampleQueryInfo,
-    SampleQueriesResponse,
-    GenerateDQRulesRequest,
-    DQRuleInfo,
-    DQRulesResponse,
-    ApplyDQRulesRequest,
-    DQValidationResultInfo,
-    DQValidationResponse,
-)
-from api.dependencies import MultiDBContextDep, get_database_context
-from db_context.schema.formatter import format_sql_query_result
-
-router = APIRouter(prefix="/sql", tags=["SQL Execution"])
-
-
-@router.post("/{database_name}/execute", response_model=APIResponse)
-async def execute_sql(
-    database_name: str,
-    request: ExecuteSQLRequest,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Execute a SQL query.
-    
-    Supports SELECT, INSERT, UPDATE, DELETE, and DDL statements.
-    In read-only mode (default), only SELECT statements are permitted.
-    """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    try:
-        result = await db_context.run_sql_query(request.sql, max_rows=request.max_rows)
-        
-        # Handle different result types
-        if not result.get("rows"):
-            return APIResponse(
-                success=True,
-                message=result.get("message", "Query executed successfully"),
-                data=SQLResultResponse(
-                    columns=result.get("columns", []),
-                    rows=[],
-                    row_count=result.get("row_count", 0),
-                    message=result.get("message")
-                )
-            )
-        
-        return APIResponse(
-            success=True,
-            data=SQLResultResponse(
-                columns=result.get("columns", []),
-                rows=result.get("rows", []),
-                row_count=len(result.get("rows", [])),
-            )
-        )
-    except PermissionError as e:
-        raise HTTPException(
-            status_code=403,
-            detail=f"Permission denied: {str(e)}. Write operations require read_only=False."
-        )
-    except oracledb.Error as e:
-        raise HTTPException(status_code=400, detail=f"Database error: {str(e)}")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error executing query: {str(e)}")
-
-
-@router.post("/{database_name}/write", response_model=APIResponse)
-async def execute_write_sql(
-    database_name: str,
-    request: ExecuteWriteSQLRequest,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Execute a write operation (INSERT, UPDATE, DELETE, DDL).
-    
-    Changes are automatically committed.
-    Requires the database to be configured with read_only=False.
-    """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    # Validate it's not a SELECT
-    sql_upper = request.sql.strip().upper()
-    if sql_upper.startswith('SELECT') or sql_upper.startswith('WITH'):
-        raise HTTPException(
-            status_code=400,
-            detail="Use the /execute endpoint for SELECT statements. This endpoint is for write operations only."
-        )
-    
-    try:
-        result = await db_context.run_sql_query(request.sql, max_rows=0)
-        
-        return APIResponse(
-            success=True,
-            message=result.get("message", "Statement executed successfully"),
-            data={
-                "row_count": result.get("row_count", 0),
-                "message": result.get("message")
-            }
-        )
-    except PermissionError as e:
-        raise HTTPException(
-            status_code=403,
-            detail=f"Permission denied: {str(e)}. Write operations require read_only=False in configuration."
-        )
-    except oracledb.Error as e:
-        error_code = getattr(e.args[0] if e.args else None, 'code', 'Unknown')
-        raise HTTPException(
-            status_code=400,
-            detail=f"Database error (ORA-{error_code}): {str(e)}"
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error executing statement: {str(e)}")
-
-
-@router.post("/{database_name}/explain", response_model=APIResponse)
-async def explain_query_plan(
-    database_name: str,
-    request: ExplainQueryRequest,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Get execution plan for a SQL query.
-    
-    Returns the Oracle execution plan with optimization suggestions.
-    Useful for understanding query performance before execution.
-    """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    try:
-        plan = await db_context.explain_query_plan(request.sql)
-        
-        if plan.get("error"):
-            return APIResponse(
-                success=False,
-                error=f"Explain plan unavailable: {plan['error']}"
-            )
-        
-        if not plan.get("execution_plan"):
-            return APIResponse(
-                success=False,
-                error="No execution plan rows returned"
-            )
-        
-        return APIResponse(
-            success=True,
-            data=ExecutionPlanResponse(
-                execution_plan=plan.get("execution_plan", []),
-                optimization_suggestions=plan.get("optimization_suggestions")
-            )
-        )
-    except PermissionError as e:
-        raise HTTPException(status_code=403, detail=f"Permission error: {str(e)}")
-    except oracledb.Error as e:
-        raise HTTPException(status_code=400, detail=f"Database error: {str(e)}")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error obtaining plan: {str(e)}")
-
-
-@router.get("/{database_name}/samples", response_model=APIResponse)
-async def generate_sample_queries(
-    database_name: str,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Generate sample SQL queries based on database schema.
-    
-    Creates 10 runnable SQL queries from beginner to advanced level
-    using actual tables and columns from your database.
-    """
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    try:
-        # Get available tables
-        all_tables = await db_context.list_tables()
-        
-        if not all_tables or len(all_tables) == 0:
-            return APIResponse(
-                success=False,
-                error="No tables found in database"
-            )
-        
-        # Load metadata for first few tables
-        tables_to_analyze = all_tables[:min(5, len(all_tables))]
-        table_metadata = []
-        
-        for table_name in tables_to_analyze:
-            try:
-                table_info = await db_context.get_schema_info(table_name)
-                if table_info and table_info.columns:
-                    table_metadata.append(table_info)
-            except Exception:
-                continue
-        
-        if not table_metadata:
-            return APIResponse(
-                success=False,
-                error="Could not load table metadata for query generation"
-            )
-        
-        # Helper function to get column names by type
-        def get_columns_by_type(table, types):
-            return [col['name'] for col in table.columns if any(t in col.get('type', '').upper() for t in types)]
-        
-        # Get primary table for examples
-        primary_table = table_metadata[0]
-        table_name = primary_table.table_name
-        
-        # Get different column types
-        all_columns = [col['name'] for col in primary_table.columns]
-        numeric_cols = get_columns_by_type(primary_table, ['NUMBER', 'INT', 'FLOAT', 'DECIMAL'])
-        text_cols = get_columns_by_type(primary_table, ['VARCHAR', 'CHAR', 'CLOB', 'TEXT'])
-        date_cols = get_columns_by_type(primary_table, ['DATE', 'TIMESTAMP'])
-        
-        sample_queries = []
-        
-        # Beginner queries
-        sample_queries.append(SampleQueryInfo(
-            level="Beginner",
-            number=1,
-            title="Select All Records",
-            description="Retrieve all columns and rows (limited to 10)",
-            query=f"SELECT * FROM {table_name} WHERE ROWNUM <= 10"
-        ))
-        
-        cols_to_select = all_columns[:min(3, len(all_columns))]
-        sample_queries.append(SampleQueryInfo(
-            level="Beginner",
-            number=2,
-            title="Select Specific Columns",
-            description="Retrieve only specific columns",
-            query=f"SELECT {', '.join(cols_to_select)} FROM {table_name}"
-        ))
-        
-        if numeric_cols:
-            sample_queries.append(SampleQueryInfo(
-                level="Beginner",
-                number=3,
-                title="Filter with WHERE Clause",
-                description="Filter records based on a numeric condition",
-                query=f"SELECT * FROM {table_name} WHERE {numeric_cols[0]} > 0"
-            ))
-        else:
-            sample_queries.append(SampleQueryInfo(
-                level="Beginner",
-                number=3,
-                title="Filter with WHERE Clause",
-                description="Filter records with ROWNUM",
-                query=f"SELECT * FROM {table_name} WHERE ROWNUM <= 5"
-            ))
-        
-        sample_queries.append(SampleQueryInfo(
-            level="Beginner",
-            number=4,
-            title="Sort Results",
-            description="Order results by a specific column",
-            query=f"SELECT * FROM {table_name} ORDER BY {all_columns[0]} DESC"
-        ))
-        
-        # Intermediate queries
-        sample_queries.append(SampleQueryInfo(
-            level="Intermediate",
-            number=5,
-            title="Count Records",
-            description="Count total number of records",
-            query=f"SELECT COUNT(*) AS total_records FROM {table_name}"
-        ))
-        
-        if numeric_cols and len(all_columns) > 1:
-            group_col = [c for c in all_columns if c not in numeric_cols[:1]]
-            group_col = group_col[0] if group_col else all_columns[0]
-            sample_queries.append(SampleQueryInfo(
-                level="Intermediate",
-                number=6,
-                title="Group and Aggregate",
-                description="Group records and calculate aggregates",
-                query=f"SELECT {group_col}, COUNT(*) AS count, AVG({numeric_cols[0]}) AS avg_value FROM {table_name} GROUP BY {group_col} ORDER BY count DESC"
-            ))
-        else:
-            sample_queries.append(SampleQueryInfo(
-                level="Intermediate",
-                number=6,
-                title="Group and Count",
-                description="Group records and count",
-                query=f"SELECT {all_columns[0]}, COUNT(*) AS count FROM {table_name} GROUP BY {all_columns[0]} ORDER BY count DESC"
-            ))
-        
-        sample_queries.append(SampleQueryInfo(
-            level="Intermediate",
-            number=7,
-            title="Find Distinct Values",
-            description="Get unique values from a column",
-            query=f"SELECT DISTINCT {all_columns[0]} FROM {table_name} ORDER BY {all_columns[0]}"
-        ))
-        
-        # Advanced queries
-        if numeric_cols:
-            sample_queries.append(SampleQueryInfo(
-                level="Advanced",
-                number=8,
-                title="Subquery - Above Average",
-                description="Find records with values above average",
-                query=f"SELECT * FROM {table_name} WHERE {numeric_cols[0]} > (SELECT AVG({numeric_cols[0]}) FROM {table_name})"
-            ))
-        else:
-            sample_queries.append(SampleQueryInfo(
-                level="Advanced",
-                number=8,
-                title="Subquery - IN clause",
-                description="Use subquery in IN clause",
-                query=f"SELECT * FROM {table_name} WHERE {all_columns[0]} IN (SELECT {all_columns[0]} FROM {table_name} WHERE ROWNUM <= 5)"
-            ))
-        
-        if numeric_cols and len(all_columns) > 1:
-            partition_col = [c for c in all_columns if c != numeric_cols[0]][0]
-            sample_queries.append(SampleQueryInfo(
-                level="Advanced",
-                number=9,
-                title="Window Function - Ranking",
-                description="Use window functions for ranking",
-                query=f"SELECT {', '.join(all_columns[:3])}, ROW_NUMBER() OVER (PARTITION BY {partition_col} ORDER BY {numeric_cols[0]} DESC) AS rank FROM {table_name}"
-            ))
-        else:
-            sample_queries.append(SampleQueryInfo(
-                level="Advanced",
-                number=9,
-                title="Window Function - Row Numbers",
-                description="Add row numbers to results",
-                query=f"SELECT {', '.join(all_columns[:3])}, ROW_NUMBER() OVER (ORDER BY {all_columns[0]}) AS row_num FROM {table_name}"
-            ))
-        
-        if numeric_cols:
-            sample_queries.append(SampleQueryInfo(
-                level="Advanced",
-                number=10,
-                title="Statistical Analysis",
-                description="Calculate statistical measures",
-                query=f"SELECT COUNT(*) AS total_records, MIN({numeric_cols[0]}) AS min_value, MAX({numeric_cols[0]}) AS max_value, AVG({numeric_cols[0]}) AS avg_value, STDDEV({numeric_cols[0]}) AS std_deviation FROM {table_name}"
-            ))
-        else:
-            sample_queries.append(SampleQueryInfo(
-                level="Advanced",
-                number=10,
-                title="Analytical Query",
-                description="Use analytical functions",
-                query=f"SELECT {all_columns[0]}, COUNT(*) OVER () AS total_count, ROW_NUMBER() OVER (ORDER BY {all_columns[0]}) AS row_num FROM {table_name} WHERE ROWNUM <= 20"
-            ))
-        
-        return APIResponse(
-            success=True,
-            data=SampleQueriesResponse(
-                database_name=database_name,
-                queries=sample_queries
-            )
-        )
-        
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error generating sample queries: {str(e)}")
-
-
-@router.post("/{database_name}/dq-rules", response_model=APIResponse)
-async def generate_sample_dq_rules(
-    database_name: str,
-    request: GenerateDQRulesRequest,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Generate sample data quality (DQ) rules based on table schema.
-    
-    Creates contextual data quality validation rules using actual table columns and their
-    data types. Rules span multiple categories including Business Entity Rules, Business
-    Attribute Rules, Data Dependency Rules, and Data Validity Rules.
-    
-    Rule Categories:
-    
-    BUSINESS ENTITY RULES (ensure core business objects are well-defined):
-    - entity_uniqueness: Every entity must be uniquely identifiable (no duplicate records)
-    - cardinality: Defines relationship constraints (one-to-many, many-to-many)
-    - optionality: Mandatory vs optional relationship enforcement
-    
-    BUSINESS ATTRIBUTE RULES (individual data element validation):
-    - data_inheritance: Attributes consistent across subtypes
-    - data_domain: Values conform to allowed formats/ranges (state codes, age ranges)
-    - format: Pattern validation (email, phone, date formats)
-    - value_in_list: Allowed values validation
-    
-    DATA DEPENDENCY RULES (logical/conditional relationships):
-    - entity_relationship_dependency: Existence depends on conditions
-    - attribute_dependency: Value depends on other attributes
-    - conditional_mandatory: Dependent field requirements
-    - cross_field_validation: Multi-column logical checks
-    
-    DATA VALIDITY RULES (ensure data is trustworthy):
-    - completeness: Required records, relationships, attributes must exist (mandatory)
-    - correctness_accuracy: Values reflect real-world truth
-    - precision: Data stored with required detail level
-    - uniqueness: No duplicate records, keys, or overloaded columns
-    - consistency: Duplicate/redundant data must match everywhere
-    - compliance: PII and sensitive data validation (SSN, credit card, passport)
-    - freshness: Confirms date values are up to date
-    - data_type_match: Values match their data type requirements
-    - duplicate_rows: Multi-column duplicate detection
-    - empty_blank: Null/empty/whitespace checks
-    - table_lookup: Referential integrity (value exists in lookup table)
-    - expression: Range and cross-column checks
-    - custom: Flexible custom business logic rules
-    """
-    import random
-    
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    try:
-        num_rules = max(1, min(request.num_rules, 50))
-        
-        # Get table schema info
-        table_info = await db_context.get_schema_info(request.table_name)
-        
-        if not table_info:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Table '{request.table_name}' not found in database '{database_name}'"
-            )
-        
-        if not table_info.columns:
-            raise HTTPException(
-                status_code=400,
-                detail=f"No columns found for table '{request.table_name}'"
-            )
-        
-        columns = table_info.columns
-        
-        # Helper function to categorize columns by type
-        def get_columns_by_type(columns, type_patterns):
-            return [col for col in columns if any(t in col.get('type', '').upper() for t in type_patterns)]
-        
-        # Categorize columns
-        numeric_cols = get_columns_by_type(columns, ['NUMBER', 'INT', 'FLOAT', 'DECIMAL', 'NUMERIC'])
-        text_cols = get_columns_by_type(columns, ['VARCHAR', 'CHAR', 'CLOB', 'TEXT', 'NVARCHAR', 'NCHAR'])
-        date_cols = get_columns_by_type(columns, ['DATE', 'TIMESTAMP'])
-        all_cols = columns
-        
-        # Find specific column patterns
-        email_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['EMAIL', 'MAIL'])]
-        phone_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['PHONE', 'MOBILE', 'TEL', 'FAX'])]
-        name_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['NAME', 'FIRST', 'LAST', 'MIDDLE'])]
-        id_cols = [col for col in all_cols if any(k in col['name'].upper() for k in ['ID', 'CODE', 'KEY', 'NUM'])]
-        status_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['STATUS', 'STATE', 'TYPE', 'FLAG', 'CATEGORY'])]
-        amount_cols = [col for col in numeric_cols if any(k in col['name'].upper() for k in ['AMOUNT', 'PRICE', 'COST', 'INCOME', 'SALARY', 'BALANCE', 'TOTAL'])]
-        
-        # Additional column patterns for comprehensive DQ rules
-        address_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['ADDRESS', 'ADDR', 'STREET', 'CITY', 'STATE', 'ZIP', 'POSTAL', 'COUNTRY'])]
-        state_code_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['STATE_CODE', 'STATE_CD', 'COUNTRY_CODE', 'COUNTRY_CD'])]
-        age_cols = [col for col in numeric_cols if any(k in col['name'].upper() for k in ['AGE', 'YEARS'])]
-        rate_cols = [col for col in numeric_cols if any(k in col['name'].upper() for k in ['RATE', 'PERCENT', 'PCT', 'RATIO', 'INTEREST', 'COMMISSION'])]
-        account_cols = [col for col in all_cols if any(k in col['name'].upper() for k in ['ACCOUNT', 'ACCT'])]
-        loan_cols = [col for col in all_cols if any(k in col['name'].upper() for k in ['LOAN', 'CREDIT', 'DEBT', 'MORTGAGE'])]
-        customer_cols = [col for col in all_cols if any(k in col['name'].upper() for k in ['CUSTOMER', 'CUST', 'CLIENT'])]
-        pii_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['SSN', 'PASSPORT', 'NATIONAL_ID', 'TAX_ID', 'CREDIT_CARD', 'BANK_ACCOUNT', 'CVV', 'EXPIRY'])]
-        fk_cols = [col for col in all_cols if any(k in col['name'].upper() for k in ['_ID', '_KEY', '_REF', '_FK', 'PARENT_', 'FOREIGN_'])]
-        
-        # Build rule templates
-        rule_templates = []
-        
-        # 1. Mandatory rules for important-looking columns
-        mandatory_candidates = name_cols + id_cols + email_cols
-        for col in mandatory_candidates[:3]:
-            rule_templates.append({
-                "rule_id": f"r_mandatory_{col['name'].lower()}",
-                "rule_type": "mandatory",
-                "target_columns": [col['name']],
-                "enabled": True
-            })
-        
-        # 2. Format rules for email columns
-        for col in email_cols[:2]:
-            rule_templates.append({
-                "rule_id": f"r_format_{col['name'].lower()}",
-                "rule_type": "format",
-                "target_columns": [col['name']],
-                "params": {"pattern": "^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\\.[a-zA-Z0-9-.]+$"},
-                "enabled": True
-            })
-        
-        # 3. Format rules for phone columns
-        for col in phone_cols[:2]:
-            rule_templates.append({
-                "rule_id": f"r_format_{col['name'].lower()}",
-                "rule_type": "format",
-                "target_columns": [col['name']],
-                "params": {"pattern": "^[+]?[0-9]{10,15}$"},
-                "enabled": True
-            })
-        
-        # 4. Uniqueness rules for ID/key columns and emails
-        unique_candidates = id_cols[:2] + email_cols[:1]
-        for col in unique_candidates:
-            rule_templates.append({
-                "rule_id": f"r_unique_{col['name'].lower()}",
-                "rule_type": "uniqueness",
-                "target_columns": [col['name']],
-                "params": {"scope": "table"},
-                "enabled": True
-            })
-        
-        # 5. Value in list rules for status/type columns
-        sample_values_map = {
-            'STATUS': ['Active', 'Inactive', 'Pending', 'Suspended', 'Closed'],
-            'STATE': ['Open', 'Closed', 'In Progress', 'Completed', 'Cancelled'],
-            'TYPE': ['Standard', 'Premium', 'Basic', 'Enterprise', 'Trial'],
-            'CATEGORY': ['Category A', 'Category B', 'Category C', 'Other'],
-            'FLAG': ['Y', 'N'],
-            'GENDER': ['M', 'F', 'O'],
-            'RESIDENCY': ['Resident', 'Non-Resident', 'ROR', 'NRI'],
-            'OCCUPATION': ['Engineer', 'Doctor', 'Teacher', 'Business', 'Student', 'Other']
-        }
-        
-        for col in status_cols[:3]:
-            col_upper = col['name'].upper()
-            sample_values = ['Value1', 'Value2', 'Value3', 'Value4', 'Value5']
-            for key, values in sample_values_map.items():
-                if key in col_upper:
-                    sample_values = values
-                    break
-            
-            rule_templates.append({
-                "rule_id": f"r_value_in_list_{col['name'].lower()}",
-                "rule_type": "value_in_list",
-                "target_columns": [col['name']],
-                "params": {"allowed_values": sample_values},
-                "enabled": True
-            })
-        
-        # 6. Expression rules for numeric range checks
-        for col in amount_cols[:2]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_range_{col_name.lower()}",
-                "rule_type": "expression",
-                "target_columns": [col_name],
-                "params": {"expression": f"{col_name} BETWEEN 0 AND 10000000"},
-                "enabled": True
-            })
-        
-        # 7. Expression rules for non-negative numeric values
-        for col in numeric_cols[:2]:
-            if col not in amount_cols:
-                col_name = col['name']
-                rule_templates.append({
-                    "rule_id": f"r_positive_{col_name.lower()}",
-                    "rule_type": "expression",
-                    "target_columns": [col_name],
-                    "params": {"expression": f"{col_name} >= 0"},
-                    "enabled": True
-                })
-        
-        # 8. Conditional mandatory rules
-        if status_cols and name_cols:
-            status_col = status_cols[0]['name']
-            target_col = name_cols[0]['name']
-            rule_templates.append({
-                "rule_id": f"r_conditional_{target_col.lower()}",
-                "rule_type": "conditional_mandatory",
-                "target_columns": [target_col],
-                "params": {"condition": f"{status_col} = 'Active'"},
-                "enabled": True
-            })
-        
-        if phone_cols and status_cols:
-            phone_col = phone_cols[0]['name']
-            status_col = status_cols[0]['name']
-            rule_templates.append({
-                "rule_id": "r_phone_required_if_active",
-                "rule_type": "conditional_mandatory",
-                "target_columns": [phone_col],
-                "params": {"condition": f"{status_col} IN ('Active', 'Premium')"},
-                "enabled": True
-            })
-        
-        # 9. Cross-column date validation
-        if len(date_cols) >= 2:
-            date1 = date_cols[0]['name']
-            date2 = date_cols[1]['name']
-            rule_templates.append({
-                "rule_id": f"r_date_order_{date1.lower()}_{date2.lower()}",
-                "rule_type": "expression",
-                "target_columns": [date1, date2],
-                "params": {"expression": f"TO_DATE({date1}, 'YYYY-MM-DD') <= TO_DATE({date2}, 'YYYY-MM-DD')"},
-                "enabled": True
-            })
-        
-        # 10. String length validation for text columns
-        for col in text_cols[:2]:
-            col_name = col['name']
-            col_type = col.get('type', 'VARCHAR2(100)')
-            max_len = 100
-            if '(' in col_type:
-                try:
-                    max_len = int(col_type.split('(')[1].split(')')[0].split(',')[0])
-                except:
-                    max_len = col.get('length', 100)
-            else:
-                max_len = col.get('length', 100)
-            
-            rule_templates.append({
-                "rule_id": f"r_length_{col_name.lower()}",
-                "rule_type": "expression",
-                "target_columns": [col_name],
-                "params": {"expression": f"LENGTH({col_name}) <= {max_len}"},
-                "enabled": True
-            })
-        
-        # 11. Not null with trimmed check for text
-        for col in text_cols[:2]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_not_blank_{col_name.lower()}",
-                "rule_type": "expression",
-                "target_columns": [col_name],
-                "params": {"expression": f"TRIM({col_name}) IS NOT NULL"},
-                "enabled": True
-            })
-        
-        # ===== NEW DYNAMIC RULE TYPES =====
-        
-        # 12. Freshness rules - Confirms that date values are up to date
-        for col in date_cols[:2]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_freshness_{col_name.lower()}",
-                "rule_type": "freshness",
-                "target_columns": [col_name],
-                "params": {
-                    "max_age_days": 30,
-                    "expression": f"{col_name} >= SYSDATE - 30"
-                },
-                "enabled": True
-            })
-        
-        # 13. Data type match rules - Confirms values match their data type requirements
-        for col in numeric_cols[:2]:
-            col_name = col['name']
-            col_type = col.get('type', 'NUMBER')
-            precision = col.get('precision')
-            scale = col.get('scale', 0)
-            rule_templates.append({
-                "rule_id": f"r_datatype_{col_name.lower()}",
-                "rule_type": "data_type_match",
-                "target_columns": [col_name],
-                "params": {
-                    "expected_type": col_type,
-                    "precision": precision,
-                    "scale": scale,
-                    "expression": f"REGEXP_LIKE(TO_CHAR({col_name}), '^-?[0-9]+(\\.[0-9]+)?$')"
-                },
-                "enabled": True
-            })
-        
-        # Data type match for date columns stored as strings
-        date_string_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['DATE', 'DOB', 'BIRTH', 'CREATED', 'UPDATED', 'MODIFIED'])]
-        for col in date_string_cols[:2]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_datatype_date_{col_name.lower()}",
-                "rule_type": "data_type_match",
-                "target_columns": [col_name],
-                "params": {
-                    "expected_type": "DATE_STRING",
-                    "format": "YYYY-MM-DD",
-                    "expression": f"REGEXP_LIKE({col_name}, '^[0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}}$')"
-                },
-                "enabled": True
-            })
-        
-        # 14. Duplicate rows check - Checks for duplicate rows across multiple columns
-        if len(all_cols) >= 2:
-            # Use first few meaningful columns for duplicate check
-            dup_check_cols = []
-            for col in all_cols:
-                if not any(k in col['name'].upper() for k in ['ID', 'KEY', 'SEQ', 'ROWID']):
-                    dup_check_cols.append(col['name'])
-                if len(dup_check_cols) >= 3:
-                    break
-            
-            if len(dup_check_cols) >= 2:
-                rule_templates.append({
-                    "rule_id": "r_duplicate_rows",
-                    "rule_type": "duplicate_rows",
-                    "target_columns": dup_check_cols,
-                    "params": {
-                        "check_columns": dup_check_cols,
-                        "expression": f"SELECT {', '.join(dup_check_cols)}, COUNT(*) FROM {request.table_name} GROUP BY {', '.join(dup_check_cols)} HAVING COUNT(*) > 1"
-                    },
-                    "enabled": True
-                })
-        
-        # 15. Empty/blank fields - Looks for blank and empty fields
-        for col in text_cols[:3]:
-            col_name = col['name']
-            nullable = col.get('nullable', True)
-            if not nullable:  # Only for columns that shouldn't be empty
-                rule_templates.append({
-                    "rule_id": f"r_empty_blank_{col_name.lower()}",
-                    "rule_type": "empty_blank",
-                    "target_columns": [col_name],
-                    "params": {
-                        "allow_null": False,
-                        "allow_empty_string": False,
-                        "allow_whitespace_only": False,
-                        "expression": f"{col_name} IS NOT NULL AND TRIM({col_name}) IS NOT NULL AND LENGTH(TRIM({col_name})) > 0"
-                    },
-                    "enabled": True
-                })
-        
-        # Also add for important looking columns regardless of nullable
-        important_cols = name_cols + email_cols
-        for col in important_cols[:2]:
-            col_name = col['name']
-            if f"r_empty_blank_{col_name.lower()}" not in [r.get('rule_id') for r in rule_templates]:
-                rule_templates.append({
-                    "rule_id": f"r_empty_blank_{col_name.lower()}",
-                    "rule_type": "empty_blank",
-                    "target_columns": [col_name],
-                    "params": {
-                        "allow_null": False,
-                        "allow_empty_string": False,
-                        "allow_whitespace_only": False,
-                        "expression": f"{col_name} IS NOT NULL AND TRIM({col_name}) IS NOT NULL AND LENGTH(TRIM({col_name})) > 0"
-                    },
-                    "enabled": True
-                })
-        
-        # 16. Table lookup rules - Confirms value exists in another table
-        fk_pattern_cols = [col for col in all_cols if any(k in col['name'].upper() for k in ['_ID', '_CODE', '_KEY', '_REF', '_FK'])]
-        for col in fk_pattern_cols[:2]:
-            col_name = col['name']
-            lookup_table = None
-            if '_ID' in col_name.upper():
-                lookup_table = col_name.upper().replace('_ID', '')
-            elif '_CODE' in col_name.upper():
-                lookup_table = col_name.upper().replace('_CODE', '')
-            elif '_KEY' in col_name.upper():
-                lookup_table = col_name.upper().replace('_KEY', '')
-            
-            if lookup_table:
-                rule_templates.append({
-                    "rule_id": f"r_table_lookup_{col_name.lower()}",
-                    "rule_type": "table_lookup",
-                    "target_columns": [col_name],
-                    "params": {
-                        "lookup_table": f"{lookup_table}",
-                        "lookup_column": "ID",
-                        "expression": f"{col_name} IN (SELECT ID FROM {lookup_table})",
-                        "allow_null": True
-                    },
-                    "enabled": True
-                })
-        
-        # 17. String format match rules - Various format validations
-        ssn_cols = [col for col in text_cols if 'SSN' in col['name'].upper()]
-        for col in ssn_cols[:1]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_format_ssn_{col_name.lower()}",
-                "rule_type": "string_format_match",
-                "target_columns": [col_name],
-                "params": {
-                    "format_name": "SSN",
-                    "pattern": "^[0-9]{3}-[0-9]{2}-[0-9]{4}$|^[0-9]{9}$",
-                    "description": "Social Security Number format (XXX-XX-XXXX or XXXXXXXXX)"
-                },
-                "enabled": True
-            })
-        
-        cc_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['CREDIT_CARD', 'CARD_NUMBER', 'CC_NUM'])]
-        for col in cc_cols[:1]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_format_cc_{col_name.lower()}",
-                "rule_type": "string_format_match",
-                "target_columns": [col_name],
-                "params": {
-                    "format_name": "CREDIT_CARD",
-                    "pattern": "^[0-9]{13,19}$",
-                    "description": "Credit card number (13-19 digits)"
-                },
-                "enabled": True
-            })
-        
-        zip_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['ZIP', 'POSTAL', 'PIN_CODE', 'PINCODE'])]
-        for col in zip_cols[:1]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_format_zip_{col_name.lower()}",
-                "rule_type": "string_format_match",
-                "target_columns": [col_name],
-                "params": {
-                    "format_name": "POSTAL_CODE",
-                    "pattern": "^[0-9]{5,6}(-[0-9]{4})?$",
-                    "description": "Postal/ZIP code format"
-                },
-                "enabled": True
-            })
-        
-        # 18. Custom expression rules - Flexible custom validation
-        if amount_cols and date_cols:
-            amount_col = amount_cols[0]['name']
-            date_col = date_cols[0]['name']
-            rule_templates.append({
-                "rule_id": "r_custom_business_logic",
-                "rule_type": "custom",
-                "category": "data_validity",
-                "target_columns": [amount_col, date_col],
-                "params": {
-                    "expression": f"CASE WHEN {date_col} < SYSDATE - 365 THEN {amount_col} = 0 ELSE 1=1 END",
-                    "description": "Custom business rule: Old records should have zero amount",
-                    "severity": "warning"
-                },
-                "enabled": True
-            })
-        
-        if name_cols and len(name_cols) >= 2:
-            rule_templates.append({
-                "rule_id": "r_custom_name_consistency",
-                "rule_type": "custom",
-                "category": "data_validity",
-                "target_columns": [name_cols[0]['name'], name_cols[1]['name']],
-                "params": {
-                    "expression": f"{name_cols[0]['name']} IS NOT NULL OR {name_cols[1]['name']} IS NOT NULL",
-                    "description": "At least one name field must be populated",
-                    "severity": "error"
-                },
-                "enabled": True
-            })
-        
-        # ===== BUSINESS ENTITY RULES =====
-        # These rules ensure core business objects are well-defined and correctly related
-        
-        # 19. Entity Uniqueness - Every entity must be uniquely identifiable
-        pk_cols = [col for col in all_cols if not col.get('nullable', True) and any(k in col['name'].upper() for k in ['ID', 'KEY', 'CODE'])]
-        for col in pk_cols[:2]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_entity_uniqueness_{col_name.lower()}",
-                "rule_type": "entity_uniqueness",
-                "category": "business_entity",
-                "target_columns": [col_name],
-                "params": {
-                    "check_type": "primary_identifier",
-                    "allow_null": False,
-                    "expression": f"SELECT {col_name}, COUNT(*) FROM {request.table_name} WHERE {col_name} IS NOT NULL GROUP BY {col_name} HAVING COUNT(*) > 1",
-                    "description": f"Every record must have a unique non-null {col_name}"
-                },
-                "enabled": True
-            })
-        
-        # Entity uniqueness for composite keys
-        if customer_cols and account_cols:
-            cust_col = customer_cols[0]['name']
-            acct_col = account_cols[0]['name']
-            rule_templates.append({
-                "rule_id": f"r_entity_uniqueness_composite_{cust_col.lower()}_{acct_col.lower()}",
-                "rule_type": "entity_uniqueness",
-                "category": "business_entity",
-                "target_columns": [cust_col, acct_col],
-                "params": {
-                    "check_type": "composite_key",
-                    "expression": f"SELECT {cust_col}, {acct_col}, COUNT(*) FROM {request.table_name} GROUP BY {cust_col}, {acct_col} HAVING COUNT(*) > 1",
-                    "description": f"Combination of {cust_col} and {acct_col} must be unique"
-                },
-                "enabled": True
-            })
-        
-        # 20. Cardinality Rules - Relationship constraints
-        if fk_cols:
-            for col in fk_cols[:2]:
-                col_name = col['name']
-                # Infer parent table
-                parent_table = None
-                for pattern in ['_ID', '_KEY', '_REF', '_FK']:
-                    if pattern in col_name.upper():
-                        parent_table = col_name.upper().replace(pattern, '')
-                        break
-                
-                if parent_table:
-                    rule_templates.append({
-                        "rule_id": f"r_cardinality_{col_name.lower()}",
-                        "rule_type": "cardinality",
-                        "category": "business_entity",
-                        "target_columns": [col_name],
-                        "params": {
-                            "relationship_type": "many_to_one",
-                            "parent_table": parent_table,
-                            "parent_column": "ID",
-                            "min_occurrences": 0,
-                            "max_occurrences": None,
-                            "expression": f"{col_name} IN (SELECT ID FROM {parent_table})",
-                            "description": f"Many {request.table_name} records can reference one {parent_table} record"
-                        },
-                        "enabled": True
-                    })
-        
-        # 21. Optionality Rules - Mandatory vs optional relationships
-        for col in fk_cols[:2]:
-            col_name = col['name']
-            nullable = col.get('nullable', True)
-            rule_templates.append({
-                "rule_id": f"r_optionality_{col_name.lower()}",
-                "rule_type": "optionality",
-                "category": "business_entity",
-                "target_columns": [col_name],
-                "params": {
-                    "relationship_mandatory": not nullable,
-                    "allow_null": nullable,
-                    "expression": f"{col_name} IS NOT NULL" if not nullable else f"1=1",
-                    "description": f"Relationship via {col_name} is {'mandatory' if not nullable else 'optional'}"
-                },
-                "enabled": True
-            })
-        
-        # ===== BUSINESS ATTRIBUTE RULES =====
-        # Focus on individual data elements within business entities
-        
-        # 22. Data Inheritance - Attributes consistent across subtypes
-        if account_cols:
-            for col in account_cols[:1]:
-                col_name = col['name']
-                rule_templates.append({
-                    "rule_id": f"r_data_inheritance_{col_name.lower()}",
-                    "rule_type": "data_inheritance",
-                    "category": "business_attribute",
-                    "target_columns": [col_name],
-                    "params": {
-                        "supertype": "ACCOUNT",
-                        "subtypes": ["CHECKING", "SAVINGS", "LOAN"],
-                        "inherited_attribute": col_name,
-                        "consistency_check": "format_and_length",
-                        "expression": f"LENGTH({col_name}) = (SELECT MAX(LENGTH({col_name})) FROM {request.table_name})",
-                        "description": f"{col_name} format must be consistent across all account types"
-                    },
-                    "enabled": True
-                })
-        
-        # 23. Data Domain Rules - Values conform to allowed formats/ranges
-        # State code domain
-        for col in state_code_cols[:1]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_data_domain_{col_name.lower()}",
-                "rule_type": "data_domain",
-                "category": "business_attribute",
-                "target_columns": [col_name],
-                "params": {
-                    "domain_type": "state_code",
-                    "allowed_values": ["AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY", "DC"],
-                    "expression": f"UPPER({col_name}) IN ('AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA', 'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD', 'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ', 'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC', 'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC')",
-                    "description": f"{col_name} must be a valid US state abbreviation"
-                },
-                "enabled": True
-            })
-        
-        # Age domain (0-120)
-        for col in age_cols[:1]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_data_domain_{col_name.lower()}",
-                "rule_type": "data_domain",
-                "category": "business_attribute",
-                "target_columns": [col_name],
-                "params": {
-                    "domain_type": "numeric_range",
-                    "min_value": 0,
-                    "max_value": 120,
-                    "expression": f"{col_name} BETWEEN 0 AND 120",
-                    "description": f"{col_name} must be between 0 and 120"
-                },
-                "enabled": True
-            })
-        
-        # Rate/percentage domain (0-100 or 0-1)
-        for col in rate_cols[:2]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_data_domain_{col_name.lower()}",
-                "rule_type": "data_domain",
-                "category": "business_attribute",
-                "target_columns": [col_name],
-                "params": {
-                    "domain_type": "percentage",
-                    "min_value": 0,
-                    "max_value": 100,
-                    "expression": f"{col_name} BETWEEN 0 AND 100",
-                    "description": f"{col_name} must be a valid percentage (0-100)"
-                },
-                "enabled": True
-            })
-        
-        # Date format domain
-        date_string_cols_domain = [col for col in text_cols if any(k in col['name'].upper() for k in ['DATE', 'DOB', 'BIRTH'])]
-        for col in date_string_cols_domain[:1]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_data_domain_date_{col_name.lower()}",
-                "rule_type": "data_domain",
-                "category": "business_attribute",
-                "target_columns": [col_name],
-                "params": {
-                    "domain_type": "date_format",
-                    "format": "CCYY/MM/DD",
-                    "pattern": "^[0-9]{4}/[0-9]{2}/[0-9]{2}$",
-                    "expression": f"REGEXP_LIKE({col_name}, '^[0-9]{{4}}/[0-9]{{2}}/[0-9]{{2}}$')",
-                    "description": f"{col_name} must follow CCYY/MM/DD format"
-                },
-                "enabled": True
-            })
-        
-        # ===== DATA DEPENDENCY RULES =====
-        # Define logical and conditional relationships
-        
-        # 24. Entity Relationship Dependency - Existence depends on conditions
-        if status_cols and fk_cols:
-            status_col = status_cols[0]['name']
-            fk_col = fk_cols[0]['name']
-            rule_templates.append({
-                "rule_id": f"r_entity_rel_dependency_{fk_col.lower()}",
-                "rule_type": "entity_relationship_dependency",
-                "category": "data_dependency",
-                "target_columns": [fk_col, status_col],
-                "params": {
-                    "dependency_type": "conditional_existence",
-                    "condition": f"{status_col} NOT IN ('Delinquent', 'Suspended', 'Blocked')",
-                    "expression": f"CASE WHEN {status_col} IN ('Delinquent', 'Suspended', 'Blocked') THEN {fk_col} IS NULL ELSE 1=1 END",
-                    "description": f"New relationships via {fk_col} cannot be created for records with Delinquent/Suspended/Blocked status"
-                },
-                "enabled": True
-            })
-        
-        # 25. Attribute Dependency - Value depends on other attributes
-        # Loan amount dependency
-        if loan_cols and status_cols:
-            loan_col = loan_cols[0]['name']
-            status_col = status_cols[0]['name']
-            rule_templates.append({
-                "rule_id": f"r_attr_dependency_{loan_col.lower()}_status",
-                "rule_type": "attribute_dependency",
-                "category": "data_dependency",
-                "target_columns": [loan_col, status_col],
-                "params": {
-                    "dependency_type": "conditional_value",
-                    "condition": f"{status_col} = 'Funded'",
-                    "required_value": f"{loan_col} > 0",
-                    "expression": f"CASE WHEN {status_col} = 'Funded' THEN {loan_col} > 0 ELSE 1=1 END",
-                    "description": f"If {status_col} is 'Funded', then {loan_col} must be greater than 0"
-                },
-                "enabled": True
-            })
-        
-        # Calculated field dependency (Pay = Hours * Rate)
-        hours_cols = [col for col in numeric_cols if any(k in col['name'].upper() for k in ['HOURS', 'HRS', 'WORKED'])]
-        pay_cols = [col for col in numeric_cols if any(k in col['name'].upper() for k in ['PAY', 'WAGE', 'SALARY'])]
-        if hours_cols and rate_cols and pay_cols:
-            hours_col = hours_cols[0]['name']
-            rate_col = rate_cols[0]['name']
-            pay_col = pay_cols[0]['name']
-            rule_templates.append({
-                "rule_id": f"r_attr_dependency_calculated_{pay_col.lower()}",
-                "rule_type": "attribute_dependency",
-                "category": "data_dependency",
-                "target_columns": [pay_col, hours_col, rate_col],
-                "params": {
-                    "dependency_type": "calculated",
-                    "formula": f"{pay_col} = {hours_col} * {rate_col}",
-                    "tolerance": 0.01,
-                    "expression": f"ABS({pay_col} - ({hours_col} * {rate_col})) < 0.01",
-                    "description": f"{pay_col} should equal {hours_col} multiplied by {rate_col}"
-                },
-                "enabled": True
-            })
-        
-        # Mutual exclusion dependency (salary vs commission)
-        salary_cols = [col for col in numeric_cols if 'SALARY' in col['name'].upper()]
-        commission_cols = [col for col in numeric_cols if 'COMMISSION' in col['name'].upper()]
-        if salary_cols and commission_cols:
-            salary_col = salary_cols[0]['name']
-            commission_col = commission_cols[0]['name']
-            rule_templates.append({
-                "rule_id": f"r_attr_dependency_mutual_exclusion",
-                "rule_type": "attribute_dependency",
-                "category": "data_dependency",
-                "target_columns": [salary_col, commission_col],
-                "params": {
-                    "dependency_type": "mutual_exclusion",
-                    "expression": f"NOT ({salary_col} > 0 AND {commission_col} > 0)",
-                    "description": f"If {salary_col} > 0, then {commission_col} must be NULL or 0 (mutually exclusive)"
-                },
-                "enabled": True
-            })
-        
-        # 26. Cross-field validation
-        if len(date_cols) >= 2:
-            start_date_cols = [col for col in date_cols if any(k in col['name'].upper() for k in ['START', 'BEGIN', 'FROM', 'OPEN', 'CREATED'])]
-            end_date_cols = [col for col in date_cols if any(k in col['name'].upper() for k in ['END', 'CLOSE', 'TO', 'COMPLETED', 'EXPIRY'])]
-            if start_date_cols and end_date_cols:
-                start_col = start_date_cols[0]['name']
-                end_col = end_date_cols[0]['name']
-                rule_templates.append({
-                    "rule_id": f"r_cross_field_{start_col.lower()}_{end_col.lower()}",
-                    "rule_type": "cross_field_validation",
-                    "category": "data_dependency",
-                    "target_columns": [start_col, end_col],
-                    "params": {
-                        "validation_type": "date_sequence",
-                        "expression": f"{start_col} <= {end_col}",
-                        "description": f"{start_col} must be on or before {end_col}"
-                    },
-                    "enabled": True
-                })
-        
-        # ===== DATA VALIDITY RULES =====
-        # Ensure data is complete, correct, accurate, precise, unique, and consistent
-        
-        # 27. Completeness - Required records/attributes must exist
-        mandatory_biz_cols = [col for col in all_cols if not col.get('nullable', True)]
-        for col in mandatory_biz_cols[:3]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_completeness_{col_name.lower()}",
-                "rule_type": "completeness",
-                "category": "data_validity",
-                "target_columns": [col_name],
-                "params": {
-                    "check_type": "not_null",
-                    "expression": f"{col_name} IS NOT NULL",
-                    "description": f"{col_name} is a required field and must not be NULL"
-                },
-                "enabled": True
-            })
-        
-        # 28. Correctness & Accuracy - Values reflect real-world truth
-        if amount_cols:
-            for col in amount_cols[:1]:
-                col_name = col['name']
-                rule_templates.append({
-                    "rule_id": f"r_correctness_{col_name.lower()}",
-                    "rule_type": "correctness_accuracy",
-                    "category": "data_validity",
-                    "target_columns": [col_name],
-                    "params": {
-                        "validation_type": "business_reasonableness",
-                        "min_value": 0,
-                        "max_value": 999999999,
-                        "expression": f"{col_name} >= 0 AND {col_name} <= 999999999",
-                        "description": f"{col_name} must be a reasonable positive value within business limits"
-                    },
-                    "enabled": True
-                })
-        
-        # 29. Precision - Data stored with required detail level
-        for col in rate_cols[:1]:
-            col_name = col['name']
-            precision = col.get('precision', 10)
-            scale = col.get('scale', 4)
-            rule_templates.append({
-                "rule_id": f"r_precision_{col_name.lower()}",
-                "rule_type": "precision",
-                "category": "data_validity",
-                "target_columns": [col_name],
-                "params": {
-                    "required_precision": precision,
-                    "required_scale": scale,
-                    "decimal_places": 4,
-                    "expression": f"LENGTH(SUBSTR(TO_CHAR({col_name}), INSTR(TO_CHAR({col_name}), '.') + 1)) <= {scale}",
-                    "description": f"{col_name} must be stored with up to {scale} decimal places precision"
-                },
-                "enabled": True
-            })
-        
-        # 30. Consistency - Duplicate/redundant data must match
-        if name_cols and len(name_cols) >= 3:
-            # Full name should match first + middle + last
-            full_name_cols = [col for col in name_cols if 'FULL' in col['name'].upper()]
-            first_name_cols = [col for col in name_cols if 'FIRST' in col['name'].upper()]
-            last_name_cols = [col for col in name_cols if 'LAST' in col['name'].upper()]
-            if full_name_cols and first_name_cols and last_name_cols:
-                full_col = full_name_cols[0]['name']
-                first_col = first_name_cols[0]['name']
-                last_col = last_name_cols[0]['name']
-                rule_templates.append({
-                    "rule_id": f"r_consistency_name",
-                    "rule_type": "consistency",
-                    "category": "data_validity",
-                    "target_columns": [full_col, first_col, last_col],
-                    "params": {
-                        "consistency_type": "derived_value",
-                        "expression": f"UPPER({full_col}) LIKE '%' || UPPER({first_col}) || '%' AND UPPER({full_col}) LIKE '%' || UPPER({last_col}) || '%'",
-                        "description": f"{full_col} must contain both {first_col} and {last_col}"
-                    },
-                    "enabled": True
-                })
-        
-        # 31. Compliance - PII and sensitive data validation
-        for col in pii_cols[:3]:
-            col_name = col['name']
-            col_upper = col['name'].upper()
-            
-            if 'SSN' in col_upper:
-                rule_templates.append({
-                    "rule_id": f"r_compliance_ssn_{col_name.lower()}",
-                    "rule_type": "compliance",
-                    "category": "data_validity",
-                    "target_columns": [col_name],
-                    "params": {
-                        "pii_type": "SSN",
-                        "format_pattern": "^[0-9]{3}-[0-9]{2}-[0-9]{4}$|^[0-9]{9}$",
-                        "masking_required": True,
-                        "expression": f"REGEXP_LIKE({col_name}, '^[0-9]{{3}}-[0-9]{{2}}-[0-9]{{4}}$') OR REGEXP_LIKE({col_name}, '^[0-9]{{9}}$')",
-                        "description": f"{col_name} must be a valid SSN format (XXX-XX-XXXX or 9 digits)"
-                    },
-                    "enabled": True
-                })
-            elif 'PASSPORT' in col_upper:
-                rule_templates.append({
-                    "rule_id": f"r_compliance_passport_{col_name.lower()}",
-                    "rule_type": "compliance",
-                    "category": "data_validity",
-                    "target_columns": [col_name],
-                    "params": {
-                        "pii_type": "PASSPORT",
-                        "format_pattern": "^[A-Z]{1,2}[0-9]{6,9}$",
-                        "masking_required": True,
-                        "expression": f"REGEXP_LIKE(UPPER({col_name}), '^[A-Z]{{1,2}}[0-9]{{6,9}}$')",
-                        "description": f"{col_name} must be a valid passport number format"
-                    },
-                    "enabled": True
-                })
-            elif 'CREDIT_CARD' in col_upper or 'CARD_NUM' in col_upper:
-                rule_templates.append({
-                    "rule_id": f"r_compliance_creditcard_{col_name.lower()}",
-                    "rule_type": "compliance",
-                    "category": "data_validity",
-                    "target_columns": [col_name],
-                    "params": {
-                        "pii_type": "CREDIT_CARD",
-                        "format_pattern": "^[0-9]{13,19}$",
-                        "masking_required": True,
-                        "luhn_check": True,
-                        "expression": f"REGEXP_LIKE({col_name}, '^[0-9]{{13,19}}$')",
-                        "description": f"{col_name} must be a valid credit card number (13-19 digits)"
-                    },
-                    "enabled": True
-                })
-            elif 'BANK_ACCOUNT' in col_upper or 'ACCOUNT_NO' in col_upper:
-                rule_templates.append({
-                    "rule_id": f"r_compliance_bankaccount_{col_name.lower()}",
-                    "rule_type": "compliance",
-                    "category": "data_validity",
-                    "target_columns": [col_name],
-                    "params": {
-                        "pii_type": "BANK_ACCOUNT",
-                        "format_pattern": "^[0-9]{8,17}$",
-                        "masking_required": True,
-                        "expression": f"REGEXP_LIKE({col_name}, '^[0-9]{{8,17}}$')",
-                        "description": f"{col_name} must be a valid bank account number (8-17 digits)"
-                    },
-                    "enabled": True
-                })
-            elif 'TAX_ID' in col_upper or 'NATIONAL_ID' in col_upper:
-                rule_templates.append({
-                    "rule_id": f"r_compliance_taxid_{col_name.lower()}",
-                    "rule_type": "compliance",
-                    "category": "data_validity",
-                    "target_columns": [col_name],
-                    "params": {
-                        "pii_type": "TAX_ID",
-                        "format_pattern": "^[0-9]{9,15}$",
-                        "masking_required": True,
-                        "expression": f"REGEXP_LIKE(TO_CHAR({col_name}), '^[0-9]{{9,15}}$')",
-                        "description": f"{col_name} must be a valid tax/national ID format"
-                    },
-                    "enabled": True
-                })
-        
-        # Remove duplicates based on rule_id
-        seen_ids = set()
-        unique_templates = []
-        for rule in rule_templates:
-            if rule['rule_id'] not in seen_ids:
-                seen_ids.add(rule['rule_id'])
-                unique_templates.append(rule)
-        
-        # If we have fewer templates than requested, add generic ones
-        if len(unique_templates) < num_rules and all_cols:
-            remaining = num_rules - len(unique_templates)
-            for i, col in enumerate(all_cols[:remaining]):
-                if f"r_not_null_{col['name'].lower()}" not in seen_ids:
-                    unique_templates.append({
-                        "rule_id": f"r_not_null_{col['name'].lower()}",
-                        "rule_type": "mandatory",
-                        "target_columns": [col['name']],
-                        "enabled": True
-                    })
-        
-        # Select requested number of rules
-        if len(unique_templates) > num_rules:
-            rules = random.sample(unique_templates, num_rules)
-        else:
-            rules = unique_templates[:num_rules]
-        
-        # Calculate category summary
-        category_summary = {
-            "business_entity_rules": len([r for r in rules if r.get('category') == 'business_entity']),
-            "business_attribute_rules": len([r for r in rules if r.get('category') == 'business_attribute']),
-            "data_dependency_rules": len([r for r in rules if r.get('category') == 'data_dependency']),
-            "data_validity_rules": len([r for r in rules if r.get('category') == 'data_validity']),
-            "uncategorized_rules": len([r for r in rules if not r.get('category')])
-        }
-        
-        # Convert to DQRuleInfo objects
-        dq_rules = [
-            DQRuleInfo(
-                rule_id=rule['rule_id'],
-                rule_type=rule['rule_type'],
-                category=rule.get('category'),
-                target_columns=rule['target_columns'],
-                params=rule.get('params'),
-                enabled=rule['enabled']
-            )
-            for rule in rules
-        ]
-        
-        return APIResponse(
-            success=True,
-            data=DQRulesResponse(
-                rule_set_id=f"dq_{request.table_name.lower()}",
-                table_name=request.table_name,
-                database_name=database_name,
-                total_rules=len(dq_rules),
-                rule_category_summary=category_summary,
-                rules=dq_rules
-            )
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error generating DQ rules: {str(e)}")
-
-
-@router.post("/{database_name}/dq-rules/validate", response_model=APIResponse)
-async def apply_dq_rules(
-    database_name: str,
-    request: ApplyDQRulesRequest,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Apply data quality rules to validate table data and optionally store results.
-    
-    Executes the specified DQ rules against the table, calculates pass/fail statistics,
-    and stores validation results in DQ_VALIDATION_RESULTS table.
-    
-    Args:
-        database_name: Name of the database containing the table
-        request: Validation request with table_name, rules, store_results, sample_percent
-        
-    Returns:
-        JSON with validation_run_id, overall status, pass rates, and detailed results per rule.
-        Results include: total_rows, passed_rows, failed_rows, pass_rate, sample_failures.
-    
-    Storage Table Schema (DQ_VALIDATION_RESULTS):
-        - VALIDATION_RUN_ID: Unique identifier for validation run
-        - RULE_ID: Rule identifier
-        - RULE_TYPE: Type of rule (mandatory, format, etc.)
-        - RULE_CATEGORY: Category of rule
-        - TABLE_NAME: Validated table name
-        - TARGET_COLUMNS: Columns being validated
-        - TOTAL_ROWS: Total rows checked
-        - PASSED_ROWS: Rows that passed
-        - FAILED_ROWS: Rows that failed
-        - PASS_RATE: Pass percentage (0-100)
-        - STATUS: PASSED, FAILED, or ERROR
-        - ERROR_MESSAGE: Error details if STATUS is ERROR
-        - EXECUTED_AT: Timestamp of validation
-        - SAMPLE_FAILURES: CLOB with sample failed rows (JSON)
-    """
-    import json
-    import time
-    import uuid
-    from datetime import datetime
-    
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    try:
-        rules = request.rules
-        if not rules or len(rules) == 0:
-            raise HTTPException(status_code=400, detail="No rules provided for validation")
-        validation_run_id = f"vr_{uuid.uuid4().hex[:12]}"
-        validation_timestamp = datetime.now().isoformat()
-        # --- Write mode override logic ---
-        storage_warning = None
-        can_store = request.store_results
-        original_read_only = True
-        connector = None
-        if request.store_results:
-            try:
-                if hasattr(db_context, 'db_connector'):
-                    connector = db_context.db_connector
-                    original_read_only = getattr(connector, 'read_only', True)
-                    if original_read_only:
-                        print(f"[DQ Storage] Temporarily enabling write mode for storing rules and results", file=sys.stderr)
-                        connector.read_only = False
-                else:
-                    storage_warning = "Could not access database connector to enable write mode"
-                    can_store = False
-                
-            except Exception as e:
-                storage_warning = f"Could not configure write mode: {str(e)}"
-                can_store = False
-        sample_clause = ""
-        if request.sample_percent and 1 <= request.sample_percent <= 100:
-            sample_clause = f" SAMPLE({request.sample_percent})"
-        # --- Create storage tables if needed ---
-        storage_table = "DQ_VALIDATION_RESULTS"
-        rules_table = "DQ_RULES_STORE"
-        if can_store:
-            try:
-                # Create DQ_RULES_STORE table
-                create_rules_table_sql = f"""
-                DECLARE
-                    table_exists NUMBER;
-                BEGIN
-                    SELECT COUNT(*) INTO table_exists FROM user_tables WHERE table_name = '{rules_table}';
-                    IF table_exists = 0 THEN
-                        EXECUTE IMMEDIATE '
-                            CREATE TABLE {rules_table} (
-                                RULE_ID VARCHAR2(100) NOT NULL,
-                                RULE_TYPE VARCHAR2(50),
-                                RULE_CATEGORY VARCHAR2(50),
-                                TABLE_NAME VARCHAR2(128),
-                                TARGET_COLUMNS VARCHAR2(500),
-                                PARAMS CLOB,
-                                ENABLED NUMBER(1) DEFAULT 1,
-                                CREATED_AT TIMESTAMP DEFAULT SYSTIMESTAMP,
-                                UPDATED_AT TIMESTAMP DEFAULT SYSTIMESTAMP,
-                                CONSTRAINT PK_DQ_RULES_STORE PRIMARY KEY (RULE_ID)
-                            )
-                        ';
-                    END IF;
-                END;
-                """
-                await db_context.run_sql_query(create_rules_table_sql)
-                # Create DQ_VALIDATION_RESULTS table
-                create_table_sql = f"""
-                DECLARE
-                    table_exists NUMBER;
-                BEGIN
-                    SELECT COUNT(*) INTO table_exists FROM user_tables WHERE table_name = '{storage_table}';
-                    IF table_exists = 0 THEN
-                        EXECUTE IMMEDIATE '
-                            CREATE TABLE {storage_table} (
-                                VALIDATION_RUN_ID VARCHAR2(50) NOT NULL,
-                                RULE_ID VARCHAR2(100) NOT NULL,
-                                RULE_TYPE VARCHAR2(50),
-                                RULE_CATEGORY VARCHAR2(50),
-                                TABLE_NAME VARCHAR2(128) NOT NULL,
-                                TARGET_COLUMNS VARCHAR2(500),
-                                TOTAL_ROWS NUMBER DEFAULT 0,
-                                PASSED_ROWS NUMBER DEFAULT 0,
-                                FAILED_ROWS NUMBER DEFAULT 0,
-                                PASS_RATE NUMBER(5,2) DEFAULT 0,
-                                STATUS VARCHAR2(20) NOT NULL,
-                                ERROR_MESSAGE VARCHAR2(4000),
-                                EXECUTED_AT TIMESTAMP DEFAULT SYSTIMESTAMP,
-                                SAMPLE_FAILURES CLOB,
-                                CONSTRAINT PK_DQ_VALIDATION_RESULTS PRIMARY KEY (VALIDATION_RUN_ID, RULE_ID)
-                            )
-                        ';
-                    END IF;
-                END;
-                """
-                await db_context.run_sql_query(create_table_sql)
-            except Exception as e:
-                can_store = False
-                storage_warning = f"Could not create/access storage table: {str(e)}"
-        
-        # Helper function to build validation SQL based on rule type
-        def build_validation_sql(rule, table, sample_clause):
-            rule_type = rule.rule_type.lower() if rule.rule_type else 'unknown'
-            target_cols = rule.target_columns or []
-            params = rule.params or {}
-            
-            if not target_cols:
-                return None, None, "No target columns specified"
-            
-            col = target_cols[0]  # Primary column
-            cols_str = ', '.join(target_cols)
-            
-            # Total count SQL
-            total_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause}"
-            
-            # Failed count SQL based on rule type
-            if rule_type in ('mandatory', 'completeness'):
-                failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NULL"
-                sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NULL AND ROWNUM <= 5"
-                
-            elif rule_type in ('empty_blank',):
-                failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NULL OR TRIM({col}) IS NULL OR LENGTH(TRIM({col})) = 0"
-                sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE ({col} IS NULL OR TRIM({col}) IS NULL OR LENGTH(TRIM({col})) = 0) AND ROWNUM <= 5"
-                
-            elif rule_type in ('uniqueness', 'entity_uniqueness'):
-                failed_sql = f"SELECT COUNT(*) as cnt FROM (SELECT {col} FROM {table}{sample_clause} GROUP BY {col} HAVING COUNT(*) > 1)"
-                sample_sql = f"SELECT {col}, COUNT(*) as dup_count FROM {table}{sample_clause} GROUP BY {col} HAVING COUNT(*) > 1 FETCH FIRST 5 ROWS ONLY"
-                
-            elif rule_type == 'duplicate_rows':
-                if len(target_cols) > 1:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM (SELECT {cols_str} FROM {table}{sample_clause} GROUP BY {cols_str} HAVING COUNT(*) > 1)"
-                    sample_sql = f"SELECT {cols_str}, COUNT(*) as dup_count FROM {table}{sample_clause} GROUP BY {cols_str} HAVING COUNT(*) > 1 FETCH FIRST 5 ROWS ONLY"
-                else:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM (SELECT {col} FROM {table}{sample_clause} GROUP BY {col} HAVING COUNT(*) > 1)"
-                    sample_sql = f"SELECT {col}, COUNT(*) as dup_count FROM {table}{sample_clause} GROUP BY {col} HAVING COUNT(*) > 1 FETCH FIRST 5 ROWS ONLY"
-                    
-            elif rule_type in ('format', 'string_format_match', 'compliance'):
-                pattern = params.get('pattern', params.get('format_pattern', '.*'))
-                pattern = pattern.replace("'", "''")
-                failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND NOT REGEXP_LIKE({col}, '{pattern}')"
-                sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND NOT REGEXP_LIKE({col}, '{pattern}') AND ROWNUM <= 5"
-                
-            elif rule_type == 'value_in_list':
-                allowed = params.get('allowed_values', [])
-                if allowed:
-                    values_str = ', '.join([f"'{v}'" for v in allowed])
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND {col} NOT IN ({values_str})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND {col} NOT IN ({values_str}) AND ROWNUM <= 5"
-                else:
-                    return None, None, "No allowed_values specified"
-                    
-            elif rule_type in ('data_domain',):
-                expression = params.get('expression', '')
-                if expression:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND NOT ({expression})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND NOT ({expression}) AND ROWNUM <= 5"
-                else:
-                    min_val = params.get('min_value')
-                    max_val = params.get('max_value')
-                    if min_val is not None and max_val is not None:
-                        failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND ({col} < {min_val} OR {col} > {max_val})"
-                        sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND ({col} < {min_val} OR {col} > {max_val}) AND ROWNUM <= 5"
-                    else:
-                        return None, None, "No expression or min/max values specified"
-                        
-            elif rule_type in ('expression', 'cross_field_validation', 'attribute_dependency', 'correctness_accuracy', 'data_inheritance'):
-                expression = params.get('expression', '')
-                if expression:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE NOT ({expression})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE NOT ({expression}) AND ROWNUM <= 5"
-                else:
-                    return None, None, "No expression specified"
-                    
-            elif rule_type == 'freshness':
-                max_days = params.get('max_age_days', 30)
-                failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND {col} < SYSDATE - {max_days}"
-                sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND {col} < SYSDATE - {max_days} AND ROWNUM <= 5"
-                
-            elif rule_type == 'data_type_match':
-                expression = params.get('expression', '')
-                if expression:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND NOT ({expression})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND NOT ({expression}) AND ROWNUM <= 5"
-                else:
-                    return None, None, "No expression specified for data_type_match"
-                    
-            elif rule_type == 'table_lookup':
-                lookup_table = params.get('lookup_table', '')
-                lookup_col = params.get('lookup_column', 'ID')
-                if lookup_table:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND {col} NOT IN (SELECT {lookup_col} FROM {lookup_table})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND {col} NOT IN (SELECT {lookup_col} FROM {lookup_table}) AND ROWNUM <= 5"
-                else:
-                    return None, None, "No lookup_table specified"
-                    
-            elif rule_type == 'cardinality':
-                parent_table = params.get('parent_table', '')
-                parent_col = params.get('parent_column', 'ID')
-                if parent_table:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND {col} NOT IN (SELECT {parent_col} FROM {parent_table})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND {col} NOT IN (SELECT {parent_col} FROM {parent_table}) AND ROWNUM <= 5"
-                else:
-                    return None, None, "No parent_table specified"
-                    
-            elif rule_type == 'optionality':
-                if not params.get('allow_null', True):
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NULL"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NULL AND ROWNUM <= 5"
-                else:
-                    failed_sql = f"SELECT 0 as cnt FROM DUAL"
-                    sample_sql = None
-                    
-            elif rule_type == 'conditional_mandatory':
-                condition = params.get('condition', '')
-                if condition:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE ({condition}) AND {col} IS NULL"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE ({condition}) AND {col} IS NULL AND ROWNUM <= 5"
-                else:
-                    return None, None, "No condition specified"
-                    
-            elif rule_type in ('precision',):
-                scale = params.get('required_scale', params.get('decimal_places', 4))
-                failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND LENGTH(SUBSTR(TO_CHAR({col}), INSTR(TO_CHAR({col}), '.') + 1)) > {scale}"
-                sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND LENGTH(SUBSTR(TO_CHAR({col}), INSTR(TO_CHAR({col}), '.') + 1)) > {scale} AND ROWNUM <= 5"
-                
-            elif rule_type == 'consistency':
-                expression = params.get('expression', '')
-                if expression:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE NOT ({expression})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE NOT ({expression}) AND ROWNUM <= 5"
-                else:
-                    return None, None, "No expression specified for consistency check"
-                    
-            elif rule_type == 'custom':
-                expression = params.get('expression', '')
-                if expression:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE NOT ({expression})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE NOT ({expression}) AND ROWNUM <= 5"
-                else:
-                    return None, None, "No expression specified for custom rule"
-                    
-            elif rule_type == 'entity_relationship_dependency':
-                expression = params.get('expression', '')
-                if expression:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE NOT ({expression})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE NOT ({expression}) AND ROWNUM <= 5"
-                else:
-                    return None, None, "No expression specified"
-                    
-            else:
-                expression = params.get('expression', '')
-                if expression:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE NOT ({expression})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE NOT ({expression}) AND ROWNUM <= 5"
-                else:
-                    return None, None, f"Unsupported rule type: {rule_type}"
-            
-            return total_sql, failed_sql, sample_sql
-        
-        # Execute validation for each rule
-        results = []
-        rules_passed = 0
-        rules_failed = 0
-        rules_errored = 0
-        total_pass_rate = 0.0
-        
-        for rule in rules:
-            rule_id = rule.rule_id
-            rule_type = rule.rule_type
-            category = rule.category
-            target_cols = rule.target_columns or []
-            params = rule.params or {}
-            start_time = time.time()
-            try:
-                # Store rule definition first
-                if can_store:
-                    try:
-                        params_json = json.dumps(params) if params else None
-                        merge_rule_sql = f"""
-                        MERGE INTO {rules_table} dest
-                        USING (SELECT '{rule_id}' as RULE_ID FROM DUAL) src
-                        ON (dest.RULE_ID = src.RULE_ID)
-                        WHEN MATCHED THEN
-                            UPDATE SET 
-                                RULE_TYPE = '{rule_type}',
-                                RULE_CATEGORY = {f"'{category}'" if category else 'NULL'},
-                                TABLE_NAME = '{request.table_name}',
-                                TARGET_COLUMNS = '{','.join(target_cols)}',
-                                PARAMS = {f"'{params_json}'" if params_json else 'NULL'},
-                                UPDATED_AT = SYSTIMESTAMP
-                        WHEN NOT MATCHED THEN
-                            INSERT (RULE_ID, RULE_TYPE, RULE_CATEGORY, TABLE_NAME, TARGET_COLUMNS, PARAMS, ENABLED, CREATED_AT, UPDATED_AT)
-                            VALUES ('{rule_id}', '{rule_type}', {f"'{category}'" if category else 'NULL'}, '{request.table_name}', '{','.join(target_cols)}', {f"'{params_json}'" if params_json else 'NULL'}, 1, SYSTIMESTAMP, SYSTIMESTAMP)
-                        """
-                        await db_context.run_sql_query(merge_rule_sql)
-                    except Exception as rule_store_err:
-                        if not storage_warning:
-                            storage_warning = f"Could not store some rules: {str(rule_store_err)}"
-                total_sql, failed_sql, sample_sql = build_validation_sql(rule, request.table_name, sample_clause)
-                if total_sql is None:
-                    error_msg = failed_sql if failed_sql else sample_sql
-                    results.append(DQValidationResultInfo(
-                        rule_id=rule_id,
-                        rule_type=rule_type,
-                        category=category,
-                        target_columns=target_cols,
-                        status="ERROR",
-                        total_rows=0,
-                        passed_rows=0,
-                        failed_rows=0,
-                        pass_rate=0.0,
-                        error_message=error_msg,
-                        sample_failures=None,
-                        execution_time_ms=(time.time() - start_time) * 1000
-                    ))
-                    rules_errored += 1
-                    continue
-                total_result = await db_context.run_sql_query(total_sql)
-                total_rows = total_result.get('rows', [{}])[0].get('CNT', 0) if total_result.get('rows') else 0
-                failed_result = await db_context.run_sql_query(failed_sql)
-                failed_rows = failed_result.get('rows', [{}])[0].get('CNT', 0) if failed_result.get('rows') else 0
-                passed_rows = total_rows - failed_rows
-                pass_rate = (passed_rows / total_rows * 100) if total_rows > 0 else 100.0
-                sample_failures = None
-                if failed_rows > 0 and sample_sql:
-                    try:
-                        sample_result = await db_context.run_sql_query(sample_sql)
-                        sample_failures = sample_result.get('rows', [])[:5]
-                    except:
-                        pass
-                status = "PASSED" if failed_rows == 0 else "FAILED"
-                if status == "PASSED":
-                    rules_passed += 1
-                else:
-                    rules_failed += 1
-                total_pass_rate += pass_rate
-                execution_time = (time.time() - start_time) * 1000
-                result_entry = DQValidationResultInfo(
-                    rule_id=rule_id,
-                    rule_type=rule_type,
-                    category=category,
-                    target_columns=target_cols,
-                    status=status,
-                    total_rows=total_rows,
-                    passed_rows=passed_rows,
-                    failed_rows=failed_rows,
-                    pass_rate=round(pass_rate, 2),
-                    error_message=None,
-                    sample_failures=sample_failures,
-                    execution_time_ms=round(execution_time, 2)
-                )
-                results.append(result_entry)
-                # Store validation result
-                if can_store:
-                    try:
-                        sample_json = json.dumps(sample_failures, default=str) if sample_failures else None
-                        if sample_json:
-                            sample_json = sample_json.replace("'", "''")
-                        insert_sql = f"""
-                        INSERT INTO {storage_table} (
-                            VALIDATION_RUN_ID, RULE_ID, RULE_TYPE, RULE_CATEGORY, TABLE_NAME,
-                            TARGET_COLUMNS, TOTAL_ROWS, PASSED_ROWS, FAILED_ROWS, PASS_RATE,
-                            STATUS, ERROR_MESSAGE, EXECUTED_AT, SAMPLE_FAILURES
-                        ) VALUES (
-                            '{validation_run_id}', '{rule_id}', '{rule_type}', 
-                            {f"'{category}'" if category else 'NULL'}, '{request.table_name}',
-                            '{','.join(target_cols)}', {total_rows}, {passed_rows}, {failed_rows}, {round(pass_rate, 2)},
-                            '{status}', NULL, SYSTIMESTAMP, 
-                            {f"'{sample_json}'" if sample_json else 'NULL'}
-                        )
-                        """
-                        await db_context.run_sql_query(insert_sql)
-                    except Exception as store_err:
-                        if not storage_warning:
-                            storage_warning = f"Some results could not be stored: {str(store_err)}"
-            except Exception as e:
-                execution_time = (time.time() - start_time) * 1000
-                results.append(DQValidationResultInfo(
-                    rule_id=rule_id,
-                    rule_type=rule_type,
-                    category=category,
-                    target_columns=target_cols,
-                    status="ERROR",
-                    total_rows=0,
-                    passed_rows=0,
-                    failed_rows=0,
-                    pass_rate=0.0,
-                    error_message=str(e),
-                    sample_failures=None,
-                    execution_time_ms=round(execution_time, 2)
-                ))
-                rules_errored += 1
-        # Restore original read-only mode
-        if connector and original_read_only:
-            try:
-                connector.read_only = True
-            except:
-                pass
-        
-        # Calculate overall status and pass rate
-        total_rules = len(results)
-        overall_pass_rate = (total_pass_rate / total_rules) if total_rules > 0 else 0.0
-        
-        if rules_errored == total_rules:
-            overall_status = "ERROR"
-        elif rules_failed > 0 or rules_errored > 0:
-            overall_status = "FAILED"
-        else:
-            overall_status = "PASSED"
-        
-        return APIResponse(
-            success=True,
-            data=DQValidationResponse(
-                validation_run_id=validation_run_id,
-                table_name=request.table_name,
-                database_name=database_name,
-                validation_timestamp=validation_timestamp,
-                total_rules_applied=total_rules,
-                rules_passed=rules_passed,
-                rules_failed=rules_failed,
-                rules_errored=rules_errored,
-                overall_status=overall_status,
-                overall_pass_rate=round(overall_pass_rate, 2),
-                sample_percent_used=request.sample_percent,
-                results_stored=can_store and not storage_warning,
-                storage_table=storage_table if can_store else None,
-                storage_warning=storage_warning,
-                results=results
-            )
-        )
-        
-    except HTTPException:
-        # Restore read-only mode on HTTP exception
-        if connector and original_read_only:
-            try:
-                connector.read_only = True
-            except:
-                pass
-        raise
-    except Exception as e:
-        # Restore read-only mode on error
-        if connector and original_read_only:
-            try:
-                connector.read_only = True
-            except:
-                pass
-        raise HTTPException(status_code=400, detail=f"Error applying DQ rules: {str(e)}")
 """SQL execution routes - query, write, explain, samples."""
 
+import asyncio
+import hashlib
+import random
+import re
 import sys
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple, Union
+
 import oracledb
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 
 from api.models import (
     APIResponse,
     ExecuteSQLRequest,
+    ExecuteSQLBatchRequest,
+    ExecuteSQLStreamRequest,
     ExecuteWriteSQLRequest,
     ExplainQueryRequest,
     SQLResultResponse,
@@ -1855,30 +33,197 @@ from api.models import (
     DQValidationResultInfo,
     DQValidationResponse,
 )
-from api.dependencies import MultiDBContextDep, get_database_context
-from db_context.schema.formatter import format_sql_query_result
+from api.dependencies import DatabaseContextDep, pin_database_connection
+from api.responses import ORJSONResponse, orjson_default
+from api.sql_cache import sample_clause as build_sample_clause
+from db_context.utils import is_read_statement
 
 router = APIRouter(prefix="/sql", tags=["SQL Execution"])
 
+# Generated DQ rule templates, LRU keyed by (database, table, column metadata hash)
+_DQ_TEMPLATE_CACHE: "OrderedDict[Tuple[str, str, str], List[Dict[str, Any]]]" = OrderedDict()
+_DQ_TEMPLATE_CACHE_SIZE = 500
+
+# Generated sample queries per (database, schema cache version), with their
+# expiry time. The table list is read live, so entries also age out.
+_SAMPLES_CACHE: Dict[Tuple[str, str], Tuple[float, SampleQueriesResponse]] = {}
+_SAMPLES_TTL_SECONDS = 300
+
+# Execution plans as (expiry time, plan), LRU keyed by (database, schema cache
+# version, digest of the statement with whitespace normalized). Plans follow
+# optimizer statistics, so entries also age out.
+_EXPLAIN_CACHE: "OrderedDict[Tuple[str, str, bytes], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_EXPLAIN_CACHE_SIZE = 512
+_EXPLAIN_TTL_SECONDS = 300
+
+# Quoted literals and line comments (with their newline) are kept verbatim;
+# any other whitespace run collapses to a single space
+_SQL_TOKEN_RE = re.compile(r"'(?:[^']|'')*'|\"[^\"]*\"|--[^\n]*\n?|(\s+)")
+
+# Rule types generate_sample_dq_rules can produce, by category
+DQ_RULE_CATALOG: Dict[str, Dict[str, Any]] = {
+    "business_entity": {
+        "description": "Ensure core business objects are well-defined",
+        "rule_types": {
+            "entity_uniqueness": "Every entity must be uniquely identifiable (no duplicate records)",
+            "cardinality": "Defines relationship constraints (one-to-many, many-to-many)",
+            "optionality": "Mandatory vs optional relationship enforcement",
+        },
+    },
+    "business_attribute": {
+        "description": "Individual data element validation",
+        "rule_types": {
+            "data_inheritance": "Attributes consistent across subtypes",
+            "data_domain": "Values conform to allowed formats/ranges (state codes, age ranges)",
+            "format": "Pattern validation (email, phone, date formats)",
+            "value_in_list": "Allowed values validation",
+        },
+    },
+    "data_dependency": {
+        "description": "Logical/conditional relationships",
+        "rule_types": {
+            "entity_relationship_dependency": "Existence depends on conditions",
+            "attribute_dependency": "Value depends on other attributes",
+            "conditional_mandatory": "Dependent field requirements",
+            "cross_field_validation": "Multi-column logical checks",
+        },
+    },
+    "data_validity": {
+        "description": "Ensure data is trustworthy",
+        "rule_types": {
+            "completeness": "Required records, relationships, attributes must exist (mandatory)",
+            "correctness_accuracy": "Values reflect real-world truth",
+            "precision": "Data stored with required detail level",
+            "uniqueness": "No duplicate records, keys, or overloaded columns",
+            "consistency": "Duplicate/redundant data must match everywhere",
+            "compliance": "PII and sensitive data validation (SSN, credit card, passport)",
+            "freshness": "Confirms date values are up to date",
+            "data_type_match": "Values match their data type requirements",
+            "duplicate_rows": "Multi-column duplicate detection",
+            "empty_blank": "Null/empty/whitespace checks",
+            "table_lookup": "Referential integrity (value exists in lookup table)",
+            "expression": "Range and cross-column checks",
+            "custom": "Flexible custom business logic rules",
+        },
+    },
+}
+
+# US state and DC postal codes for the state_code domain rule, and the same
+# list as a SQL IN list. Shared by every generated rule, so immutable.
+_US_STATE_CODES = (
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID", "IL",
+    "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT",
+    "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI",
+    "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY", "DC",
+)
+_US_STATE_CODES_SQL = "(" + ", ".join(f"'{code}'" for code in _US_STATE_CODES) + ")"
+
+# Widest column set DQ rules are generated from; wider tables use their primary
+# key columns first, then other NOT NULL columns, then the rest in declared order
+_DQ_MAX_COLUMNS = 500
+
+# Picks the DQ rules returned when more templates exist than were requested
+_rng = random.Random()
+
+# Sample queries by number, built from the first table's columns (context:
+# table, columns, numeric, others: the columns besides the first numeric one,
+# and leading: the first three columns as a select list). Entries are (level, number, applies, title, description, query); for
+# each number the first entry whose applies is None or true is used.
+_SAMPLE_QUERY_TEMPLATES = (
+    ("Beginner", 1, None, "Select All Records", "Retrieve all columns and rows (limited to 10)",
+     lambda c: f"SELECT * FROM {c.table} WHERE ROWNUM <= 10"),
+    ("Beginner", 2, None, "Select Specific Columns", "Retrieve only specific columns",
+     lambda c: f"SELECT {c.leading} FROM {c.table}"),
+    ("Beginner", 3, lambda c: c.numeric, "Filter with WHERE Clause", "Filter records based on a numeric condition",
+     lambda c: f"SELECT * FROM {c.table} WHERE {c.numeric[0]} > 0"),
+    ("Beginner", 3, None, "Filter with WHERE Clause", "Filter records with ROWNUM",
+     lambda c: f"SELECT * FROM {c.table} WHERE ROWNUM <= 5"),
+    ("Beginner", 4, None, "Sort Results", "Order results by a specific column",
+     lambda c: f"SELECT * FROM {c.table} ORDER BY {c.columns[0]} DESC"),
+    ("Intermediate", 5, None, "Count Records", "Count total number of records",
+     lambda c: f"SELECT COUNT(*) AS total_records FROM {c.table}"),
+    ("Intermediate", 6, lambda c: c.numeric and len(c.columns) > 1, "Group and Aggregate", "Group records and calculate aggregates",
+     lambda c: f"SELECT {c.others[0]}, COUNT(*) AS count, AVG({c.numeric[0]}) AS avg_value FROM {c.table} GROUP BY {c.others[0]} ORDER BY count DESC"),
+    ("Intermediate", 6, None, "Group and Count", "Group records and count",
+     lambda c: f"SELECT {c.columns[0]}, COUNT(*) AS count FROM {c.table} GROUP BY {c.columns[0]} ORDER BY count DESC"),
+    ("Intermediate", 7, None, "Find Distinct Values", "Get unique values from a column",
+     lambda c: f"SELECT DISTINCT {c.columns[0]} FROM {c.table} ORDER BY {c.columns[0]}"),
+    ("Advanced", 8, lambda c: c.numeric, "Subquery - Above Average", "Find records with values above average",
+     lambda c: f"SELECT * FROM {c.table} WHERE {c.numeric[0]} > (SELECT AVG({c.numeric[0]}) FROM {c.table})"),
+    ("Advanced", 8, None, "Subquery - IN clause", "Use subquery in IN clause",
+     lambda c: f"SELECT * FROM {c.table} WHERE {c.columns[0]} IN (SELECT {c.columns[0]} FROM {c.table} WHERE ROWNUM <= 5)"),
+    ("Advanced", 9, lambda c: c.numeric and len(c.columns) > 1, "Window Function - Ranking", "Use window functions for ranking",
+     lambda c: f"SELECT {c.leading}, ROW_NUMBER() OVER (PARTITION BY {c.others[0]} ORDER BY {c.numeric[0]} DESC) AS rank FROM {c.table}"),
+    ("Advanced", 9, None, "Window Function - Row Numbers", "Add row numbers to results",
+     lambda c: f"SELECT {c.leading}, ROW_NUMBER() OVER (ORDER BY {c.columns[0]}) AS row_num FROM {c.table}"),
+    ("Advanced", 10, lambda c: c.numeric, "Statistical Analysis", "Calculate statistical measures",
+     lambda c: f"SELECT COUNT(*) AS total_records, MIN({c.numeric[0]}) AS min_value, MAX({c.numeric[0]}) AS max_value, AVG({c.numeric[0]}) AS avg_value, STDDEV({c.numeric[0]}) AS std_deviation FROM {c.table}"),
+    ("Advanced", 10, None, "Analytical Query", "Use analytical functions",
+     lambda c: f"SELECT {c.columns[0]}, COUNT(*) OVER () AS total_count, ROW_NUMBER() OVER (ORDER BY {c.columns[0]}) AS row_num FROM {c.table} WHERE ROWNUM <= 20"),
+)
+
+# Substrings of the upper-cased column type that put a column in each type
+# group; a column can fall in more than one group
+_TYPE_GROUPS = (
+    ("numeric", re.compile("NUMBER|INT|FLOAT|DECIMAL|NUMERIC")),
+    ("text", re.compile("VARCHAR|CHAR|CLOB|TEXT")),
+    ("date", re.compile("DATE|TIMESTAMP")),
+)
+
+# Column-name keywords that mark DQ rule candidates: category -> (column group
+# searched, pattern matching any keyword in the upper-cased column name)
+_DQ_NAME_PATTERNS = {
+    category: (group, re.compile("|".join(map(re.escape, keywords))))
+    for category, (group, keywords) in {
+        "email": ("text", ['EMAIL', 'MAIL']),
+        "phone": ("text", ['PHONE', 'MOBILE', 'TEL', 'FAX']),
+        "name": ("text", ['NAME', 'FIRST', 'LAST', 'MIDDLE']),
+        "id": ("all", ['ID', 'CODE', 'KEY', 'NUM']),
+        "status": ("text", ['STATUS', 'STATE', 'TYPE', 'FLAG', 'CATEGORY']),
+        "amount": ("numeric", ['AMOUNT', 'PRICE', 'COST', 'INCOME', 'SALARY', 'BALANCE', 'TOTAL']),
+        "address": ("text", ['ADDRESS', 'ADDR', 'STREET', 'CITY', 'STATE', 'ZIP', 'POSTAL', 'COUNTRY']),
+        "state_code": ("text", ['STATE_CODE', 'STATE_CD', 'COUNTRY_CODE', 'COUNTRY_CD']),
+        "age": ("numeric", ['AGE', 'YEARS']),
+        "rate": ("numeric", ['RATE', 'PERCENT', 'PCT', 'RATIO', 'INTEREST', 'COMMISSION']),
+        "account": ("all", ['ACCOUNT', 'ACCT']),
+        "loan": ("all", ['LOAN', 'CREDIT', 'DEBT', 'MORTGAGE']),
+        "customer": ("all", ['CUSTOMER', 'CUST', 'CLIENT']),
+        "pii": ("text", ['SSN', 'PASSPORT', 'NATIONAL_ID', 'TAX_ID', 'CREDIT_CARD', 'BANK_ACCOUNT', 'CVV', 'EXPIRY']),
+        "fk": ("all", ['_ID', '_KEY', '_REF', '_FK', 'PARENT_', 'FOREIGN_']),
+        "date_string": ("text", ['DATE', 'DOB', 'BIRTH', 'CREATED', 'UPDATED', 'MODIFIED']),
+        "date_string_domain": ("text", ['DATE', 'DOB', 'BIRTH']),
+        "surrogate_key": ("all", ['ID', 'KEY', 'SEQ', 'ROWID']),
+        "lookup_key": ("all", ['_ID', '_CODE', '_KEY', '_REF', '_FK']),
+        "entity_key": ("all", ['ID', 'KEY', 'CODE']),
+        "ssn": ("text", ['SSN']),
+        "credit_card": ("text", ['CREDIT_CARD', 'CARD_NUMBER', 'CC_NUM']),
+        "zip": ("text", ['ZIP', 'POSTAL', 'PIN_CODE', 'PINCODE']),
+        "hours": ("numeric", ['HOURS', 'HRS', 'WORKED']),
+        "pay": ("numeric", ['PAY', 'WAGE', 'SALARY']),
+        "salary": ("numeric", ['SALARY']),
+        "commission": ("numeric", ['COMMISSION']),
+        "start_date": ("date", ['START', 'BEGIN', 'FROM', 'OPEN', 'CREATED']),
+        "end_date": ("date", ['END', 'CLOSE', 'TO', 'COMPLETED', 'EXPIRY']),
+    }.items()
+}
+
 
 @router.post("/{database_name}/execute", response_model=APIResponse)
 async def execute_sql(
-    database_name: str,
     request: ExecuteSQLRequest,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
+    db_context: DatabaseContextDep,
+) -> Union[APIResponse, ORJSONResponse]:
     """Execute a SQL query.
     
     Supports SELECT, INSERT, UPDATE, DELETE, and DDL statements.
     In read-only mode (default), only SELECT statements are permitted.
     """
-    db_context = get_database_context(database_name, multi_ctx)
-    
     try:
         result = await db_context.run_sql_query(request.sql, max_rows=request.max_rows)
+        rows = result.get("rows")
         
         # Handle different result types
-        if not result.get("rows"):
+        if not rows:
             return APIResponse(
                 success=True,
                 message=result.get("message", "Query executed successfully"),
@@ -1890,14 +235,91 @@ async def execute_sql(
                 )
             )
         
-        return APIResponse(
-            success=True,
-            data=SQLResultResponse(
-                columns=result.get("columns", []),
-                rows=result.get("rows", []),
-                row_count=len(result.get("rows", [])),
-            )
+        # Row payloads can be large: serialize them directly instead of
+        # validating every row through APIResponse/SQLResultResponse
+        return ORJSONResponse({
+            "success": True,
+            "data": {
+                "columns": result.get("columns", []),
+                "rows": rows,
+                "row_count": len(rows),
+                "message": None,
+            },
+            "message": None,
+            "error": None,
+        })
+    except PermissionError as e:
+        raise HTTPException(
+            status_code=403,
+            detail=f"Permission denied: {str(e)}. Write operations require read_only=False."
         )
+    except oracledb.Error as e:
+        raise HTTPException(status_code=400, detail=f"Database error: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Error executing query: {str(e)}")
+
+
+@router.post(
+    "/{database_name}/execute/batch",
+    response_model=APIResponse,
+    dependencies=[Depends(pin_database_connection)],
+)
+async def execute_sql_batch(
+    request: ExecuteSQLBatchRequest,
+    db_context: DatabaseContextDep,
+) -> ORJSONResponse:
+    """Execute several SQL statements in order on one connection.
+    
+    Saves a request and a pool checkout per statement, and repeated statement
+    texts hit the session's cursor cache. data.results holds one entry per
+    executed statement, in request order. Execution stops at the first failing
+    statement: its error is reported and later statements are not run.
+    The same read-only rules as /execute apply to every statement.
+    """
+    results = []
+    error = None
+    for number, statement in enumerate(request.statements, start=1):
+        try:
+            result = await db_context.run_sql_query(statement.sql, max_rows=statement.max_rows)
+        except (oracledb.Error, PermissionError, ValueError) as e:
+            error = f"Statement {number} failed: {str(e)}"
+            break
+        rows = result.get("rows") or []
+        results.append({
+            "columns": result.get("columns", []),
+            "rows": rows,
+            "row_count": len(rows) if rows else result.get("row_count", 0),
+            "message": None if rows else result.get("message"),
+        })
+    
+    # Row payloads are serialized directly, as in execute_sql
+    return ORJSONResponse({
+        "success": error is None,
+        "data": {"results": results},
+        "message": None,
+        "error": error,
+    })
+
+
+@router.post("/{database_name}/execute/stream")
+async def execute_sql_stream(
+    request: ExecuteSQLStreamRequest,
+    db_context: DatabaseContextDep,
+) -> StreamingResponse:
+    """Execute a SELECT query and stream the rows as NDJSON.
+    
+    The first line is {"columns": [...]}, followed by one JSON object per row
+    and a final {"row_count": n} line. Rows are fetched from the server cursor
+    in batches, so memory use does not grow with the size of the result.
+    """
+    stream = db_context.stream_sql_query(
+        request.sql, max_rows=request.max_rows, batch_size=min(request.max_rows, 1000)
+    )
+    try:
+        # Execute the statement before the response starts so errors map to HTTP codes
+        columns = await stream.__anext__()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except PermissionError as e:
         raise HTTPException(
             status_code=403,
@@ -1907,24 +329,35 @@ async def execute_sql(
         raise HTTPException(status_code=400, detail=f"Database error: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error executing query: {str(e)}")
+    
+    async def ndjson_lines():
+        row_count = 0
+        try:
+            yield orjson.dumps({"columns": columns}) + b"\n"
+            async for batch in stream:
+                row_count += len(batch)
+                yield b"".join(
+                    orjson.dumps(row, default=orjson_default) + b"\n" for row in batch
+                )
+            yield orjson.dumps({"row_count": row_count}) + b"\n"
+        finally:
+            await stream.aclose()
+    
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
 
 
 @router.post("/{database_name}/write", response_model=APIResponse)
 async def execute_write_sql(
-    database_name: str,
     request: ExecuteWriteSQLRequest,
-    multi_ctx: MultiDBContextDep,
+    db_context: DatabaseContextDep,
 ) -> APIResponse:
     """Execute a write operation (INSERT, UPDATE, DELETE, DDL).
     
     Changes are automatically committed.
     Requires the database to be configured with read_only=False.
     """
-    db_context = get_database_context(database_name, multi_ctx)
-    
     # Validate it's not a SELECT
-    sql_upper = request.sql.strip().upper()
-    if sql_upper.startswith('SELECT') or sql_upper.startswith('WITH'):
+    if is_read_statement(request.sql):
         raise HTTPException(
             status_code=400,
             detail="Use the /execute endpoint for SELECT statements. This endpoint is for write operations only."
@@ -1947,30 +380,50 @@ async def execute_write_sql(
             detail=f"Permission denied: {str(e)}. Write operations require read_only=False in configuration."
         )
     except oracledb.Error as e:
-        error_code = getattr(e.args[0] if e.args else None, 'code', 'Unknown')
+        # full_code carries the prefix too (ORA-00942, DPY-4011, ...)
+        try:
+            error_code = e.args[0].full_code
+        except (IndexError, AttributeError):
+            error_code = "ORA-Unknown"
         raise HTTPException(
             status_code=400,
-            detail=f"Database error (ORA-{error_code}): {str(e)}"
+            detail=f"Database error ({error_code}): {str(e)}"
         )
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error executing statement: {str(e)}")
 
 
+def _sql_digest(sql: str) -> bytes:
+    """Digest of a statement that ignores layout-only whitespace differences."""
+    normalized = _SQL_TOKEN_RE.sub(lambda m: " " if m.group(1) else m.group(0), sql).strip()
+    return hashlib.blake2b(normalized.encode(), digest_size=16).digest()
+
+
 @router.post("/{database_name}/explain", response_model=APIResponse)
 async def explain_query_plan(
     database_name: str,
     request: ExplainQueryRequest,
-    multi_ctx: MultiDBContextDep,
+    db_context: DatabaseContextDep,
 ) -> APIResponse:
     """Get execution plan for a SQL query.
     
     Returns the Oracle execution plan with optimization suggestions.
     Useful for understanding query performance before execution.
+    Plans are cached briefly, so reformatting a statement does not re-plan it.
     """
-    db_context = get_database_context(database_name, multi_ctx)
-    
     try:
-        plan = await db_context.explain_query_plan(request.sql)
+        key = (database_name, db_context.schema_manager.cache_version, _sql_digest(request.sql))
+        cached = _EXPLAIN_CACHE.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            _EXPLAIN_CACHE.move_to_end(key)
+            plan = cached[1]
+        else:
+            plan = await db_context.explain_query_plan(request.sql)
+            if plan.get("execution_plan") and not plan.get("error"):
+                _EXPLAIN_CACHE[key] = (time.monotonic() + _EXPLAIN_TTL_SECONDS, plan)
+                _EXPLAIN_CACHE.move_to_end(key)
+                if len(_EXPLAIN_CACHE) > _EXPLAIN_CACHE_SIZE:
+                    _EXPLAIN_CACHE.popitem(last=False)
         
         if plan.get("error"):
             return APIResponse(
@@ -2002,14 +455,17 @@ async def explain_query_plan(
 @router.get("/{database_name}/samples", response_model=APIResponse)
 async def generate_sample_queries(
     database_name: str,
-    multi_ctx: MultiDBContextDep,
+    db_context: DatabaseContextDep,
 ) -> APIResponse:
     """Generate sample SQL queries based on database schema.
     
     Creates 10 runnable SQL queries from beginner to advanced level
     using actual tables and columns from your database.
     """
-    db_context = get_database_context(database_name, multi_ctx)
+    cache_key = (database_name, db_context.schema_manager.cache_version)
+    cached = _SAMPLES_CACHE.get(cache_key)
+    if cached is not None and cached[0] > time.monotonic():
+        return APIResponse(success=True, data=cached[1])
     
     try:
         # Get available tables
@@ -2021,17 +477,16 @@ async def generate_sample_queries(
                 error="No tables found in database"
             )
         
-        # Load metadata for first few tables
+        # Load metadata for first few tables in one batched lookup
         tables_to_analyze = all_tables[:min(5, len(all_tables))]
-        table_metadata = []
-        
-        for table_name in tables_to_analyze:
-            try:
-                table_info = await db_context.get_schema_info(table_name)
-                if table_info and table_info.columns:
-                    table_metadata.append(table_info)
-            except Exception:
-                continue
+        try:
+            table_infos = await db_context.batch_get_schema_info(tables_to_analyze)
+        except Exception:
+            table_infos = {}
+        table_metadata = [
+            table_info for table_info in table_infos.values()
+            if table_info and table_info.columns
+        ]
         
         if not table_metadata:
             return APIResponse(
@@ -2039,1098 +494,1019 @@ async def generate_sample_queries(
                 error="Could not load table metadata for query generation"
             )
         
-        # Helper function to get column names by type
-        def get_columns_by_type(table, types):
-            return [col['name'] for col in table.columns if any(t in col.get('type', '').upper() for t in types)]
-        
         # Get primary table for examples
-        primary_table = table_metadata[0]
-        table_name = primary_table.table_name
-        
-        # Get different column types
-        all_columns = [col['name'] for col in primary_table.columns]
-        numeric_cols = get_columns_by_type(primary_table, ['NUMBER', 'INT', 'FLOAT', 'DECIMAL'])
-        text_cols = get_columns_by_type(primary_table, ['VARCHAR', 'CHAR', 'CLOB', 'TEXT'])
-        date_cols = get_columns_by_type(primary_table, ['DATE', 'TIMESTAMP'])
-        
-        sample_queries = []
-        
-        # Beginner queries
-        sample_queries.append(SampleQueryInfo(
-            level="Beginner",
-            number=1,
-            title="Select All Records",
-            description="Retrieve all columns and rows (limited to 10)",
-            query=f"SELECT * FROM {table_name} WHERE ROWNUM <= 10"
-        ))
-        
-        cols_to_select = all_columns[:min(3, len(all_columns))]
-        sample_queries.append(SampleQueryInfo(
-            level="Beginner",
-            number=2,
-            title="Select Specific Columns",
-            description="Retrieve only specific columns",
-            query=f"SELECT {', '.join(cols_to_select)} FROM {table_name}"
-        ))
-        
-        if numeric_cols:
-            sample_queries.append(SampleQueryInfo(
-                level="Beginner",
-                number=3,
-                title="Filter with WHERE Clause",
-                description="Filter records based on a numeric condition",
-                query=f"SELECT * FROM {table_name} WHERE {numeric_cols[0]} > 0"
-            ))
-        else:
-            sample_queries.append(SampleQueryInfo(
-                level="Beginner",
-                number=3,
-                title="Filter with WHERE Clause",
-                description="Filter records with ROWNUM",
-                query=f"SELECT * FROM {table_name} WHERE ROWNUM <= 5"
-            ))
-        
-        sample_queries.append(SampleQueryInfo(
-            level="Beginner",
-            number=4,
-            title="Sort Results",
-            description="Order results by a specific column",
-            query=f"SELECT * FROM {table_name} ORDER BY {all_columns[0]} DESC"
-        ))
-        
-        # Intermediate queries
-        sample_queries.append(SampleQueryInfo(
-            level="Intermediate",
-            number=5,
-            title="Count Records",
-            description="Count total number of records",
-            query=f"SELECT COUNT(*) AS total_records FROM {table_name}"
-        ))
-        
-        if numeric_cols and len(all_columns) > 1:
-            group_col = [c for c in all_columns if c not in numeric_cols[:1]]
-            group_col = group_col[0] if group_col else all_columns[0]
-            sample_queries.append(SampleQueryInfo(
-                level="Intermediate",
-                number=6,
-                title="Group and Aggregate",
-                description="Group records and calculate aggregates",
-                query=f"SELECT {group_col}, COUNT(*) AS count, AVG({numeric_cols[0]}) AS avg_value FROM {table_name} GROUP BY {group_col} ORDER BY count DESC"
-            ))
-        else:
-            sample_queries.append(SampleQueryInfo(
-                level="Intermediate",
-                number=6,
-                title="Group and Count",
-                description="Group records and count",
-                query=f"SELECT {all_columns[0]}, COUNT(*) AS count FROM {table_name} GROUP BY {all_columns[0]} ORDER BY count DESC"
-            ))
-        
-        sample_queries.append(SampleQueryInfo(
-            level="Intermediate",
-            number=7,
-            title="Find Distinct Values",
-            description="Get unique values from a column",
-            query=f"SELECT DISTINCT {all_columns[0]} FROM {table_name} ORDER BY {all_columns[0]}"
-        ))
-        
-        # Advanced queries
-        if numeric_cols:
-            sample_queries.append(SampleQueryInfo(
-                level="Advanced",
-                number=8,
-                title="Subquery - Above Average",
-                description="Find records with values above average",
-                query=f"SELECT * FROM {table_name} WHERE {numeric_cols[0]} > (SELECT AVG({numeric_cols[0]}) FROM {table_name})"
-            ))
-        else:
-            sample_queries.append(SampleQueryInfo(
-                level="Advanced",
-                number=8,
-                title="Subquery - IN clause",
-                description="Use subquery in IN clause",
-                query=f"SELECT * FROM {table_name} WHERE {all_columns[0]} IN (SELECT {all_columns[0]} FROM {table_name} WHERE ROWNUM <= 5)"
-            ))
-        
-        if numeric_cols and len(all_columns) > 1:
-            partition_col = [c for c in all_columns if c != numeric_cols[0]][0]
-            sample_queries.append(SampleQueryInfo(
-                level="Advanced",
-                number=9,
-                title="Window Function - Ranking",
-                description="Use window functions for ranking",
-                query=f"SELECT {', '.join(all_columns[:3])}, ROW_NUMBER() OVER (PARTITION BY {partition_col} ORDER BY {numeric_cols[0]} DESC) AS rank FROM {table_name}"
-            ))
-        else:
-            sample_queries.append(SampleQueryInfo(
-                level="Advanced",
-                number=9,
-                title="Window Function - Row Numbers",
-                description="Add row numbers to results",
-                query=f"SELECT {', '.join(all_columns[:3])}, ROW_NUMBER() OVER (ORDER BY {all_columns[0]}) AS row_num FROM {table_name}"
-            ))
-        
-        if numeric_cols:
-            sample_queries.append(SampleQueryInfo(
-                level="Advanced",
-                number=10,
-                title="Statistical Analysis",
-                description="Calculate statistical measures",
-                query=f"SELECT COUNT(*) AS total_records, MIN({numeric_cols[0]}) AS min_value, MAX({numeric_cols[0]}) AS max_value, AVG({numeric_cols[0]}) AS avg_value, STDDEV({numeric_cols[0]}) AS std_deviation FROM {table_name}"
-            ))
-        else:
-            sample_queries.append(SampleQueryInfo(
-                level="Advanced",
-                number=10,
-                title="Analytical Query",
-                description="Use analytical functions",
-                query=f"SELECT {all_columns[0]}, COUNT(*) OVER () AS total_count, ROW_NUMBER() OVER (ORDER BY {all_columns[0]}) AS row_num FROM {table_name} WHERE ROWNUM <= 20"
-            ))
-        
-        return APIResponse(
-            success=True,
-            data=SampleQueriesResponse(
-                database_name=database_name,
-                queries=sample_queries
-            )
-        )
-        
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error generating sample queries: {str(e)}")
-
-
-@router.post("/{database_name}/dq-rules", response_model=APIResponse)
-async def generate_sample_dq_rules(
-    database_name: str,
-    request: GenerateDQRulesRequest,
-    multi_ctx: MultiDBContextDep,
-) -> APIResponse:
-    """Generate sample data quality (DQ) rules based on table schema.
-    
-    Creates contextual data quality validation rules using actual table columns and their
-    data types. Rules span multiple categories including Business Entity Rules, Business
-    Attribute Rules, Data Dependency Rules, and Data Validity Rules.
-    
-    Rule Categories:
-    
-    BUSINESS ENTITY RULES (ensure core business objects are well-defined):
-    - entity_uniqueness: Every entity must be uniquely identifiable (no duplicate records)
-    - cardinality: Defines relationship constraints (one-to-many, many-to-many)
-    - optionality: Mandatory vs optional relationship enforcement
-    
-    BUSINESS ATTRIBUTE RULES (individual data element validation):
-    - data_inheritance: Attributes consistent across subtypes
-    - data_domain: Values conform to allowed formats/ranges (state codes, age ranges)
-    - format: Pattern validation (email, phone, date formats)
-    - value_in_list: Allowed values validation
-    
-    DATA DEPENDENCY RULES (logical/conditional relationships):
-    - entity_relationship_dependency: Existence depends on conditions
-    - attribute_dependency: Value depends on other attributes
-    - conditional_mandatory: Dependent field requirements
-    - cross_field_validation: Multi-column logical checks
-    
-    DATA VALIDITY RULES (ensure data is trustworthy):
-    - completeness: Required records, relationships, attributes must exist (mandatory)
-    - correctness_accuracy: Values reflect real-world truth
-    - precision: Data stored with required detail level
-    - uniqueness: No duplicate records, keys, or overloaded columns
-    - consistency: Duplicate/redundant data must match everywhere
-    - compliance: PII and sensitive data validation (SSN, credit card, passport)
-    - freshness: Confirms date values are up to date
-    - data_type_match: Values match their data type requirements
-    - duplicate_rows: Multi-column duplicate detection
-    - empty_blank: Null/empty/whitespace checks
-    - table_lookup: Referential integrity (value exists in lookup table)
-    - expression: Range and cross-column checks
-    - custom: Flexible custom business logic rules
-    """
-    import random
-    
-    db_context = get_database_context(database_name, multi_ctx)
-    
-    try:
-        num_rules = max(1, min(request.num_rules, 50))
-        
-        # Get table schema info
-        table_info = await db_context.get_schema_info(request.table_name)
-        
-        if not table_info:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Table '{request.table_name}' not found in database '{database_name}'"
-            )
-        
-        if not table_info.columns:
-            raise HTTPException(
-                status_code=400,
-                detail=f"No columns found for table '{request.table_name}'"
-            )
-        
-        columns = table_info.columns
-        
-        # Helper function to categorize columns by type
-        def get_columns_by_type(columns, type_patterns):
-            return [col for col in columns if any(t in col.get('type', '').upper() for t in type_patterns)]
-        
-        # Categorize columns
-        numeric_cols = get_columns_by_type(columns, ['NUMBER', 'INT', 'FLOAT', 'DECIMAL', 'NUMERIC'])
-        text_cols = get_columns_by_type(columns, ['VARCHAR', 'CHAR', 'CLOB', 'TEXT', 'NVARCHAR', 'NCHAR'])
-        date_cols = get_columns_by_type(columns, ['DATE', 'TIMESTAMP'])
-        all_cols = columns
-        
-        # Find specific column patterns
-        email_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['EMAIL', 'MAIL'])]
-        phone_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['PHONE', 'MOBILE', 'TEL', 'FAX'])]
-        name_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['NAME', 'FIRST', 'LAST', 'MIDDLE'])]
-        id_cols = [col for col in all_cols if any(k in col['name'].upper() for k in ['ID', 'CODE', 'KEY', 'NUM'])]
-        status_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['STATUS', 'STATE', 'TYPE', 'FLAG', 'CATEGORY'])]
-        amount_cols = [col for col in numeric_cols if any(k in col['name'].upper() for k in ['AMOUNT', 'PRICE', 'COST', 'INCOME', 'SALARY', 'BALANCE', 'TOTAL'])]
-        
-        # Additional column patterns for comprehensive DQ rules
-        address_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['ADDRESS', 'ADDR', 'STREET', 'CITY', 'STATE', 'ZIP', 'POSTAL', 'COUNTRY'])]
-        state_code_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['STATE_CODE', 'STATE_CD', 'COUNTRY_CODE', 'COUNTRY_CD'])]
-        age_cols = [col for col in numeric_cols if any(k in col['name'].upper() for k in ['AGE', 'YEARS'])]
-        rate_cols = [col for col in numeric_cols if any(k in col['name'].upper() for k in ['RATE', 'PERCENT', 'PCT', 'RATIO', 'INTEREST', 'COMMISSION'])]
-        account_cols = [col for col in all_cols if any(k in col['name'].upper() for k in ['ACCOUNT', 'ACCT'])]
-        loan_cols = [col for col in all_cols if any(k in col['name'].upper() for k in ['LOAN', 'CREDIT', 'DEBT', 'MORTGAGE'])]
-        customer_cols = [col for col in all_cols if any(k in col['name'].upper() for k in ['CUSTOMER', 'CUST', 'CLIENT'])]
-        pii_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['SSN', 'PASSPORT', 'NATIONAL_ID', 'TAX_ID', 'CREDIT_CARD', 'BANK_ACCOUNT', 'CVV', 'EXPIRY'])]
-        fk_cols = [col for col in all_cols if any(k in col['name'].upper() for k in ['_ID', '_KEY', '_REF', '_FK', 'PARENT_', 'FOREIGN_'])]
-        
-        # Build rule templates
-        rule_templates = []
-        
-        # 1. Mandatory rules for important-looking columns
-        mandatory_candidates = name_cols + id_cols + email_cols
-        for col in mandatory_candidates[:3]:
-            rule_templates.append({
-                "rule_id": f"r_mandatory_{col['name'].lower()}",
-                "rule_type": "mandatory",
-                "target_columns": [col['name']],
-                "enabled": True
-            })
-        
-        # 2. Format rules for email columns
-        for col in email_cols[:2]:
-            rule_templates.append({
-                "rule_id": f"r_format_{col['name'].lower()}",
-                "rule_type": "format",
-                "target_columns": [col['name']],
-                "params": {"pattern": "^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\\.[a-zA-Z0-9-.]+$"},
-                "enabled": True
-            })
-        
-        # 3. Format rules for phone columns
-        for col in phone_cols[:2]:
-            rule_templates.append({
-                "rule_id": f"r_format_{col['name'].lower()}",
-                "rule_type": "format",
-                "target_columns": [col['name']],
-                "params": {"pattern": "^[+]?[0-9]{10,15}$"},
-                "enabled": True
-            })
-        
-        # 4. Uniqueness rules for ID/key columns and emails
-        unique_candidates = id_cols[:2] + email_cols[:1]
-        for col in unique_candidates:
-            rule_templates.append({
-                "rule_id": f"r_unique_{col['name'].lower()}",
-                "rule_type": "uniqueness",
-                "target_columns": [col['name']],
-                "params": {"scope": "table"},
-                "enabled": True
-            })
-        
-        # 5. Value in list rules for status/type columns
-        sample_values_map = {
-            'STATUS': ['Active', 'Inactive', 'Pending', 'Suspended', 'Closed'],
-            'STATE': ['Open', 'Closed', 'In Progress', 'Completed', 'Cancelled'],
-            'TYPE': ['Standard', 'Premium', 'Basic', 'Enterprise', 'Trial'],
-            'CATEGORY': ['Category A', 'Category B', 'Category C', 'Other'],
-            'FLAG': ['Y', 'N'],
-            'GENDER': ['M', 'F', 'O'],
-            'RESIDENCY': ['Resident', 'Non-Resident', 'ROR', 'NRI'],
-            'OCCUPATION': ['Engineer', 'Doctor', 'Teacher', 'Business', 'Student', 'Other']
-        }
-        
-        for col in status_cols[:3]:
-            col_upper = col['name'].upper()
-            sample_values = ['Value1', 'Value2', 'Value3', 'Value4', 'Value5']
-            for key, values in sample_values_map.items():
-                if key in col_upper:
-                    sample_values = values
-                    break
-            
-            rule_templates.append({
-                "rule_id": f"r_value_in_list_{col['name'].lower()}",
-                "rule_type": "value_in_list",
-                "target_columns": [col['name']],
-                "params": {"allowed_values": sample_values},
-                "enabled": True
-            })
-        
-        # 6. Expression rules for numeric range checks
-        for col in amount_cols[:2]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_range_{col_name.lower()}",
-                "rule_type": "expression",
-                "target_columns": [col_name],
-                "params": {"expression": f"{col_name} BETWEEN 0 AND 10000000"},
-                "enabled": True
-            })
-        
-        # 7. Expression rules for non-negative numeric values
-        for col in numeric_cols[:2]:
-            if col not in amount_cols:
-                col_name = col['name']
-                rule_templates.append({
-                    "rule_id": f"r_positive_{col_name.lower()}",
-                    "rule_type": "expression",
-                    "target_columns": [col_name],
-                    "params": {"expression": f"{col_name} >= 0"},
-                    "enabled": True
-                })
-        
-        # 8. Conditional mandatory rules
-        if status_cols and name_cols:
-            status_col = status_cols[0]['name']
-            target_col = name_cols[0]['name']
-            rule_templates.append({
-                "rule_id": f"r_conditional_{target_col.lower()}",
-                "rule_type": "conditional_mandatory",
-                "target_columns": [target_col],
-                "params": {"condition": f"{status_col} = 'Active'"},
-                "enabled": True
-            })
-        
-        if phone_cols and status_cols:
-            phone_col = phone_cols[0]['name']
-            status_col = status_cols[0]['name']
-            rule_templates.append({
-                "rule_id": "r_phone_required_if_active",
-                "rule_type": "conditional_mandatory",
-                "target_columns": [phone_col],
-                "params": {"condition": f"{status_col} IN ('Active', 'Premium')"},
-                "enabled": True
-            })
-        
-        # 9. Cross-column date validation
-        if len(date_cols) >= 2:
-            date1 = date_cols[0]['name']
-            date2 = date_cols[1]['name']
-            rule_templates.append({
-                "rule_id": f"r_date_order_{date1.lower()}_{date2.lower()}",
-                "rule_type": "expression",
-                "target_columns": [date1, date2],
-                "params": {"expression": f"TO_DATE({date1}, 'YYYY-MM-DD') <= TO_DATE({date2}, 'YYYY-MM-DD')"},
-                "enabled": True
-            })
-        
-        # 10. String length validation for text columns
-        for col in text_cols[:2]:
-            col_name = col['name']
-            col_type = col.get('type', 'VARCHAR2(100)')
-            max_len = 100
-            if '(' in col_type:
-                try:
-                    max_len = int(col_type.split('(')[1].split(')')[0].split(',')[0])
-                except:
-                    max_len = col.get('length', 100)
-            else:
-                max_len = col.get('length', 100)
-            
-            rule_templates.append({
-                "rule_id": f"r_length_{col_name.lower()}",
-                "rule_type": "expression",
-                "target_columns": [col_name],
-                "params": {"expression": f"LENGTH({col_name}) <= {max_len}"},
-                "enabled": True
-            })
-        
-        # 11. Not null with trimmed check for text
-        for col in text_cols[:2]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_not_blank_{col_name.lower()}",
-                "rule_type": "expression",
-                "target_columns": [col_name],
-                "params": {"expression": f"TRIM({col_name}) IS NOT NULL"},
-                "enabled": True
-            })
-        
-        # ===== NEW DYNAMIC RULE TYPES =====
-        
-        # 12. Freshness rules - Confirms that date values are up to date
-        for col in date_cols[:2]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_freshness_{col_name.lower()}",
-                "rule_type": "freshness",
-                "target_columns": [col_name],
-                "params": {
-                    "max_age_days": 30,
-                    "expression": f"{col_name} >= SYSDATE - 30"
-                },
-                "enabled": True
-            })
-        
-        # 13. Data type match rules - Confirms values match their data type requirements
-        for col in numeric_cols[:2]:
-            col_name = col['name']
-            col_type = col.get('type', 'NUMBER')
-            precision = col.get('precision')
-            scale = col.get('scale', 0)
-            rule_templates.append({
-                "rule_id": f"r_datatype_{col_name.lower()}",
-                "rule_type": "data_type_match",
-                "target_columns": [col_name],
-                "params": {
-                    "expected_type": col_type,
-                    "precision": precision,
-                    "scale": scale,
-                    "expression": f"REGEXP_LIKE(TO_CHAR({col_name}), '^-?[0-9]+(\\.[0-9]+)?$')"
-                },
-                "enabled": True
-            })
-        
-        # Data type match for date columns stored as strings
-        date_string_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['DATE', 'DOB', 'BIRTH', 'CREATED', 'UPDATED', 'MODIFIED'])]
-        for col in date_string_cols[:2]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_datatype_date_{col_name.lower()}",
-                "rule_type": "data_type_match",
-                "target_columns": [col_name],
-                "params": {
-                    "expected_type": "DATE_STRING",
-                    "format": "YYYY-MM-DD",
-                    "expression": f"REGEXP_LIKE({col_name}, '^[0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}}$')"
-                },
-                "enabled": True
-            })
-        
-        # 14. Duplicate rows check - Checks for duplicate rows across multiple columns
-        if len(all_cols) >= 2:
-            # Use first few meaningful columns for duplicate check
-            dup_check_cols = []
-            for col in all_cols:
-                if not any(k in col['name'].upper() for k in ['ID', 'KEY', 'SEQ', 'ROWID']):
-                    dup_check_cols.append(col['name'])
-                if len(dup_check_cols) >= 3:
-                    break
-            
-            if len(dup_check_cols) >= 2:
-                rule_templates.append({
-                    "rule_id": "r_duplicate_rows",
-                    "rule_type": "duplicate_rows",
-                    "target_columns": dup_check_cols,
-                    "params": {
-                        "check_columns": dup_check_cols,
-                        "expression": f"SELECT {', '.join(dup_check_cols)}, COUNT(*) FROM {request.table_name} GROUP BY {', '.join(dup_check_cols)} HAVING COUNT(*) > 1"
-                    },
-                    "enabled": True
-                })
-        
-        # 15. Empty/blank fields - Looks for blank and empty fields
-        for col in text_cols[:3]:
-            col_name = col['name']
-            nullable = col.get('nullable', True)
-            if not nullable:  # Only for columns that shouldn't be empty
-                rule_templates.append({
-                    "rule_id": f"r_empty_blank_{col_name.lower()}",
-                    "rule_type": "empty_blank",
-                    "target_columns": [col_name],
-                    "params": {
-                        "allow_null": False,
-                        "allow_empty_string": False,
-                        "allow_whitespace_only": False,
-                        "expression": f"{col_name} IS NOT NULL AND TRIM({col_name}) IS NOT NULL AND LENGTH(TRIM({col_name})) > 0"
-                    },
-                    "enabled": True
-                })
-        
-        # Also add for important looking columns regardless of nullable
-        important_cols = name_cols + email_cols
-        for col in important_cols[:2]:
-            col_name = col['name']
-            if f"r_empty_blank_{col_name.lower()}" not in [r.get('rule_id') for r in rule_templates]:
-                rule_templates.append({
-                    "rule_id": f"r_empty_blank_{col_name.lower()}",
-                    "rule_type": "empty_blank",
-                    "target_columns": [col_name],
-                    "params": {
-                        "allow_null": False,
-                        "allow_empty_string": False,
-                        "allow_whitespace_only": False,
-                        "expression": f"{col_name} IS NOT NULL AND TRIM({col_name}) IS NOT NULL AND LENGTH(TRIM({col_name})) > 0"
-                    },
-                    "enabled": True
-                })
+        primary_table = table_metadata[0]
+        table_name = primary_table.table_name
         
-        # 16. Table lookup rules - Confirms value exists in another table
-        fk_pattern_cols = [col for col in all_cols if any(k in col['name'].upper() for k in ['_ID', '_CODE', '_KEY', '_REF', '_FK'])]
-        for col in fk_pattern_cols[:2]:
-            col_name = col['name']
-            lookup_table = None
-            if '_ID' in col_name.upper():
-                lookup_table = col_name.upper().replace('_ID', '')
-            elif '_CODE' in col_name.upper():
-                lookup_table = col_name.upper().replace('_CODE', '')
-            elif '_KEY' in col_name.upper():
-                lookup_table = col_name.upper().replace('_KEY', '')
-            
-            if lookup_table:
-                rule_templates.append({
-                    "rule_id": f"r_table_lookup_{col_name.lower()}",
-                    "rule_type": "table_lookup",
-                    "target_columns": [col_name],
-                    "params": {
-                        "lookup_table": f"{lookup_table}",
-                        "lookup_column": "ID",
-                        "expression": f"{col_name} IN (SELECT ID FROM {lookup_table})",
-                        "allow_null": True
-                    },
-                    "enabled": True
-                })
+        # Get different column types
+        all_columns = [col['name'] for col in primary_table.columns]
+        numeric_cols = [col['name'] for col in _classify_columns(primary_table.columns)["numeric"]]
+        
+        context = SimpleNamespace(
+            table=table_name,
+            columns=all_columns,
+            numeric=numeric_cols,
+            others=[col for col in all_columns if col not in numeric_cols[:1]],
+            leading=', '.join(all_columns[:3]),
+        )
+        sample_queries = []
+        for level, number, applies, title, description, query in _SAMPLE_QUERY_TEMPLATES:
+            if sample_queries and sample_queries[-1].number == number:
+                continue
+            if applies is None or applies(context):
+                sample_queries.append(SampleQueryInfo.model_construct(
+                    level=level,
+                    number=number,
+                    title=title,
+                    description=description,
+                    query=query(context)
+                ))
         
-        # 17. String format match rules - Various format validations
-        ssn_cols = [col for col in text_cols if 'SSN' in col['name'].upper()]
-        for col in ssn_cols[:1]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_format_ssn_{col_name.lower()}",
-                "rule_type": "string_format_match",
-                "target_columns": [col_name],
-                "params": {
-                    "format_name": "SSN",
-                    "pattern": "^[0-9]{3}-[0-9]{2}-[0-9]{4}$|^[0-9]{9}$",
-                    "description": "Social Security Number format (XXX-XX-XXXX or XXXXXXXXX)"
-                },
-                "enabled": True
-            })
+        samples = SampleQueriesResponse(
+            database_name=database_name,
+            queries=sample_queries
+        )
+        # One entry per database: older schema versions are dropped
+        for key in [key for key in _SAMPLES_CACHE if key[0] == database_name]:
+            del _SAMPLES_CACHE[key]
+        _SAMPLES_CACHE[cache_key] = (time.monotonic() + _SAMPLES_TTL_SECONDS, samples)
         
-        cc_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['CREDIT_CARD', 'CARD_NUMBER', 'CC_NUM'])]
-        for col in cc_cols[:1]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_format_cc_{col_name.lower()}",
-                "rule_type": "string_format_match",
-                "target_columns": [col_name],
-                "params": {
-                    "format_name": "CREDIT_CARD",
-                    "pattern": "^[0-9]{13,19}$",
-                    "description": "Credit card number (13-19 digits)"
-                },
-                "enabled": True
-            })
+        return APIResponse(success=True, data=samples)
         
-        zip_cols = [col for col in text_cols if any(k in col['name'].upper() for k in ['ZIP', 'POSTAL', 'PIN_CODE', 'PINCODE'])]
-        for col in zip_cols[:1]:
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Error generating sample queries: {str(e)}")
+
+
+def _classify_columns(columns: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Bucket columns into "numeric", "text" and "date" lists in one pass."""
+    groups = {group: [] for group, _ in _TYPE_GROUPS}
+    for col in columns:
+        col_type = col.get('type', '').upper()
+        for group, pattern in _TYPE_GROUPS:
+            if pattern.search(col_type):
+                groups[group].append(col)
+    return groups
+
+
+def _generate_dq_rule_templates(table_name: str, columns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Derive candidate DQ rules (unique by rule_id) from a table's columns."""
+    # Categorize columns
+    type_groups = _classify_columns(columns)
+    numeric_cols = type_groups["numeric"]
+    text_cols = type_groups["text"]
+    date_cols = type_groups["date"]
+    all_cols = columns
+    
+    # Upper-cased names, computed once per column for all the keyword checks
+    # below (the column dicts belong to the schema cache, so are not annotated)
+    upper_name = {id(col): col['name'].upper() for col in all_cols}
+    
+    # Find specific column patterns: one pass over the columns, testing each
+    # name against every category's pattern
+    groups = {
+        "all": None,
+        "text": {id(col) for col in text_cols},
+        "numeric": {id(col) for col in numeric_cols},
+        "date": {id(col) for col in date_cols},
+    }
+    matched = {category: [] for category in _DQ_NAME_PATTERNS}
+    for col in all_cols:
+        name = upper_name[id(col)]
+        for category, (group, pattern) in _DQ_NAME_PATTERNS.items():
+            members = groups[group]
+            if (members is None or id(col) in members) and pattern.search(name):
+                matched[category].append(col)
+    
+    email_cols = matched["email"]
+    phone_cols = matched["phone"]
+    name_cols = matched["name"]
+    id_cols = matched["id"]
+    status_cols = matched["status"]
+    amount_cols = matched["amount"]
+    
+    # Additional column patterns for comprehensive DQ rules
+    address_cols = matched["address"]
+    state_code_cols = matched["state_code"]
+    age_cols = matched["age"]
+    rate_cols = matched["rate"]
+    account_cols = matched["account"]
+    loan_cols = matched["loan"]
+    customer_cols = matched["customer"]
+    pii_cols = matched["pii"]
+    fk_cols = matched["fk"]
+    surrogate_key_ids = {id(col) for col in matched["surrogate_key"]}
+    
+    # Build rule templates; the first template for each rule_id wins
+    rule_templates = []
+    seen_ids = set()
+    
+    def add(rule: Dict[str, Any]) -> None:
+        if rule['rule_id'] not in seen_ids:
+            seen_ids.add(rule['rule_id'])
+            rule_templates.append(rule)
+    
+    # 1. Mandatory rules for important-looking columns
+    mandatory_candidates = name_cols + id_cols + email_cols
+    for col in mandatory_candidates[:3]:
+        add({
+            "rule_id": f"r_mandatory_{col['name'].lower()}",
+            "rule_type": "mandatory",
+            "target_columns": [col['name']],
+            "enabled": True
+        })
+    
+    # 2. Format rules for email columns
+    for col in email_cols[:2]:
+        add({
+            "rule_id": f"r_format_{col['name'].lower()}",
+            "rule_type": "format",
+            "target_columns": [col['name']],
+            "params": {"pattern": "^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\\.[a-zA-Z0-9-.]+$"},
+            "enabled": True
+        })
+    
+    # 3. Format rules for phone columns
+    for col in phone_cols[:2]:
+        add({
+            "rule_id": f"r_format_{col['name'].lower()}",
+            "rule_type": "format",
+            "target_columns": [col['name']],
+            "params": {"pattern": "^[+]?[0-9]{10,15}$"},
+            "enabled": True
+        })
+    
+    # 4. Uniqueness rules for ID/key columns and emails
+    unique_candidates = id_cols[:2] + email_cols[:1]
+    for col in unique_candidates:
+        add({
+            "rule_id": f"r_unique_{col['name'].lower()}",
+            "rule_type": "uniqueness",
+            "target_columns": [col['name']],
+            "params": {"scope": "table"},
+            "enabled": True
+        })
+    
+    # 5. Value in list rules for status/type columns
+    sample_values_map = {
+        'STATUS': ['Active', 'Inactive', 'Pending', 'Suspended', 'Closed'],
+        'STATE': ['Open', 'Closed', 'In Progress', 'Completed', 'Cancelled'],
+        'TYPE': ['Standard', 'Premium', 'Basic', 'Enterprise', 'Trial'],
+        'CATEGORY': ['Category A', 'Category B', 'Category C', 'Other'],
+        'FLAG': ['Y', 'N'],
+        'GENDER': ['M', 'F', 'O'],
+        'RESIDENCY': ['Resident', 'Non-Resident', 'ROR', 'NRI'],
+        'OCCUPATION': ['Engineer', 'Doctor', 'Teacher', 'Business', 'Student', 'Other']
+    }
+    
+    for col in status_cols[:3]:
+        col_upper = upper_name[id(col)]
+        sample_values = ['Value1', 'Value2', 'Value3', 'Value4', 'Value5']
+        for key, values in sample_values_map.items():
+            if key in col_upper:
+                sample_values = values
+                break
+        
+        add({
+            "rule_id": f"r_value_in_list_{col['name'].lower()}",
+            "rule_type": "value_in_list",
+            "target_columns": [col['name']],
+            "params": {"allowed_values": sample_values},
+            "enabled": True
+        })
+    
+    # 6. Expression rules for numeric range checks
+    for col in amount_cols[:2]:
+        col_name = col['name']
+        add({
+            "rule_id": f"r_range_{col_name.lower()}",
+            "rule_type": "expression",
+            "target_columns": [col_name],
+            "params": {"expression": f"{col_name} BETWEEN 0 AND 10000000"},
+            "enabled": True
+        })
+    
+    # 7. Expression rules for non-negative numeric values
+    for col in numeric_cols[:2]:
+        if col not in amount_cols:
             col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_format_zip_{col_name.lower()}",
-                "rule_type": "string_format_match",
+            add({
+                "rule_id": f"r_positive_{col_name.lower()}",
+                "rule_type": "expression",
                 "target_columns": [col_name],
-                "params": {
-                    "format_name": "POSTAL_CODE",
-                    "pattern": "^[0-9]{5,6}(-[0-9]{4})?$",
-                    "description": "Postal/ZIP code format"
-                },
-                "enabled": True
-            })
-        
-        # 18. Custom expression rules - Flexible custom validation
-        if amount_cols and date_cols:
-            amount_col = amount_cols[0]['name']
-            date_col = date_cols[0]['name']
-            rule_templates.append({
-                "rule_id": "r_custom_business_logic",
-                "rule_type": "custom",
-                "category": "data_validity",
-                "target_columns": [amount_col, date_col],
-                "params": {
-                    "expression": f"CASE WHEN {date_col} < SYSDATE - 365 THEN {amount_col} = 0 ELSE 1=1 END",
-                    "description": "Custom business rule: Old records should have zero amount",
-                    "severity": "warning"
-                },
+                "params": {"expression": f"{col_name} >= 0"},
                 "enabled": True
             })
-        
-        if name_cols and len(name_cols) >= 2:
-            rule_templates.append({
-                "rule_id": "r_custom_name_consistency",
-                "rule_type": "custom",
-                "category": "data_validity",
-                "target_columns": [name_cols[0]['name'], name_cols[1]['name']],
+    
+    # 8. Conditional mandatory rules
+    if status_cols and name_cols:
+        status_col = status_cols[0]['name']
+        target_col = name_cols[0]['name']
+        add({
+            "rule_id": f"r_conditional_{target_col.lower()}",
+            "rule_type": "conditional_mandatory",
+            "target_columns": [target_col],
+            "params": {"condition": f"{status_col} = 'Active'"},
+            "enabled": True
+        })
+    
+    if phone_cols and status_cols:
+        phone_col = phone_cols[0]['name']
+        status_col = status_cols[0]['name']
+        add({
+            "rule_id": "r_phone_required_if_active",
+            "rule_type": "conditional_mandatory",
+            "target_columns": [phone_col],
+            "params": {"condition": f"{status_col} IN ('Active', 'Premium')"},
+            "enabled": True
+        })
+    
+    # 9. Cross-column date validation
+    if len(date_cols) >= 2:
+        date1 = date_cols[0]['name']
+        date2 = date_cols[1]['name']
+        add({
+            "rule_id": f"r_date_order_{date1.lower()}_{date2.lower()}",
+            "rule_type": "expression",
+            "target_columns": [date1, date2],
+            "params": {"expression": f"TO_DATE({date1}, 'YYYY-MM-DD') <= TO_DATE({date2}, 'YYYY-MM-DD')"},
+            "enabled": True
+        })
+    
+    # 10. String length validation for text columns
+    for col in text_cols[:2]:
+        col_name = col['name']
+        col_type = col.get('type', 'VARCHAR2(100)')
+        max_len = 100
+        if '(' in col_type:
+            try:
+                max_len = int(col_type.split('(')[1].split(')')[0].split(',')[0])
+            except:
+                max_len = col.get('length', 100)
+        else:
+            max_len = col.get('length', 100)
+        
+        add({
+            "rule_id": f"r_length_{col_name.lower()}",
+            "rule_type": "expression",
+            "target_columns": [col_name],
+            "params": {"expression": f"LENGTH({col_name}) <= {max_len}"},
+            "enabled": True
+        })
+    
+    # 11. Not null with trimmed check for text
+    for col in text_cols[:2]:
+        col_name = col['name']
+        add({
+            "rule_id": f"r_not_blank_{col_name.lower()}",
+            "rule_type": "expression",
+            "target_columns": [col_name],
+            "params": {"expression": f"TRIM({col_name}) IS NOT NULL"},
+            "enabled": True
+        })
+    
+    # ===== NEW DYNAMIC RULE TYPES =====
+    
+    # 12. Freshness rules - Confirms that date values are up to date
+    for col in date_cols[:2]:
+        col_name = col['name']
+        add({
+            "rule_id": f"r_freshness_{col_name.lower()}",
+            "rule_type": "freshness",
+            "target_columns": [col_name],
+            "params": {
+                "max_age_days": 30,
+                "expression": f"{col_name} >= SYSDATE - 30"
+            },
+            "enabled": True
+        })
+    
+    # 13. Data type match rules - Confirms values match their data type requirements
+    for col in numeric_cols[:2]:
+        col_name = col['name']
+        col_type = col.get('type', 'NUMBER')
+        precision = col.get('precision')
+        scale = col.get('scale', 0)
+        add({
+            "rule_id": f"r_datatype_{col_name.lower()}",
+            "rule_type": "data_type_match",
+            "target_columns": [col_name],
+            "params": {
+                "expected_type": col_type,
+                "precision": precision,
+                "scale": scale,
+                "expression": f"REGEXP_LIKE(TO_CHAR({col_name}), '^-?[0-9]+(\\.[0-9]+)?$')"
+            },
+            "enabled": True
+        })
+    
+    # Data type match for date columns stored as strings
+    date_string_cols = matched["date_string"]
+    for col in date_string_cols[:2]:
+        col_name = col['name']
+        add({
+            "rule_id": f"r_datatype_date_{col_name.lower()}",
+            "rule_type": "data_type_match",
+            "target_columns": [col_name],
+            "params": {
+                "expected_type": "DATE_STRING",
+                "format": "YYYY-MM-DD",
+                "expression": f"REGEXP_LIKE({col_name}, '^[0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}}$')"
+            },
+            "enabled": True
+        })
+    
+    # 14. Duplicate rows check - Checks for duplicate rows across multiple columns
+    if len(all_cols) >= 2:
+        # Use first few meaningful columns for duplicate check
+        dup_check_cols = []
+        for col in all_cols:
+            if id(col) not in surrogate_key_ids:
+                dup_check_cols.append(col['name'])
+            if len(dup_check_cols) >= 3:
+                break
+        
+        if len(dup_check_cols) >= 2:
+            dup_list = ', '.join(dup_check_cols)
+            add({
+                "rule_id": "r_duplicate_rows",
+                "rule_type": "duplicate_rows",
+                "target_columns": dup_check_cols,
                 "params": {
-                    "expression": f"{name_cols[0]['name']} IS NOT NULL OR {name_cols[1]['name']} IS NOT NULL",
-                    "description": "At least one name field must be populated",
-                    "severity": "error"
+                    "check_columns": dup_check_cols,
+                    "expression": f"SELECT {dup_list}, COUNT(*) FROM {table_name} GROUP BY {dup_list} HAVING COUNT(*) > 1"
                 },
                 "enabled": True
             })
-        
-        # ===== BUSINESS ENTITY RULES =====
-        # These rules ensure core business objects are well-defined and correctly related
-        
-        # 19. Entity Uniqueness - Every entity must be uniquely identifiable
-        pk_cols = [col for col in all_cols if not col.get('nullable', True) and any(k in col['name'].upper() for k in ['ID', 'KEY', 'CODE'])]
-        for col in pk_cols[:2]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_entity_uniqueness_{col_name.lower()}",
-                "rule_type": "entity_uniqueness",
-                "category": "business_entity",
+    
+    # 15. Empty/blank fields - Looks for blank and empty fields
+    for col in text_cols[:3]:
+        col_name = col['name']
+        nullable = col.get('nullable', True)
+        if not nullable:  # Only for columns that shouldn't be empty
+            add({
+                "rule_id": f"r_empty_blank_{col_name.lower()}",
+                "rule_type": "empty_blank",
                 "target_columns": [col_name],
                 "params": {
-                    "check_type": "primary_identifier",
                     "allow_null": False,
-                    "expression": f"SELECT {col_name}, COUNT(*) FROM {request.table_name} WHERE {col_name} IS NOT NULL GROUP BY {col_name} HAVING COUNT(*) > 1",
-                    "description": f"Every record must have a unique non-null {col_name}"
+                    "allow_empty_string": False,
+                    "allow_whitespace_only": False,
+                    "expression": f"{col_name} IS NOT NULL AND TRIM({col_name}) IS NOT NULL AND LENGTH(TRIM({col_name})) > 0"
                 },
                 "enabled": True
             })
-        
-        # Entity uniqueness for composite keys
-        if customer_cols and account_cols:
-            cust_col = customer_cols[0]['name']
-            acct_col = account_cols[0]['name']
-            rule_templates.append({
-                "rule_id": f"r_entity_uniqueness_composite_{cust_col.lower()}_{acct_col.lower()}",
-                "rule_type": "entity_uniqueness",
-                "category": "business_entity",
-                "target_columns": [cust_col, acct_col],
+    
+    # Also add for important looking columns regardless of nullable
+    important_cols = name_cols + email_cols
+    for col in important_cols[:2]:
+        col_name = col['name']
+        add({
+            "rule_id": f"r_empty_blank_{col_name.lower()}",
+            "rule_type": "empty_blank",
+            "target_columns": [col_name],
+            "params": {
+                "allow_null": False,
+                "allow_empty_string": False,
+                "allow_whitespace_only": False,
+                "expression": f"{col_name} IS NOT NULL AND TRIM({col_name}) IS NOT NULL AND LENGTH(TRIM({col_name})) > 0"
+            },
+            "enabled": True
+        })
+    
+    # 16. Table lookup rules - Confirms value exists in another table
+    fk_pattern_cols = matched["lookup_key"]
+    for col in fk_pattern_cols[:2]:
+        col_name = col['name']
+        col_upper = upper_name[id(col)]
+        lookup_table = None
+        if '_ID' in col_upper:
+            lookup_table = col_upper.replace('_ID', '')
+        elif '_CODE' in col_upper:
+            lookup_table = col_upper.replace('_CODE', '')
+        elif '_KEY' in col_upper:
+            lookup_table = col_upper.replace('_KEY', '')
+        
+        if lookup_table:
+            add({
+                "rule_id": f"r_table_lookup_{col_name.lower()}",
+                "rule_type": "table_lookup",
+                "target_columns": [col_name],
                 "params": {
-                    "check_type": "composite_key",
-                    "expression": f"SELECT {cust_col}, {acct_col}, COUNT(*) FROM {request.table_name} GROUP BY {cust_col}, {acct_col} HAVING COUNT(*) > 1",
-                    "description": f"Combination of {cust_col} and {acct_col} must be unique"
+                    "lookup_table": f"{lookup_table}",
+                    "lookup_column": "ID",
+                    "expression": f"{col_name} IN (SELECT ID FROM {lookup_table})",
+                    "allow_null": True
                 },
                 "enabled": True
             })
-        
-        # 20. Cardinality Rules - Relationship constraints
-        if fk_cols:
-            for col in fk_cols[:2]:
-                col_name = col['name']
-                # Infer parent table
-                parent_table = None
-                for pattern in ['_ID', '_KEY', '_REF', '_FK']:
-                    if pattern in col_name.upper():
-                        parent_table = col_name.upper().replace(pattern, '')
-                        break
-                
-                if parent_table:
-                    rule_templates.append({
-                        "rule_id": f"r_cardinality_{col_name.lower()}",
-                        "rule_type": "cardinality",
-                        "category": "business_entity",
-                        "target_columns": [col_name],
-                        "params": {
-                            "relationship_type": "many_to_one",
-                            "parent_table": parent_table,
-                            "parent_column": "ID",
-                            "min_occurrences": 0,
-                            "max_occurrences": None,
-                            "expression": f"{col_name} IN (SELECT ID FROM {parent_table})",
-                            "description": f"Many {request.table_name} records can reference one {parent_table} record"
-                        },
-                        "enabled": True
-                    })
-        
-        # 21. Optionality Rules - Mandatory vs optional relationships
+    
+    # 17. String format match rules - Various format validations
+    ssn_cols = matched["ssn"]
+    for col in ssn_cols[:1]:
+        col_name = col['name']
+        add({
+            "rule_id": f"r_format_ssn_{col_name.lower()}",
+            "rule_type": "string_format_match",
+            "target_columns": [col_name],
+            "params": {
+                "format_name": "SSN",
+                "pattern": "^[0-9]{3}-[0-9]{2}-[0-9]{4}$|^[0-9]{9}$",
+                "description": "Social Security Number format (XXX-XX-XXXX or XXXXXXXXX)"
+            },
+            "enabled": True
+        })
+    
+    cc_cols = matched["credit_card"]
+    for col in cc_cols[:1]:
+        col_name = col['name']
+        add({
+            "rule_id": f"r_format_cc_{col_name.lower()}",
+            "rule_type": "string_format_match",
+            "target_columns": [col_name],
+            "params": {
+                "format_name": "CREDIT_CARD",
+                "pattern": "^[0-9]{13,19}$",
+                "description": "Credit card number (13-19 digits)"
+            },
+            "enabled": True
+        })
+    
+    zip_cols = matched["zip"]
+    for col in zip_cols[:1]:
+        col_name = col['name']
+        add({
+            "rule_id": f"r_format_zip_{col_name.lower()}",
+            "rule_type": "string_format_match",
+            "target_columns": [col_name],
+            "params": {
+                "format_name": "POSTAL_CODE",
+                "pattern": "^[0-9]{5,6}(-[0-9]{4})?$",
+                "description": "Postal/ZIP code format"
+            },
+            "enabled": True
+        })
+    
+    # 18. Custom expression rules - Flexible custom validation
+    if amount_cols and date_cols:
+        amount_col = amount_cols[0]['name']
+        date_col = date_cols[0]['name']
+        add({
+            "rule_id": "r_custom_business_logic",
+            "rule_type": "custom",
+            "category": "data_validity",
+            "target_columns": [amount_col, date_col],
+            "params": {
+                "expression": f"CASE WHEN {date_col} < SYSDATE - 365 THEN {amount_col} = 0 ELSE 1=1 END",
+                "description": "Custom business rule: Old records should have zero amount",
+                "severity": "warning"
+            },
+            "enabled": True
+        })
+    
+    if name_cols and len(name_cols) >= 2:
+        add({
+            "rule_id": "r_custom_name_consistency",
+            "rule_type": "custom",
+            "category": "data_validity",
+            "target_columns": [name_cols[0]['name'], name_cols[1]['name']],
+            "params": {
+                "expression": f"{name_cols[0]['name']} IS NOT NULL OR {name_cols[1]['name']} IS NOT NULL",
+                "description": "At least one name field must be populated",
+                "severity": "error"
+            },
+            "enabled": True
+        })
+    
+    # ===== BUSINESS ENTITY RULES =====
+    # These rules ensure core business objects are well-defined and correctly related
+    
+    # 19. Entity Uniqueness - Every entity must be uniquely identifiable
+    pk_cols = [col for col in matched["entity_key"] if not col.get('nullable', True)]
+    for col in pk_cols[:2]:
+        col_name = col['name']
+        add({
+            "rule_id": f"r_entity_uniqueness_{col_name.lower()}",
+            "rule_type": "entity_uniqueness",
+            "category": "business_entity",
+            "target_columns": [col_name],
+            "params": {
+                "check_type": "primary_identifier",
+                "allow_null": False,
+                "expression": f"SELECT {col_name}, COUNT(*) FROM {table_name} WHERE {col_name} IS NOT NULL GROUP BY {col_name} HAVING COUNT(*) > 1",
+                "description": f"Every record must have a unique non-null {col_name}"
+            },
+            "enabled": True
+        })
+    
+    # Entity uniqueness for composite keys
+    if customer_cols and account_cols:
+        cust_col = customer_cols[0]['name']
+        acct_col = account_cols[0]['name']
+        add({
+            "rule_id": f"r_entity_uniqueness_composite_{cust_col.lower()}_{acct_col.lower()}",
+            "rule_type": "entity_uniqueness",
+            "category": "business_entity",
+            "target_columns": [cust_col, acct_col],
+            "params": {
+                "check_type": "composite_key",
+                "expression": f"SELECT {cust_col}, {acct_col}, COUNT(*) FROM {table_name} GROUP BY {cust_col}, {acct_col} HAVING COUNT(*) > 1",
+                "description": f"Combination of {cust_col} and {acct_col} must be unique"
+            },
+            "enabled": True
+        })
+    
+    # 20. Cardinality Rules - Relationship constraints
+    if fk_cols:
         for col in fk_cols[:2]:
             col_name = col['name']
-            nullable = col.get('nullable', True)
-            rule_templates.append({
-                "rule_id": f"r_optionality_{col_name.lower()}",
-                "rule_type": "optionality",
-                "category": "business_entity",
-                "target_columns": [col_name],
-                "params": {
-                    "relationship_mandatory": not nullable,
-                    "allow_null": nullable,
-                    "expression": f"{col_name} IS NOT NULL" if not nullable else f"1=1",
-                    "description": f"Relationship via {col_name} is {'mandatory' if not nullable else 'optional'}"
-                },
-                "enabled": True
-            })
-        
-        # ===== BUSINESS ATTRIBUTE RULES =====
-        # Focus on individual data elements within business entities
-        
-        # 22. Data Inheritance - Attributes consistent across subtypes
-        if account_cols:
-            for col in account_cols[:1]:
-                col_name = col['name']
-                rule_templates.append({
-                    "rule_id": f"r_data_inheritance_{col_name.lower()}",
-                    "rule_type": "data_inheritance",
-                    "category": "business_attribute",
+            col_upper = upper_name[id(col)]
+            # Infer parent table
+            parent_table = None
+            for pattern in ['_ID', '_KEY', '_REF', '_FK']:
+                if pattern in col_upper:
+                    parent_table = col_upper.replace(pattern, '')
+                    break
+            
+            if parent_table:
+                add({
+                    "rule_id": f"r_cardinality_{col_name.lower()}",
+                    "rule_type": "cardinality",
+                    "category": "business_entity",
                     "target_columns": [col_name],
                     "params": {
-                        "supertype": "ACCOUNT",
-                        "subtypes": ["CHECKING", "SAVINGS", "LOAN"],
-                        "inherited_attribute": col_name,
-                        "consistency_check": "format_and_length",
-                        "expression": f"LENGTH({col_name}) = (SELECT MAX(LENGTH({col_name})) FROM {request.table_name})",
-                        "description": f"{col_name} format must be consistent across all account types"
+                        "relationship_type": "many_to_one",
+                        "parent_table": parent_table,
+                        "parent_column": "ID",
+                        "min_occurrences": 0,
+                        "max_occurrences": None,
+                        "expression": f"{col_name} IN (SELECT ID FROM {parent_table})",
+                        "description": f"Many {table_name} records can reference one {parent_table} record"
                     },
                     "enabled": True
                 })
-        
-        # 23. Data Domain Rules - Values conform to allowed formats/ranges
-        # State code domain
-        for col in state_code_cols[:1]:
+    
+    # 21. Optionality Rules - Mandatory vs optional relationships
+    for col in fk_cols[:2]:
+        col_name = col['name']
+        nullable = col.get('nullable', True)
+        add({
+            "rule_id": f"r_optionality_{col_name.lower()}",
+            "rule_type": "optionality",
+            "category": "business_entity",
+            "target_columns": [col_name],
+            "params": {
+                "relationship_mandatory": not nullable,
+                "allow_null": nullable,
+                "expression": f"{col_name} IS NOT NULL" if not nullable else f"1=1",
+                "description": f"Relationship via {col_name} is {'mandatory' if not nullable else 'optional'}"
+            },
+            "enabled": True
+        })
+    
+    # ===== BUSINESS ATTRIBUTE RULES =====
+    # Focus on individual data elements within business entities
+    
+    # 22. Data Inheritance - Attributes consistent across subtypes
+    if account_cols:
+        for col in account_cols[:1]:
             col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_data_domain_{col_name.lower()}",
-                "rule_type": "data_domain",
+            add({
+                "rule_id": f"r_data_inheritance_{col_name.lower()}",
+                "rule_type": "data_inheritance",
                 "category": "business_attribute",
                 "target_columns": [col_name],
                 "params": {
-                    "domain_type": "state_code",
-                    "allowed_values": ["AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY", "DC"],
-                    "expression": f"UPPER({col_name}) IN ('AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA', 'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD', 'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ', 'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC', 'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC')",
-                    "description": f"{col_name} must be a valid US state abbreviation"
+                    "supertype": "ACCOUNT",
+                    "subtypes": ["CHECKING", "SAVINGS", "LOAN"],
+                    "inherited_attribute": col_name,
+                    "consistency_check": "format_and_length",
+                    "expression": f"LENGTH({col_name}) = (SELECT MAX(LENGTH({col_name})) FROM {table_name})",
+                    "description": f"{col_name} format must be consistent across all account types"
                 },
                 "enabled": True
             })
-        
-        # Age domain (0-120)
-        for col in age_cols[:1]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_data_domain_{col_name.lower()}",
-                "rule_type": "data_domain",
-                "category": "business_attribute",
-                "target_columns": [col_name],
+    
+    # 23. Data Domain Rules - Values conform to allowed formats/ranges
+    # State code domain
+    for col in state_code_cols[:1]:
+        col_name = col['name']
+        add({
+            "rule_id": f"r_data_domain_{col_name.lower()}",
+            "rule_type": "data_domain",
+            "category": "business_attribute",
+            "target_columns": [col_name],
+            "params": {
+                "domain_type": "state_code",
+                "allowed_values": _US_STATE_CODES,
+                "expression": f"UPPER({col_name}) IN {_US_STATE_CODES_SQL}",
+                "description": f"{col_name} must be a valid US state abbreviation"
+            },
+            "enabled": True
+        })
+    
+    # Age domain (0-120)
+    for col in age_cols[:1]:
+        col_name = col['name']
+        add({
+            "rule_id": f"r_data_domain_{col_name.lower()}",
+            "rule_type": "data_domain",
+            "category": "business_attribute",
+            "target_columns": [col_name],
+            "params": {
+                "domain_type": "numeric_range",
+                "min_value": 0,
+                "max_value": 120,
+                "expression": f"{col_name} BETWEEN 0 AND 120",
+                "description": f"{col_name} must be between 0 and 120"
+            },
+            "enabled": True
+        })
+    
+    # Rate/percentage domain (0-100 or 0-1)
+    for col in rate_cols[:2]:
+        col_name = col['name']
+        add({
+            "rule_id": f"r_data_domain_{col_name.lower()}",
+            "rule_type": "data_domain",
+            "category": "business_attribute",
+            "target_columns": [col_name],
+            "params": {
+                "domain_type": "percentage",
+                "min_value": 0,
+                "max_value": 100,
+                "expression": f"{col_name} BETWEEN 0 AND 100",
+                "description": f"{col_name} must be a valid percentage (0-100)"
+            },
+            "enabled": True
+        })
+    
+    # Date format domain
+    date_string_cols_domain = matched["date_string_domain"]
+    for col in date_string_cols_domain[:1]:
+        col_name = col['name']
+        add({
+            "rule_id": f"r_data_domain_date_{col_name.lower()}",
+            "rule_type": "data_domain",
+            "category": "business_attribute",
+            "target_columns": [col_name],
+            "params": {
+                "domain_type": "date_format",
+                "format": "CCYY/MM/DD",
+                "pattern": "^[0-9]{4}/[0-9]{2}/[0-9]{2}$",
+                "expression": f"REGEXP_LIKE({col_name}, '^[0-9]{{4}}/[0-9]{{2}}/[0-9]{{2}}$')",
+                "description": f"{col_name} must follow CCYY/MM/DD format"
+            },
+            "enabled": True
+        })
+    
+    # ===== DATA DEPENDENCY RULES =====
+    # Define logical and conditional relationships
+    
+    # 24. Entity Relationship Dependency - Existence depends on conditions
+    if status_cols and fk_cols:
+        status_col = status_cols[0]['name']
+        fk_col = fk_cols[0]['name']
+        add({
+            "rule_id": f"r_entity_rel_dependency_{fk_col.lower()}",
+            "rule_type": "entity_relationship_dependency",
+            "category": "data_dependency",
+            "target_columns": [fk_col, status_col],
+            "params": {
+                "dependency_type": "conditional_existence",
+                "condition": f"{status_col} NOT IN ('Delinquent', 'Suspended', 'Blocked')",
+                "expression": f"CASE WHEN {status_col} IN ('Delinquent', 'Suspended', 'Blocked') THEN {fk_col} IS NULL ELSE 1=1 END",
+                "description": f"New relationships via {fk_col} cannot be created for records with Delinquent/Suspended/Blocked status"
+            },
+            "enabled": True
+        })
+    
+    # 25. Attribute Dependency - Value depends on other attributes
+    # Loan amount dependency
+    if loan_cols and status_cols:
+        loan_col = loan_cols[0]['name']
+        status_col = status_cols[0]['name']
+        add({
+            "rule_id": f"r_attr_dependency_{loan_col.lower()}_status",
+            "rule_type": "attribute_dependency",
+            "category": "data_dependency",
+            "target_columns": [loan_col, status_col],
+            "params": {
+                "dependency_type": "conditional_value",
+                "condition": f"{status_col} = 'Funded'",
+                "required_value": f"{loan_col} > 0",
+                "expression": f"CASE WHEN {status_col} = 'Funded' THEN {loan_col} > 0 ELSE 1=1 END",
+                "description": f"If {status_col} is 'Funded', then {loan_col} must be greater than 0"
+            },
+            "enabled": True
+        })
+    
+    # Calculated field dependency (Pay = Hours * Rate)
+    hours_cols = matched["hours"]
+    pay_cols = matched["pay"]
+    if hours_cols and rate_cols and pay_cols:
+        hours_col = hours_cols[0]['name']
+        rate_col = rate_cols[0]['name']
+        pay_col = pay_cols[0]['name']
+        add({
+            "rule_id": f"r_attr_dependency_calculated_{pay_col.lower()}",
+            "rule_type": "attribute_dependency",
+            "category": "data_dependency",
+            "target_columns": [pay_col, hours_col, rate_col],
+            "params": {
+                "dependency_type": "calculated",
+                "formula": f"{pay_col} = {hours_col} * {rate_col}",
+                "tolerance": 0.01,
+                "expression": f"ABS({pay_col} - ({hours_col} * {rate_col})) < 0.01",
+                "description": f"{pay_col} should equal {hours_col} multiplied by {rate_col}"
+            },
+            "enabled": True
+        })
+    
+    # Mutual exclusion dependency (salary vs commission)
+    salary_cols = matched["salary"]
+    commission_cols = matched["commission"]
+    if salary_cols and commission_cols:
+        salary_col = salary_cols[0]['name']
+        commission_col = commission_cols[0]['name']
+        add({
+            "rule_id": f"r_attr_dependency_mutual_exclusion",
+            "rule_type": "attribute_dependency",
+            "category": "data_dependency",
+            "target_columns": [salary_col, commission_col],
+            "params": {
+                "dependency_type": "mutual_exclusion",
+                "expression": f"NOT ({salary_col} > 0 AND {commission_col} > 0)",
+                "description": f"If {salary_col} > 0, then {commission_col} must be NULL or 0 (mutually exclusive)"
+            },
+            "enabled": True
+        })
+    
+    # 26. Cross-field validation
+    if len(date_cols) >= 2:
+        start_date_cols = matched["start_date"]
+        end_date_cols = matched["end_date"]
+        if start_date_cols and end_date_cols:
+            start_col = start_date_cols[0]['name']
+            end_col = end_date_cols[0]['name']
+            add({
+                "rule_id": f"r_cross_field_{start_col.lower()}_{end_col.lower()}",
+                "rule_type": "cross_field_validation",
+                "category": "data_dependency",
+                "target_columns": [start_col, end_col],
                 "params": {
-                    "domain_type": "numeric_range",
-                    "min_value": 0,
-                    "max_value": 120,
-                    "expression": f"{col_name} BETWEEN 0 AND 120",
-                    "description": f"{col_name} must be between 0 and 120"
+                    "validation_type": "date_sequence",
+                    "expression": f"{start_col} <= {end_col}",
+                    "description": f"{start_col} must be on or before {end_col}"
                 },
                 "enabled": True
             })
-        
-        # Rate/percentage domain (0-100 or 0-1)
-        for col in rate_cols[:2]:
+    
+    # ===== DATA VALIDITY RULES =====
+    # Ensure data is complete, correct, accurate, precise, unique, and consistent
+    
+    # 27. Completeness - Required records/attributes must exist
+    mandatory_biz_cols = [col for col in all_cols if not col.get('nullable', True)]
+    for col in mandatory_biz_cols[:3]:
+        col_name = col['name']
+        add({
+            "rule_id": f"r_completeness_{col_name.lower()}",
+            "rule_type": "completeness",
+            "category": "data_validity",
+            "target_columns": [col_name],
+            "params": {
+                "check_type": "not_null",
+                "expression": f"{col_name} IS NOT NULL",
+                "description": f"{col_name} is a required field and must not be NULL"
+            },
+            "enabled": True
+        })
+    
+    # 28. Correctness & Accuracy - Values reflect real-world truth
+    if amount_cols:
+        for col in amount_cols[:1]:
             col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_data_domain_{col_name.lower()}",
-                "rule_type": "data_domain",
-                "category": "business_attribute",
+            add({
+                "rule_id": f"r_correctness_{col_name.lower()}",
+                "rule_type": "correctness_accuracy",
+                "category": "data_validity",
                 "target_columns": [col_name],
                 "params": {
-                    "domain_type": "percentage",
+                    "validation_type": "business_reasonableness",
                     "min_value": 0,
-                    "max_value": 100,
-                    "expression": f"{col_name} BETWEEN 0 AND 100",
-                    "description": f"{col_name} must be a valid percentage (0-100)"
-                },
-                "enabled": True
-            })
-        
-        # Date format domain
-        date_string_cols_domain = [col for col in text_cols if any(k in col['name'].upper() for k in ['DATE', 'DOB', 'BIRTH'])]
-        for col in date_string_cols_domain[:1]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_data_domain_date_{col_name.lower()}",
-                "rule_type": "data_domain",
-                "category": "business_attribute",
-                "target_columns": [col_name],
-                "params": {
-                    "domain_type": "date_format",
-                    "format": "CCYY/MM/DD",
-                    "pattern": "^[0-9]{4}/[0-9]{2}/[0-9]{2}$",
-                    "expression": f"REGEXP_LIKE({col_name}, '^[0-9]{{4}}/[0-9]{{2}}/[0-9]{{2}}$')",
-                    "description": f"{col_name} must follow CCYY/MM/DD format"
+                    "max_value": 999999999,
+                    "expression": f"{col_name} >= 0 AND {col_name} <= 999999999",
+                    "description": f"{col_name} must be a reasonable positive value within business limits"
                 },
                 "enabled": True
             })
-        
-        # ===== DATA DEPENDENCY RULES =====
-        # Define logical and conditional relationships
-        
-        # 24. Entity Relationship Dependency - Existence depends on conditions
-        if status_cols and fk_cols:
-            status_col = status_cols[0]['name']
-            fk_col = fk_cols[0]['name']
-            rule_templates.append({
-                "rule_id": f"r_entity_rel_dependency_{fk_col.lower()}",
-                "rule_type": "entity_relationship_dependency",
-                "category": "data_dependency",
-                "target_columns": [fk_col, status_col],
+    
+    # 29. Precision - Data stored with required detail level
+    for col in rate_cols[:1]:
+        col_name = col['name']
+        precision = col.get('precision', 10)
+        scale = col.get('scale', 4)
+        add({
+            "rule_id": f"r_precision_{col_name.lower()}",
+            "rule_type": "precision",
+            "category": "data_validity",
+            "target_columns": [col_name],
+            "params": {
+                "required_precision": precision,
+                "required_scale": scale,
+                "decimal_places": 4,
+                "expression": f"LENGTH(SUBSTR(TO_CHAR({col_name}), INSTR(TO_CHAR({col_name}), '.') + 1)) <= {scale}",
+                "description": f"{col_name} must be stored with up to {scale} decimal places precision"
+            },
+            "enabled": True
+        })
+    
+    # 30. Consistency - Duplicate/redundant data must match
+    if name_cols and len(name_cols) >= 3:
+        # Full name should match first + middle + last
+        full_name_cols = [col for col in name_cols if 'FULL' in upper_name[id(col)]]
+        first_name_cols = [col for col in name_cols if 'FIRST' in upper_name[id(col)]]
+        last_name_cols = [col for col in name_cols if 'LAST' in upper_name[id(col)]]
+        if full_name_cols and first_name_cols and last_name_cols:
+            full_col = full_name_cols[0]['name']
+            first_col = first_name_cols[0]['name']
+            last_col = last_name_cols[0]['name']
+            add({
+                "rule_id": f"r_consistency_name",
+                "rule_type": "consistency",
+                "category": "data_validity",
+                "target_columns": [full_col, first_col, last_col],
                 "params": {
-                    "dependency_type": "conditional_existence",
-                    "condition": f"{status_col} NOT IN ('Delinquent', 'Suspended', 'Blocked')",
-                    "expression": f"CASE WHEN {status_col} IN ('Delinquent', 'Suspended', 'Blocked') THEN {fk_col} IS NULL ELSE 1=1 END",
-                    "description": f"New relationships via {fk_col} cannot be created for records with Delinquent/Suspended/Blocked status"
+                    "consistency_type": "derived_value",
+                    "expression": f"UPPER({full_col}) LIKE '%' || UPPER({first_col}) || '%' AND UPPER({full_col}) LIKE '%' || UPPER({last_col}) || '%'",
+                    "description": f"{full_col} must contain both {first_col} and {last_col}"
                 },
                 "enabled": True
             })
-        
-        # 25. Attribute Dependency - Value depends on other attributes
-        # Loan amount dependency
-        if loan_cols and status_cols:
-            loan_col = loan_cols[0]['name']
-            status_col = status_cols[0]['name']
-            rule_templates.append({
-                "rule_id": f"r_attr_dependency_{loan_col.lower()}_status",
-                "rule_type": "attribute_dependency",
-                "category": "data_dependency",
-                "target_columns": [loan_col, status_col],
+    
+    # 31. Compliance - PII and sensitive data validation
+    for col in pii_cols[:3]:
+        col_name = col['name']
+        col_upper = upper_name[id(col)]
+        
+        if 'SSN' in col_upper:
+            add({
+                "rule_id": f"r_compliance_ssn_{col_name.lower()}",
+                "rule_type": "compliance",
+                "category": "data_validity",
+                "target_columns": [col_name],
                 "params": {
-                    "dependency_type": "conditional_value",
-                    "condition": f"{status_col} = 'Funded'",
-                    "required_value": f"{loan_col} > 0",
-                    "expression": f"CASE WHEN {status_col} = 'Funded' THEN {loan_col} > 0 ELSE 1=1 END",
-                    "description": f"If {status_col} is 'Funded', then {loan_col} must be greater than 0"
+                    "pii_type": "SSN",
+                    "format_pattern": "^[0-9]{3}-[0-9]{2}-[0-9]{4}$|^[0-9]{9}$",
+                    "masking_required": True,
+                    "expression": f"REGEXP_LIKE({col_name}, '^[0-9]{{3}}-[0-9]{{2}}-[0-9]{{4}}$') OR REGEXP_LIKE({col_name}, '^[0-9]{{9}}$')",
+                    "description": f"{col_name} must be a valid SSN format (XXX-XX-XXXX or 9 digits)"
                 },
                 "enabled": True
             })
-        
-        # Calculated field dependency (Pay = Hours * Rate)
-        hours_cols = [col for col in numeric_cols if any(k in col['name'].upper() for k in ['HOURS', 'HRS', 'WORKED'])]
-        pay_cols = [col for col in numeric_cols if any(k in col['name'].upper() for k in ['PAY', 'WAGE', 'SALARY'])]
-        if hours_cols and rate_cols and pay_cols:
-            hours_col = hours_cols[0]['name']
-            rate_col = rate_cols[0]['name']
-            pay_col = pay_cols[0]['name']
-            rule_templates.append({
-                "rule_id": f"r_attr_dependency_calculated_{pay_col.lower()}",
-                "rule_type": "attribute_dependency",
-                "category": "data_dependency",
-                "target_columns": [pay_col, hours_col, rate_col],
+        elif 'PASSPORT' in col_upper:
+            add({
+                "rule_id": f"r_compliance_passport_{col_name.lower()}",
+                "rule_type": "compliance",
+                "category": "data_validity",
+                "target_columns": [col_name],
                 "params": {
-                    "dependency_type": "calculated",
-                    "formula": f"{pay_col} = {hours_col} * {rate_col}",
-                    "tolerance": 0.01,
-                    "expression": f"ABS({pay_col} - ({hours_col} * {rate_col})) < 0.01",
-                    "description": f"{pay_col} should equal {hours_col} multiplied by {rate_col}"
+                    "pii_type": "PASSPORT",
+                    "format_pattern": "^[A-Z]{1,2}[0-9]{6,9}$",
+                    "masking_required": True,
+                    "expression": f"REGEXP_LIKE(UPPER({col_name}), '^[A-Z]{{1,2}}[0-9]{{6,9}}$')",
+                    "description": f"{col_name} must be a valid passport number format"
                 },
                 "enabled": True
             })
-        
-        # Mutual exclusion dependency (salary vs commission)
-        salary_cols = [col for col in numeric_cols if 'SALARY' in col['name'].upper()]
-        commission_cols = [col for col in numeric_cols if 'COMMISSION' in col['name'].upper()]
-        if salary_cols and commission_cols:
-            salary_col = salary_cols[0]['name']
-            commission_col = commission_cols[0]['name']
-            rule_templates.append({
-                "rule_id": f"r_attr_dependency_mutual_exclusion",
-                "rule_type": "attribute_dependency",
-                "category": "data_dependency",
-                "target_columns": [salary_col, commission_col],
+        elif 'CREDIT_CARD' in col_upper or 'CARD_NUM' in col_upper:
+            add({
+                "rule_id": f"r_compliance_creditcard_{col_name.lower()}",
+                "rule_type": "compliance",
+                "category": "data_validity",
+                "target_columns": [col_name],
                 "params": {
-                    "dependency_type": "mutual_exclusion",
-                    "expression": f"NOT ({salary_col} > 0 AND {commission_col} > 0)",
-                    "description": f"If {salary_col} > 0, then {commission_col} must be NULL or 0 (mutually exclusive)"
+                    "pii_type": "CREDIT_CARD",
+                    "format_pattern": "^[0-9]{13,19}$",
+                    "masking_required": True,
+                    "luhn_check": True,
+                    "expression": f"REGEXP_LIKE({col_name}, '^[0-9]{{13,19}}$')",
+                    "description": f"{col_name} must be a valid credit card number (13-19 digits)"
                 },
                 "enabled": True
             })
-        
-        # 26. Cross-field validation
-        if len(date_cols) >= 2:
-            start_date_cols = [col for col in date_cols if any(k in col['name'].upper() for k in ['START', 'BEGIN', 'FROM', 'OPEN', 'CREATED'])]
-            end_date_cols = [col for col in date_cols if any(k in col['name'].upper() for k in ['END', 'CLOSE', 'TO', 'COMPLETED', 'EXPIRY'])]
-            if start_date_cols and end_date_cols:
-                start_col = start_date_cols[0]['name']
-                end_col = end_date_cols[0]['name']
-                rule_templates.append({
-                    "rule_id": f"r_cross_field_{start_col.lower()}_{end_col.lower()}",
-                    "rule_type": "cross_field_validation",
-                    "category": "data_dependency",
-                    "target_columns": [start_col, end_col],
-                    "params": {
-                        "validation_type": "date_sequence",
-                        "expression": f"{start_col} <= {end_col}",
-                        "description": f"{start_col} must be on or before {end_col}"
-                    },
-                    "enabled": True
-                })
-        
-        # ===== DATA VALIDITY RULES =====
-        # Ensure data is complete, correct, accurate, precise, unique, and consistent
-        
-        # 27. Completeness - Required records/attributes must exist
-        mandatory_biz_cols = [col for col in all_cols if not col.get('nullable', True)]
-        for col in mandatory_biz_cols[:3]:
-            col_name = col['name']
-            rule_templates.append({
-                "rule_id": f"r_completeness_{col_name.lower()}",
-                "rule_type": "completeness",
+        elif 'BANK_ACCOUNT' in col_upper or 'ACCOUNT_NO' in col_upper:
+            add({
+                "rule_id": f"r_compliance_bankaccount_{col_name.lower()}",
+                "rule_type": "compliance",
                 "category": "data_validity",
                 "target_columns": [col_name],
                 "params": {
-                    "check_type": "not_null",
-                    "expression": f"{col_name} IS NOT NULL",
-                    "description": f"{col_name} is a required field and must not be NULL"
+                    "pii_type": "BANK_ACCOUNT",
+                    "format_pattern": "^[0-9]{8,17}$",
+                    "masking_required": True,
+                    "expression": f"REGEXP_LIKE({col_name}, '^[0-9]{{8,17}}$')",
+                    "description": f"{col_name} must be a valid bank account number (8-17 digits)"
                 },
                 "enabled": True
             })
-        
-        # 28. Correctness & Accuracy - Values reflect real-world truth
-        if amount_cols:
-            for col in amount_cols[:1]:
-                col_name = col['name']
-                rule_templates.append({
-                    "rule_id": f"r_correctness_{col_name.lower()}",
-                    "rule_type": "correctness_accuracy",
-                    "category": "data_validity",
-                    "target_columns": [col_name],
-                    "params": {
-                        "validation_type": "business_reasonableness",
-                        "min_value": 0,
-                        "max_value": 999999999,
-                        "expression": f"{col_name} >= 0 AND {col_name} <= 999999999",
-                        "description": f"{col_name} must be a reasonable positive value within business limits"
-                    },
-                    "enabled": True
-                })
-        
-        # 29. Precision - Data stored with required detail level
-        for col in rate_cols[:1]:
-            col_name = col['name']
-            precision = col.get('precision', 10)
-            scale = col.get('scale', 4)
-            rule_templates.append({
-                "rule_id": f"r_precision_{col_name.lower()}",
-                "rule_type": "precision",
+        elif 'TAX_ID' in col_upper or 'NATIONAL_ID' in col_upper:
+            add({
+                "rule_id": f"r_compliance_taxid_{col_name.lower()}",
+                "rule_type": "compliance",
                 "category": "data_validity",
                 "target_columns": [col_name],
                 "params": {
-                    "required_precision": precision,
-                    "required_scale": scale,
-                    "decimal_places": 4,
-                    "expression": f"LENGTH(SUBSTR(TO_CHAR({col_name}), INSTR(TO_CHAR({col_name}), '.') + 1)) <= {scale}",
-                    "description": f"{col_name} must be stored with up to {scale} decimal places precision"
+                    "pii_type": "TAX_ID",
+                    "format_pattern": "^[0-9]{9,15}$",
+                    "masking_required": True,
+                    "expression": f"REGEXP_LIKE(TO_CHAR({col_name}), '^[0-9]{{9,15}}$')",
+                    "description": f"{col_name} must be a valid tax/national ID format"
                 },
                 "enabled": True
             })
+    
+    return rule_templates
+
+
+async def _dq_rule_templates(database_name: str, table_name: str, columns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Return the rule templates for a table, reusing them while its columns are unchanged.
+    
+    The key includes a hash of the column metadata, so a table whose
+    definition changed (after a schema cache refresh) gets fresh templates.
+    On a miss the templates are generated in a worker thread, so wide tables
+    do not stall the event loop.
+    """
+    digest = hashlib.blake2b(
+        orjson.dumps(columns, default=str, option=orjson.OPT_SORT_KEYS), digest_size=8
+    ).hexdigest()
+    key = (database_name, table_name, digest)
+    templates = _DQ_TEMPLATE_CACHE.get(key)
+    if templates is None:
+        templates = await asyncio.to_thread(_generate_dq_rule_templates, table_name, columns)
+        _DQ_TEMPLATE_CACHE[key] = templates
+        if len(_DQ_TEMPLATE_CACHE) > _DQ_TEMPLATE_CACHE_SIZE:
+            _DQ_TEMPLATE_CACHE.popitem(last=False)
+    else:
+        _DQ_TEMPLATE_CACHE.move_to_end(key)
+    return templates
+
+
+@router.get("/dq-rules/catalog", response_model=APIResponse)
+async def get_dq_rule_catalog() -> APIResponse:
+    """List the DQ rule categories and rule types the generator can produce."""
+    return APIResponse(success=True, data={"categories": DQ_RULE_CATALOG})
+
+
+@router.post("/{database_name}/dq-rules", response_model=APIResponse)
+async def generate_sample_dq_rules(
+    database_name: str,
+    request: GenerateDQRulesRequest,
+    db_context: DatabaseContextDep,
+) -> APIResponse:
+    """Generate sample data quality (DQ) rules based on table schema.
+    
+    Creates contextual validation rules from the table's actual columns and
+    their data types. GET /sql/dq-rules/catalog lists the rule categories and
+    rule types that can be generated.
+    """
+    try:
+        num_rules = max(1, min(request.num_rules, 50))
         
-        # 30. Consistency - Duplicate/redundant data must match
-        if name_cols and len(name_cols) >= 3:
-            # Full name should match first + middle + last
-            full_name_cols = [col for col in name_cols if 'FULL' in col['name'].upper()]
-            first_name_cols = [col for col in name_cols if 'FIRST' in col['name'].upper()]
-            last_name_cols = [col for col in name_cols if 'LAST' in col['name'].upper()]
-            if full_name_cols and first_name_cols and last_name_cols:
-                full_col = full_name_cols[0]['name']
-                first_col = first_name_cols[0]['name']
-                last_col = last_name_cols[0]['name']
-                rule_templates.append({
-                    "rule_id": f"r_consistency_name",
-                    "rule_type": "consistency",
-                    "category": "data_validity",
-                    "target_columns": [full_col, first_col, last_col],
-                    "params": {
-                        "consistency_type": "derived_value",
-                        "expression": f"UPPER({full_col}) LIKE '%' || UPPER({first_col}) || '%' AND UPPER({full_col}) LIKE '%' || UPPER({last_col}) || '%'",
-                        "description": f"{full_col} must contain both {first_col} and {last_col}"
-                    },
-                    "enabled": True
-                })
+        # Get table schema info
+        table_info = await db_context.get_schema_info(request.table_name)
         
-        # 31. Compliance - PII and sensitive data validation
-        for col in pii_cols[:3]:
-            col_name = col['name']
-            col_upper = col['name'].upper()
-            
-            if 'SSN' in col_upper:
-                rule_templates.append({
-                    "rule_id": f"r_compliance_ssn_{col_name.lower()}",
-                    "rule_type": "compliance",
-                    "category": "data_validity",
-                    "target_columns": [col_name],
-                    "params": {
-                        "pii_type": "SSN",
-                        "format_pattern": "^[0-9]{3}-[0-9]{2}-[0-9]{4}$|^[0-9]{9}$",
-                        "masking_required": True,
-                        "expression": f"REGEXP_LIKE({col_name}, '^[0-9]{{3}}-[0-9]{{2}}-[0-9]{{4}}$') OR REGEXP_LIKE({col_name}, '^[0-9]{{9}}$')",
-                        "description": f"{col_name} must be a valid SSN format (XXX-XX-XXXX or 9 digits)"
-                    },
-                    "enabled": True
-                })
-            elif 'PASSPORT' in col_upper:
-                rule_templates.append({
-                    "rule_id": f"r_compliance_passport_{col_name.lower()}",
-                    "rule_type": "compliance",
-                    "category": "data_validity",
-                    "target_columns": [col_name],
-                    "params": {
-                        "pii_type": "PASSPORT",
-                        "format_pattern": "^[A-Z]{1,2}[0-9]{6,9}$",
-                        "masking_required": True,
-                        "expression": f"REGEXP_LIKE(UPPER({col_name}), '^[A-Z]{{1,2}}[0-9]{{6,9}}$')",
-                        "description": f"{col_name} must be a valid passport number format"
-                    },
-                    "enabled": True
-                })
-            elif 'CREDIT_CARD' in col_upper or 'CARD_NUM' in col_upper:
-                rule_templates.append({
-                    "rule_id": f"r_compliance_creditcard_{col_name.lower()}",
-                    "rule_type": "compliance",
-                    "category": "data_validity",
-                    "target_columns": [col_name],
-                    "params": {
-                        "pii_type": "CREDIT_CARD",
-                        "format_pattern": "^[0-9]{13,19}$",
-                        "masking_required": True,
-                        "luhn_check": True,
-                        "expression": f"REGEXP_LIKE({col_name}, '^[0-9]{{13,19}}$')",
-                        "description": f"{col_name} must be a valid credit card number (13-19 digits)"
-                    },
-                    "enabled": True
-                })
-            elif 'BANK_ACCOUNT' in col_upper or 'ACCOUNT_NO' in col_upper:
-                rule_templates.append({
-                    "rule_id": f"r_compliance_bankaccount_{col_name.lower()}",
-                    "rule_type": "compliance",
-                    "category": "data_validity",
-                    "target_columns": [col_name],
-                    "params": {
-                        "pii_type": "BANK_ACCOUNT",
-                        "format_pattern": "^[0-9]{8,17}$",
-                        "masking_required": True,
-                        "expression": f"REGEXP_LIKE({col_name}, '^[0-9]{{8,17}}$')",
-                        "description": f"{col_name} must be a valid bank account number (8-17 digits)"
-                    },
-                    "enabled": True
-                })
-            elif 'TAX_ID' in col_upper or 'NATIONAL_ID' in col_upper:
-                rule_templates.append({
-                    "rule_id": f"r_compliance_taxid_{col_name.lower()}",
-                    "rule_type": "compliance",
-                    "category": "data_validity",
-                    "target_columns": [col_name],
-                    "params": {
-                        "pii_type": "TAX_ID",
-                        "format_pattern": "^[0-9]{9,15}$",
-                        "masking_required": True,
-                        "expression": f"REGEXP_LIKE(TO_CHAR({col_name}), '^[0-9]{{9,15}}$')",
-                        "description": f"{col_name} must be a valid tax/national ID format"
-                    },
-                    "enabled": True
-                })
+        if not table_info:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Table '{request.table_name}' not found in database '{database_name}'"
+            )
+        
+        if not table_info.columns:
+            raise HTTPException(
+                status_code=400,
+                detail=f"No columns found for table '{request.table_name}'"
+            )
+        
+        columns = table_info.columns
+        if len(columns) > _DQ_MAX_COLUMNS:
+            pk_columns = {
+                name
+                for constraint in table_info.constraints or []
+                if constraint.get('type') == 'PRIMARY KEY'
+                for name in constraint.get('columns') or []
+            }
+            ranked = sorted(columns, key=lambda col: (col['name'] not in pk_columns, col.get('nullable', True)))
+            kept = {id(col) for col in ranked[:_DQ_MAX_COLUMNS]}
+            columns = [col for col in columns if id(col) in kept]
         
-        # Remove duplicates based on rule_id
-        seen_ids = set()
-        unique_templates = []
-        for rule in rule_templates:
-            if rule['rule_id'] not in seen_ids:
-                seen_ids.add(rule['rule_id'])
-                unique_templates.append(rule)
+        # Templates are cached per table definition; copy before extending
+        unique_templates = list(await _dq_rule_templates(database_name, request.table_name, columns))
+        seen_ids = {rule['rule_id'] for rule in unique_templates}
         
         # If we have fewer templates than requested, add generic ones
-        if len(unique_templates) < num_rules and all_cols:
+        if len(unique_templates) < num_rules and columns:
             remaining = num_rules - len(unique_templates)
-            for i, col in enumerate(all_cols[:remaining]):
+            for i, col in enumerate(columns[:remaining]):
                 if f"r_not_null_{col['name'].lower()}" not in seen_ids:
                     unique_templates.append({
                         "rule_id": f"r_not_null_{col['name'].lower()}",
@@ -3141,7 +1517,7 @@ async def generate_sample_dq_rules(
         
         # Select requested number of rules
         if len(unique_templates) > num_rules:
-            rules = random.sample(unique_templates, num_rules)
+            rules = _rng.sample(unique_templates, num_rules)
         else:
             rules = unique_templates[:num_rules]
         
@@ -3154,9 +1530,9 @@ async def generate_sample_dq_rules(
             "uncategorized_rules": len([r for r in rules if not r.get('category')])
         }
         
-        # Convert to DQRuleInfo objects
+        # Convert to DQRuleInfo objects (generated here, so validation is skipped)
         dq_rules = [
-            DQRuleInfo(
+            DQRuleInfo.model_construct(
                 rule_id=rule['rule_id'],
                 rule_type=rule['rule_type'],
                 category=rule.get('category'),
@@ -3175,6 +1551,7 @@ async def generate_sample_dq_rules(
                 database_name=database_name,
                 total_rules=len(dq_rules),
                 rule_category_summary=category_summary,
+                columns_considered=len(columns),
                 rules=dq_rules
             )
         )
@@ -3185,11 +1562,15 @@ async def generate_sample_dq_rules(
         raise HTTPException(status_code=400, detail=f"Error generating DQ rules: {str(e)}")
 
 
-@router.post("/{database_name}/dq-rules/validate", response_model=APIResponse)
+@router.post(
+    "/{database_name}/dq-rules/validate",
+    response_model=APIResponse,
+    dependencies=[Depends(pin_database_connection)],
+)
 async def apply_dq_rules(
     database_name: str,
     request: ApplyDQRulesRequest,
-    multi_ctx: MultiDBContextDep,
+    db_context: DatabaseContextDep,
 ) -> APIResponse:
     """Apply data quality rules to validate table data and optionally store results.
     
@@ -3225,8 +1606,6 @@ async def apply_dq_rules(
     import uuid
     from datetime import datetime
     
-    db_context = get_database_context(database_name, multi_ctx)
-    
     try:
         rules = request.rules
         if not rules or len(rules) == 0:
@@ -3253,9 +1632,8 @@ async def apply_dq_rules(
             except Exception as e:
                 storage_warning = f"Could not configure write mode: {str(e)}"
                 can_store = False
-        sample_clause = ""
-        if request.sample_percent and 1 <= request.sample_percent <= 100:
-            sample_clause = f" SAMPLE({request.sample_percent})"
+        # A fixed seed keeps the total, failed and sample queries on the same blocks
+        sample_clause = build_sample_clause(request.sample_percent, seed=1)
         # --- Create storage tables if needed ---
         storage_table = "DQ_VALIDATION_RESULTS"
         rules_table = "DQ_RULES_STORE"
@@ -3320,164 +1698,206 @@ async def apply_dq_rules(
                 can_store = False
                 storage_warning = f"Could not create/access storage table: {str(e)}"
         
-        # Helper function to build validation SQL based on rule type
-        def build_validation_sql(rule, table, sample_clause):
+        # Storage statements take every value as a bind variable, so their text
+        # is identical for all rules and runs: parsed once, then served from
+        # the session statement cache and only re-bound per rule.
+        merge_rule_sql = f"""
+        MERGE INTO {rules_table} dest
+        USING (
+            SELECT :rule_id AS RULE_ID, :rule_type AS RULE_TYPE, :category AS RULE_CATEGORY,
+                   :table_name AS TABLE_NAME, :target_columns AS TARGET_COLUMNS, :params AS PARAMS
+            FROM DUAL
+        ) src
+        ON (dest.RULE_ID = src.RULE_ID)
+        WHEN MATCHED THEN
+            UPDATE SET 
+                RULE_TYPE = src.RULE_TYPE,
+                RULE_CATEGORY = src.RULE_CATEGORY,
+                TABLE_NAME = src.TABLE_NAME,
+                TARGET_COLUMNS = src.TARGET_COLUMNS,
+                PARAMS = src.PARAMS,
+                UPDATED_AT = SYSTIMESTAMP
+        WHEN NOT MATCHED THEN
+            INSERT (RULE_ID, RULE_TYPE, RULE_CATEGORY, TABLE_NAME, TARGET_COLUMNS, PARAMS, ENABLED, CREATED_AT, UPDATED_AT)
+            VALUES (src.RULE_ID, src.RULE_TYPE, src.RULE_CATEGORY, src.TABLE_NAME, src.TARGET_COLUMNS, src.PARAMS, 1, SYSTIMESTAMP, SYSTIMESTAMP)
+        """
+        insert_result_sql = f"""
+        INSERT INTO {storage_table} (
+            VALIDATION_RUN_ID, RULE_ID, RULE_TYPE, RULE_CATEGORY, TABLE_NAME,
+            TARGET_COLUMNS, TOTAL_ROWS, PASSED_ROWS, FAILED_ROWS, PASS_RATE,
+            STATUS, ERROR_MESSAGE, EXECUTED_AT, SAMPLE_FAILURES
+        ) VALUES (
+            :validation_run_id, :rule_id, :rule_type, :category, :table_name,
+            :target_columns, :total_rows, :passed_rows, :failed_rows, :pass_rate,
+            :status, NULL, SYSTIMESTAMP, :sample_failures
+        )
+        """
+        
+        # Helper function to build the failure check for a rule. Row-level rules
+        # yield a predicate that is true for failing rows, so all of them can be
+        # counted in one scan; set-based rules (duplicates) carry their own SQL.
+        # Returns (predicate, failed_sql, sample_sql, error_message).
+        def build_rule_check(rule, table, sample_clause, sample_limit):
             rule_type = rule.rule_type.lower() if rule.rule_type else 'unknown'
             target_cols = rule.target_columns or []
             params = rule.params or {}
             
             if not target_cols:
-                return None, None, "No target columns specified"
+                return None, None, None, "No target columns specified"
             
             col = target_cols[0]  # Primary column
             cols_str = ', '.join(target_cols)
             
-            # Total count SQL
-            total_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause}"
-            
-            # Failed count SQL based on rule type
+            # Failing-row predicate based on rule type
             if rule_type in ('mandatory', 'completeness'):
-                failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NULL"
-                sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NULL AND ROWNUM <= 5"
+                predicate = f"{col} IS NULL"
                 
             elif rule_type in ('empty_blank',):
-                failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NULL OR TRIM({col}) IS NULL OR LENGTH(TRIM({col})) = 0"
-                sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE ({col} IS NULL OR TRIM({col}) IS NULL OR LENGTH(TRIM({col})) = 0) AND ROWNUM <= 5"
-                
-            elif rule_type in ('uniqueness', 'entity_uniqueness'):
-                failed_sql = f"SELECT COUNT(*) as cnt FROM (SELECT {col} FROM {table}{sample_clause} GROUP BY {col} HAVING COUNT(*) > 1)"
-                sample_sql = f"SELECT {col}, COUNT(*) as dup_count FROM {table}{sample_clause} GROUP BY {col} HAVING COUNT(*) > 1 FETCH FIRST 5 ROWS ONLY"
+                predicate = f"{col} IS NULL OR TRIM({col}) IS NULL OR LENGTH(TRIM({col})) = 0"
                 
-            elif rule_type == 'duplicate_rows':
-                if len(target_cols) > 1:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM (SELECT {cols_str} FROM {table}{sample_clause} GROUP BY {cols_str} HAVING COUNT(*) > 1)"
-                    sample_sql = f"SELECT {cols_str}, COUNT(*) as dup_count FROM {table}{sample_clause} GROUP BY {cols_str} HAVING COUNT(*) > 1 FETCH FIRST 5 ROWS ONLY"
-                else:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM (SELECT {col} FROM {table}{sample_clause} GROUP BY {col} HAVING COUNT(*) > 1)"
-                    sample_sql = f"SELECT {col}, COUNT(*) as dup_count FROM {table}{sample_clause} GROUP BY {col} HAVING COUNT(*) > 1 FETCH FIRST 5 ROWS ONLY"
+            elif rule_type in ('uniqueness', 'entity_uniqueness', 'duplicate_rows'):
+                group_cols = cols_str if rule_type == 'duplicate_rows' else col
+                failed_sql = f"SELECT COUNT(*) as cnt FROM (SELECT {group_cols} FROM {table}{sample_clause} GROUP BY {group_cols} HAVING COUNT(*) > 1)"
+                sample_sql = f"SELECT {group_cols}, COUNT(*) as dup_count FROM {table}{sample_clause} GROUP BY {group_cols} HAVING COUNT(*) > 1 FETCH FIRST {sample_limit} ROWS ONLY"
+                return None, failed_sql, sample_sql, None
                     
             elif rule_type in ('format', 'string_format_match', 'compliance'):
                 pattern = params.get('pattern', params.get('format_pattern', '.*'))
                 pattern = pattern.replace("'", "''")
-                failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND NOT REGEXP_LIKE({col}, '{pattern}')"
-                sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND NOT REGEXP_LIKE({col}, '{pattern}') AND ROWNUM <= 5"
+                predicate = f"{col} IS NOT NULL AND NOT REGEXP_LIKE({col}, '{pattern}')"
                 
             elif rule_type == 'value_in_list':
                 allowed = params.get('allowed_values', [])
                 if allowed:
                     values_str = ', '.join([f"'{v}'" for v in allowed])
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND {col} NOT IN ({values_str})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND {col} NOT IN ({values_str}) AND ROWNUM <= 5"
+                    predicate = f"{col} IS NOT NULL AND {col} NOT IN ({values_str})"
                 else:
-                    return None, None, "No allowed_values specified"
+                    return None, None, None, "No allowed_values specified"
                     
             elif rule_type in ('data_domain',):
                 expression = params.get('expression', '')
                 if expression:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND NOT ({expression})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND NOT ({expression}) AND ROWNUM <= 5"
+                    predicate = f"{col} IS NOT NULL AND NOT ({expression})"
                 else:
                     min_val = params.get('min_value')
                     max_val = params.get('max_value')
                     if min_val is not None and max_val is not None:
-                        failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND ({col} < {min_val} OR {col} > {max_val})"
-                        sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND ({col} < {min_val} OR {col} > {max_val}) AND ROWNUM <= 5"
+                        predicate = f"{col} IS NOT NULL AND ({col} < {min_val} OR {col} > {max_val})"
                     else:
-                        return None, None, "No expression or min/max values specified"
+                        return None, None, None, "No expression or min/max values specified"
                         
             elif rule_type in ('expression', 'cross_field_validation', 'attribute_dependency', 'correctness_accuracy', 'data_inheritance'):
                 expression = params.get('expression', '')
                 if expression:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE NOT ({expression})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE NOT ({expression}) AND ROWNUM <= 5"
+                    predicate = f"NOT ({expression})"
                 else:
-                    return None, None, "No expression specified"
+                    return None, None, None, "No expression specified"
                     
             elif rule_type == 'freshness':
                 max_days = params.get('max_age_days', 30)
-                failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND {col} < SYSDATE - {max_days}"
-                sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND {col} < SYSDATE - {max_days} AND ROWNUM <= 5"
+                predicate = f"{col} IS NOT NULL AND {col} < SYSDATE - {max_days}"
                 
             elif rule_type == 'data_type_match':
                 expression = params.get('expression', '')
                 if expression:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND NOT ({expression})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND NOT ({expression}) AND ROWNUM <= 5"
+                    predicate = f"{col} IS NOT NULL AND NOT ({expression})"
                 else:
-                    return None, None, "No expression specified for data_type_match"
+                    return None, None, None, "No expression specified for data_type_match"
                     
             elif rule_type == 'table_lookup':
                 lookup_table = params.get('lookup_table', '')
                 lookup_col = params.get('lookup_column', 'ID')
                 if lookup_table:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND {col} NOT IN (SELECT {lookup_col} FROM {lookup_table})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND {col} NOT IN (SELECT {lookup_col} FROM {lookup_table}) AND ROWNUM <= 5"
+                    predicate = f"{col} IS NOT NULL AND {col} NOT IN (SELECT {lookup_col} FROM {lookup_table})"
                 else:
-                    return None, None, "No lookup_table specified"
+                    return None, None, None, "No lookup_table specified"
                     
             elif rule_type == 'cardinality':
                 parent_table = params.get('parent_table', '')
                 parent_col = params.get('parent_column', 'ID')
                 if parent_table:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND {col} NOT IN (SELECT {parent_col} FROM {parent_table})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND {col} NOT IN (SELECT {parent_col} FROM {parent_table}) AND ROWNUM <= 5"
+                    predicate = f"{col} IS NOT NULL AND {col} NOT IN (SELECT {parent_col} FROM {parent_table})"
                 else:
-                    return None, None, "No parent_table specified"
+                    return None, None, None, "No parent_table specified"
                     
             elif rule_type == 'optionality':
                 if not params.get('allow_null', True):
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NULL"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NULL AND ROWNUM <= 5"
+                    predicate = f"{col} IS NULL"
                 else:
-                    failed_sql = f"SELECT 0 as cnt FROM DUAL"
-                    sample_sql = None
+                    # Nulls allowed: no row can fail
+                    predicate = "1 = 0"
                     
             elif rule_type == 'conditional_mandatory':
                 condition = params.get('condition', '')
                 if condition:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE ({condition}) AND {col} IS NULL"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE ({condition}) AND {col} IS NULL AND ROWNUM <= 5"
+                    predicate = f"({condition}) AND {col} IS NULL"
                 else:
-                    return None, None, "No condition specified"
+                    return None, None, None, "No condition specified"
                     
             elif rule_type in ('precision',):
                 scale = params.get('required_scale', params.get('decimal_places', 4))
-                failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND LENGTH(SUBSTR(TO_CHAR({col}), INSTR(TO_CHAR({col}), '.') + 1)) > {scale}"
-                sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE {col} IS NOT NULL AND LENGTH(SUBSTR(TO_CHAR({col}), INSTR(TO_CHAR({col}), '.') + 1)) > {scale} AND ROWNUM <= 5"
+                predicate = f"{col} IS NOT NULL AND LENGTH(SUBSTR(TO_CHAR({col}), INSTR(TO_CHAR({col}), '.') + 1)) > {scale}"
                 
             elif rule_type == 'consistency':
                 expression = params.get('expression', '')
                 if expression:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE NOT ({expression})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE NOT ({expression}) AND ROWNUM <= 5"
+                    predicate = f"NOT ({expression})"
                 else:
-                    return None, None, "No expression specified for consistency check"
+                    return None, None, None, "No expression specified for consistency check"
                     
             elif rule_type == 'custom':
                 expression = params.get('expression', '')
                 if expression:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE NOT ({expression})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE NOT ({expression}) AND ROWNUM <= 5"
+                    predicate = f"NOT ({expression})"
                 else:
-                    return None, None, "No expression specified for custom rule"
+                    return None, None, None, "No expression specified for custom rule"
                     
             elif rule_type == 'entity_relationship_dependency':
                 expression = params.get('expression', '')
                 if expression:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE NOT ({expression})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE NOT ({expression}) AND ROWNUM <= 5"
+                    predicate = f"NOT ({expression})"
                 else:
-                    return None, None, "No expression specified"
+                    return None, None, None, "No expression specified"
                     
             else:
                 expression = params.get('expression', '')
                 if expression:
-                    failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE NOT ({expression})"
-                    sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE NOT ({expression}) AND ROWNUM <= 5"
+                    predicate = f"NOT ({expression})"
                 else:
-                    return None, None, f"Unsupported rule type: {rule_type}"
+                    return None, None, None, f"Unsupported rule type: {rule_type}"
             
-            return total_sql, failed_sql, sample_sql
+            failed_sql = f"SELECT COUNT(*) as cnt FROM {table}{sample_clause} WHERE {predicate}"
+            sample_sql = f"SELECT {cols_str} FROM {table}{sample_clause} WHERE ({predicate}) AND ROWNUM <= {sample_limit}"
+            return predicate, failed_sql, sample_sql, None
+        
+        checks = []
+        for rule in rules:
+            try:
+                checks.append(build_rule_check(rule, request.table_name, sample_clause, 5))
+            except Exception as e:
+                checks.append((None, None, None, str(e)))
+        
+        # Count failures of every row-level rule in a single scan of the table
+        table_total_rows = None
+        fused_failed_rows = {}
+        fused_time_share_ms = 0.0
+        fused = [(idx, check[0]) for idx, check in enumerate(checks) if check[0] is not None]
+        if fused:
+            fused_start = time.time()
+            terms = ', '.join(f"SUM(CASE WHEN {predicate} THEN 1 ELSE 0 END) AS f{idx}" for idx, predicate in fused)
+            try:
+                fused_result = await db_context.run_sql_query(
+                    f"SELECT COUNT(*) as cnt, {terms} FROM {request.table_name}{sample_clause}"
+                )
+                counts = fused_result.get('rows', [{}])[0] if fused_result.get('rows') else {}
+                table_total_rows = counts.get('CNT', 0)
+                # SUM over an empty table is NULL
+                fused_failed_rows = {idx: counts.get(f"F{idx}") or 0 for idx, _ in fused}
+            except Exception:
+                # One invalid expression fails the whole statement; fall back to
+                # per-rule queries so the error is reported against its rule only
+                fused_failed_rows = {}
+            fused_time_share_ms = (time.time() - fused_start) * 1000 / len(fused)
         
         # Execute validation for each rule
         results = []
@@ -3486,7 +1906,7 @@ async def apply_dq_rules(
         rules_errored = 0
         total_pass_rate = 0.0
         
-        for rule in rules:
+        for idx, rule in enumerate(rules):
             rule_id = rule.rule_id
             rule_type = rule.rule_type
             category = rule.category
@@ -3497,31 +1917,20 @@ async def apply_dq_rules(
                 # Store rule definition first
                 if can_store:
                     try:
-                        params_json = json.dumps(params) if params else None
-                        merge_rule_sql = f"""
-                        MERGE INTO {rules_table} dest
-                        USING (SELECT '{rule_id}' as RULE_ID FROM DUAL) src
-                        ON (dest.RULE_ID = src.RULE_ID)
-                        WHEN MATCHED THEN
-                            UPDATE SET 
-                                RULE_TYPE = '{rule_type}',
-                                RULE_CATEGORY = {f"'{category}'" if category else 'NULL'},
-                                TABLE_NAME = '{request.table_name}',
-                                TARGET_COLUMNS = '{','.join(target_cols)}',
-                                PARAMS = {f"'{params_json}'" if params_json else 'NULL'},
-                                UPDATED_AT = SYSTIMESTAMP
-                        WHEN NOT MATCHED THEN
-                            INSERT (RULE_ID, RULE_TYPE, RULE_CATEGORY, TABLE_NAME, TARGET_COLUMNS, PARAMS, ENABLED, CREATED_AT, UPDATED_AT)
-                            VALUES ('{rule_id}', '{rule_type}', {f"'{category}'" if category else 'NULL'}, '{request.table_name}', '{','.join(target_cols)}', {f"'{params_json}'" if params_json else 'NULL'}, 1, SYSTIMESTAMP, SYSTIMESTAMP)
-                        """
-                        await db_context.run_sql_query(merge_rule_sql)
+                        await db_context.run_sql_query(merge_rule_sql, params={
+                            "rule_id": rule_id,
+                            "rule_type": rule_type,
+                            "category": category,
+                            "table_name": request.table_name,
+                            "target_columns": ','.join(target_cols),
+                            "params": json.dumps(params) if params else None,
+                        })
                     except Exception as rule_store_err:
                         if not storage_warning:
                             storage_warning = f"Could not store some rules: {str(rule_store_err)}"
-                total_sql, failed_sql, sample_sql = build_validation_sql(rule, request.table_name, sample_clause)
-                if total_sql is None:
-                    error_msg = failed_sql if failed_sql else sample_sql
-                    results.append(DQValidationResultInfo(
+                predicate, failed_sql, sample_sql, error_msg = checks[idx]
+                if error_msg is not None:
+                    results.append(DQValidationResultInfo.model_construct(
                         rule_id=rule_id,
                         rule_type=rule_type,
                         category=category,
@@ -3537,10 +1946,16 @@ async def apply_dq_rules(
                     ))
                     rules_errored += 1
                     continue
-                total_result = await db_context.run_sql_query(total_sql)
-                total_rows = total_result.get('rows', [{}])[0].get('CNT', 0) if total_result.get('rows') else 0
-                failed_result = await db_context.run_sql_query(failed_sql)
-                failed_rows = failed_result.get('rows', [{}])[0].get('CNT', 0) if failed_result.get('rows') else 0
+                if table_total_rows is None:
+                    total_result = await db_context.run_sql_query(f"SELECT COUNT(*) as cnt FROM {request.table_name}{sample_clause}")
+                    table_total_rows = total_result.get('rows', [{}])[0].get('CNT', 0) if total_result.get('rows') else 0
+                total_rows = table_total_rows
+                if idx in fused_failed_rows:
+                    failed_rows = fused_failed_rows[idx]
+                    start_time -= fused_time_share_ms / 1000
+                else:
+                    failed_result = await db_context.run_sql_query(failed_sql)
+                    failed_rows = failed_result.get('rows', [{}])[0].get('CNT', 0) if failed_result.get('rows') else 0
                 passed_rows = total_rows - failed_rows
                 pass_rate = (passed_rows / total_rows * 100) if total_rows > 0 else 100.0
                 sample_failures = None
@@ -3557,7 +1972,7 @@ async def apply_dq_rules(
                     rules_failed += 1
                 total_pass_rate += pass_rate
                 execution_time = (time.time() - start_time) * 1000
-                result_entry = DQValidationResultInfo(
+                result_entry = DQValidationResultInfo.model_construct(
                     rule_id=rule_id,
                     rule_type=rule_type,
                     category=category,
@@ -3575,29 +1990,26 @@ async def apply_dq_rules(
                 # Store validation result
                 if can_store:
                     try:
-                        sample_json = json.dumps(sample_failures, default=str) if sample_failures else None
-                        if sample_json:
-                            sample_json = sample_json.replace("'", "''")
-                        insert_sql = f"""
-                        INSERT INTO {storage_table} (
-                            VALIDATION_RUN_ID, RULE_ID, RULE_TYPE, RULE_CATEGORY, TABLE_NAME,
-                            TARGET_COLUMNS, TOTAL_ROWS, PASSED_ROWS, FAILED_ROWS, PASS_RATE,
-                            STATUS, ERROR_MESSAGE, EXECUTED_AT, SAMPLE_FAILURES
-                        ) VALUES (
-                            '{validation_run_id}', '{rule_id}', '{rule_type}', 
-                            {f"'{category}'" if category else 'NULL'}, '{request.table_name}',
-                            '{','.join(target_cols)}', {total_rows}, {passed_rows}, {failed_rows}, {round(pass_rate, 2)},
-                            '{status}', NULL, SYSTIMESTAMP, 
-                            {f"'{sample_json}'" if sample_json else 'NULL'}
-                        )
-                        """
-                        await db_context.run_sql_query(insert_sql)
+                        await db_context.run_sql_query(insert_result_sql, params={
+                            "validation_run_id": validation_run_id,
+                            "rule_id": rule_id,
+                            "rule_type": rule_type,
+                            "category": category,
+                            "table_name": request.table_name,
+                            "target_columns": ','.join(target_cols),
+                            "total_rows": total_rows,
+                            "passed_rows": passed_rows,
+                            "failed_rows": failed_rows,
+                            "pass_rate": round(pass_rate, 2),
+                            "status": status,
+                            "sample_failures": json.dumps(sample_failures, default=str) if sample_failures else None,
+                        })
                     except Exception as store_err:
                         if not storage_warning:
                             storage_warning = f"Some results could not be stored: {str(store_err)}"
             except Exception as e:
                 execution_time = (time.time() - start_time) * 1000
-                results.append(DQValidationResultInfo(
+                results.append(DQValidationResultInfo.model_construct(
                     rule_id=rule_id,
                     rule_type=rule_type,
                     category=category,
@@ -0,0 +1,71 @@
+"""Memoized SQL templates for the CRUD endpoints.
+
+Values are always sent as bind variables, so the SQL text only depends on the
+operation, the table and the column names involved. Table and column names
+arrive already written as SQL identifiers (quoted where needed); binds are
+named by position, ``:c0, :c1, ...`` for inserted and updated columns and
+``:where_0, :where_1, ...`` for filters, since column names are not always
+valid bind names. Caching the template keeps
+the statement text byte-identical across requests, which lets the driver's
+statement cache and Oracle's shared pool reuse the parsed cursor.
+
+Callers pass bind-only column names (filters, inserted and updated columns)
+sorted, so payloads listing the same keys in a different order share one
+template, and key their bind values by the same positions.
+
+String assembly only runs on a cache miss; a hit costs one hash of the key
+tuples, so the clause builders are deliberately plain joins.
+"""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+
+def sample_clause(percent: Optional[float], seed: Optional[int] = None) -> str:
+    """Return an Oracle block sampling clause for the given percentage.
+
+    SAMPLE BLOCK skips whole blocks at the storage layer, so the share of rows
+    returned is approximate (use SAMPLE (p) for row-level sampling). Oracle
+    only accepts percentages below 100, so 100 or None return an empty clause.
+    A seed makes repeated queries see the same sample.
+    """
+    if not percent or percent >= 100:
+        return ''
+    clause = f" SAMPLE BLOCK ({percent:g})"
+    if seed is not None:
+        clause += f" SEED ({seed})"
+    return clause
+
+
+@lru_cache(maxsize=1024)
+def build_sql(op: str, table_name: str, col_tuple: Tuple[str, ...], filter_tuple: Tuple[str, ...], sample_percent: Optional[float] = None) -> str:
+    """Return the parameterized SQL template for a CRUD operation.
+
+    Args:
+        op: One of "insert", "select", "exists", "update" or "delete".
+        table_name: Target table, as written into SQL.
+        col_tuple: Inserted, updated or selected column identifiers (unused
+            for delete); inserted and updated ones are bound as :c0, :c1, ...
+            An empty tuple selects every column.
+        filter_tuple: Column identifiers compared for equality in the WHERE
+            clause, bound as :where_0, :where_1, ...
+        sample_percent: Optional block sample percentage (select only).
+    """
+    where = ' AND '.join(f"{k} = :where_{i}" for i, k in enumerate(filter_tuple))
+    where = f" WHERE {where}" if where else ''
+
+    if op == "insert":
+        columns = ', '.join(col_tuple)
+        placeholders = ', '.join(f":c{i}" for i in range(len(col_tuple)))
+        return f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
+    if op == "select":
+        projection = ', '.join(col_tuple) or '*'
+        return f"SELECT {projection} FROM {table_name}{sample_clause(sample_percent)}{where}"
+    if op == "exists":
+        return f"SELECT 1 AS EXISTS_FLAG FROM {table_name}{where} FETCH FIRST 1 ROW ONLY"
+    if op == "update":
+        set_clause = ', '.join(f"{k} = :c{i}" for i, k in enumerate(col_tuple))
+        return f"UPDATE {table_name} SET {set_clause}{where}"
+    if op == "delete":
+        return f"DELETE FROM {table_name}{where}"
+    raise ValueError(f"Unknown CRUD operation: {op}")
@@ -1,9 +1,14 @@
+import asyncio
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import AsyncContextManager, AsyncIterator, Optional, List, Dict, Any
 
 from .database import DatabaseConnector
 from .schema.manager import SchemaManager
 from .models import TableInfo
+from .utils import ddl_target_table, dropped_index
+
+# Column types left out of default projections; they are fetched only on request
+LOB_TYPES = frozenset({"CLOB", "BLOB", "NCLOB"})
 
 
 class MultiDatabaseContext:
@@ -13,7 +18,9 @@ class MultiDatabaseContext:
         self,
         databases: Dict[str, Dict[str, Any]],
         cache_base_path: Path,
-        read_only: bool = True
+        read_only: bool = True,
+        pool_min: int = 5,
+        pool_max: int = 20
     ):
         """
         Initialize multi-database context.
@@ -31,6 +38,8 @@ class MultiDatabaseContext:
                 }
             cache_base_path: Base directory for all database caches
             read_only: Whether to enable read-only mode for all databases
+            pool_min: Minimum connections kept in each database's pool
+            pool_max: Maximum connections in each database's pool
         """
         self.databases: Dict[str, 'DatabaseContext'] = {}
         self.cache_base_path = cache_base_path
@@ -45,14 +54,19 @@ class MultiDatabaseContext:
                 target_schema=config.get("target_schema"),
                 use_thick_mode=config.get("use_thick_mode", False),
                 lib_dir=config.get("lib_dir"),
-                read_only=read_only
+                read_only=read_only,
+                pool_min=pool_min,
+                pool_max=pool_max
             )
     
+    async def _init_one(self, db_name: str) -> None:
+        """Initialize a single database context"""
+        print(f"Initializing database context for: {db_name}")
+        await self.databases[db_name].initialize()
+    
     async def initialize(self):
-        """Initialize all database contexts"""
-        for db_name, ctx in self.databases.items():
-            print(f"Initializing database context for: {db_name}")
-            await ctx.initialize()
+        """Initialize all database contexts concurrently"""
+        await asyncio.gather(*(self._init_one(db_name) for db_name in self.databases))
     
     async def close(self):
         """Close all database connections"""
@@ -61,23 +75,26 @@ class MultiDatabaseContext:
     
     def get_database(self, db_name: str) -> 'DatabaseContext':
         """Get a specific database context"""
-        if db_name not in self.databases:
-            raise ValueError(f"Database '{db_name}' not found. Available: {list(self.databases.keys())}")
-        return self.databases[db_name]
+        try:
+            return self.databases[db_name]
+        except KeyError:
+            raise ValueError(f"Database '{db_name}' not found. Available: {list(self.databases.keys())}") from None
     
     def list_databases(self) -> List[str]:
         """List all available database names"""
         return list(self.databases.keys())
     
     async def get_all_database_info(self) -> Dict[str, Dict[str, Any]]:
-        """Get vendor info for all databases"""
-        result = {}
-        for db_name, ctx in self.databases.items():
-            try:
-                result[db_name] = await ctx.get_database_info()
-            except Exception as e:
-                result[db_name] = {"error": str(e)}
-        return result
+        """Get vendor info for all databases concurrently (each uses its own pool)"""
+        names = self.list_databases()
+        infos = await asyncio.gather(
+            *(self.databases[db_name].get_database_info() for db_name in names),
+            return_exceptions=True
+        )
+        return {
+            db_name: {"error": str(info)} if isinstance(info, Exception) else info
+            for db_name, info in zip(names, infos)
+        }
 
     async def list_tables(self, db_name: str) -> List[str]:
         """List all table names in the specified database."""
@@ -86,8 +103,8 @@ class MultiDatabaseContext:
 
 
 class DatabaseContext:
-    def __init__(self, connection_string: str, cache_path: Path, target_schema: Optional[str] = None,  use_thick_mode: bool = False, lib_dir: Optional[str] = None, read_only: bool = True):
-        self.db_connector = DatabaseConnector(connection_string, target_schema, use_thick_mode, lib_dir, read_only)
+    def __init__(self, connection_string: str, cache_path: Path, target_schema: Optional[str] = None,  use_thick_mode: bool = False, lib_dir: Optional[str] = None, read_only: bool = True, pool_min: int = 5, pool_max: int = 20):
+        self.db_connector = DatabaseConnector(connection_string, target_schema, use_thick_mode, lib_dir, read_only, pool_min, pool_max)
         self.schema_manager = SchemaManager(self.db_connector, cache_path)
         # Set the schema manager reference in the connector
         self.db_connector.set_schema_manager(self.schema_manager)
@@ -105,14 +122,30 @@ class DatabaseContext:
         """Get information about the database vendor and version"""
         return await self.db_connector.get_database_info()
         
+    def get_pool_stats(self) -> Optional[Dict[str, int]]:
+        """Get connection pool usage for this database"""
+        return self.db_connector.get_pool_stats()
+        
     async def get_schema_info(self, table_name: str) -> Optional[TableInfo]:
         """Get schema information for a specific table"""
         return await self.schema_manager.get_schema_info(table_name)
     
+    async def batch_get_schema_info(self, table_names: List[str]) -> Dict[str, Optional[TableInfo]]:
+        """Get schema information for several tables, loading uncached ones together"""
+        return await self.schema_manager.get_schema_infos(table_names)
+    
     async def search_tables(self, search_term: str, limit: int = 20) -> List[str]:
         """Search for table names matching the search term"""
         return await self.schema_manager.search_tables(search_term, limit)
         
+    async def get_object_columns(self, object_name: str, owner: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get the columns of a table or view from the data dictionary.
+        
+        Unlike get_schema_info this also covers views and other schemas' objects;
+        the name is used as given, so callers canonicalize it first.
+        """
+        return await self.db_connector.get_object_columns(object_name, owner)
+        
     async def rebuild_cache(self, fetch_all_metadata: bool = False) -> None:
         """Force a rebuild of the schema cache
         
@@ -124,10 +157,15 @@ class DatabaseContext:
             force_rebuild=True, 
             fetch_all_metadata=fetch_all_metadata
         )
+        self.schema_manager.version += 1
         
     async def search_columns(self, search_term: str, limit: int = 50) -> Dict[str, List[Dict[str, Any]]]:
         """Search for columns matching the given pattern across all tables"""
         return await self.schema_manager.search_columns(search_term, limit)
+
+    def iter_search_columns(self, search_term: str, limit: int = 50) -> AsyncIterator[Any]:
+        """Yield (table name, matching columns) pairs as the search finds them"""
+        return self.schema_manager.iter_search_columns(search_term, limit)
         
     async def get_pl_sql_objects(self, object_type: str, name_pattern: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get information about PL/SQL objects of the specified type"""
@@ -182,9 +220,34 @@ class DatabaseContext:
         await self.schema_manager.save_cache()
         return result
         
+    async def get_table_all_metadata(self, table_name: str) -> Dict[str, Any]:
+        """Get constraints, indexes and related tables for a table concurrently.
+        
+        Each lookup goes through its own TTL cache; misses run on separate
+        pooled connections, so the slowest query bounds the latency.
+        """
+        constraints, indexes, related = await asyncio.gather(
+            self.get_table_constraints(table_name),
+            self.get_table_indexes(table_name),
+            self.get_related_tables(table_name)
+        )
+        return {"constraints": constraints, "indexes": indexes, "related": related}
+        
     async def get_dependent_objects(self, object_name: str) -> List[Dict[str, Any]]:
         """Get objects that depend on the specified object"""
-        return await self.db_connector.get_dependent_objects(object_name)
+        # Check cache first
+        if self.schema_manager.is_cache_valid('dependencies', object_name):
+            self.schema_manager.cache_stats['hits'] += 1
+            return self.schema_manager.object_cache['dependencies'][object_name]['data']
+        
+        # If not in cache or expired, get from database
+        self.schema_manager.cache_stats['misses'] += 1
+        result = await self.db_connector.get_dependent_objects(object_name)
+        
+        # Update cache
+        self.schema_manager.update_cache('dependencies', object_name, result)
+        await self.schema_manager.save_cache()
+        return result
         
     async def get_user_defined_types(self, type_pattern: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get information about user-defined types"""
@@ -222,7 +285,30 @@ class DatabaseContext:
 
     async def run_sql_query(self, sql: str, params: Optional[Dict[str, Any]] = None, max_rows: int = 100) -> Dict[str, Any]:
         """Runs a SQL query and returns the results."""
-        return await self.db_connector.execute_sql_query(sql, params, max_rows)
+        result = await self.db_connector.execute_sql_query(sql, params, max_rows)
+        # Cached metadata of a table whose definition just changed is stale.
+        # The cache only covers the effective schema; DDL qualified with
+        # another owner leaves it alone.
+        target = ddl_target_table(sql)
+        if target is not None:
+            verb, owner, table_name = target
+            if owner is None or owner == await self.db_connector.get_effective_schema():
+                await self.schema_manager.invalidate_table(table_name, exists=verb != "DROP")
+            return result
+        index = dropped_index(sql)
+        if index is not None:
+            owner, index_name = index
+            if owner is None or owner == await self.db_connector.get_effective_schema():
+                await self.schema_manager.invalidate_index(index_name)
+        return result
+
+    def pinned_connection(self) -> AsyncContextManager[Any]:
+        """Keep all queries of the enclosed block on one pooled connection"""
+        return self.db_connector.pinned_connection()
+
+    def stream_sql_query(self, sql: str, params: Optional[Dict[str, Any]] = None, max_rows: int = 10000, batch_size: int = 500) -> AsyncIterator[Any]:
+        """Stream a SELECT query: yields the column names, then batches of row dicts."""
+        return self.db_connector.stream_sql_query(sql, params, max_rows, batch_size)
 
     async def explain_query_plan(self, query: str) -> Dict[str, Any]:
         """Get execution plan for an SQL query with optimization suggestions"""
@@ -3,12 +3,24 @@ import oracledb
 import sqlparse
 import time
 import asyncio
-from typing import Dict, List, Set, Optional, Any
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Dict, List, Set, Optional, Any
 from pathlib import Path
 from .models import SchemaManager
 
+# Fetch more rows per round trip than the driver default of 100
+oracledb.defaults.arraysize = 500
+
 class DatabaseConnector:
-    def __init__(self, connection_string: str, target_schema: Optional[str] = None, use_thick_mode: bool = False, lib_dir: Optional[str] = None, read_only: bool = True):
+    # Seconds an idle connection above pool_min stays open, so the pool shrinks
+    # back after bursts. Connections idle for over ping_interval (driver
+    # default 60s) are pinged on acquire, replacing dead ones transparently.
+    POOL_IDLE_TIMEOUT = 300
+    # Upper bound on rows fetched per round trip by execute_sql_query
+    MAX_FETCH_ARRAYSIZE = 10000
+
+    def __init__(self, connection_string: str, target_schema: Optional[str] = None, use_thick_mode: bool = False, lib_dir: Optional[str] = None, read_only: bool = True, pool_min: int = 5, pool_max: int = 20):
         """Create a new connector.
 
         Args:
@@ -17,14 +29,20 @@ class DatabaseConnector:
             use_thick_mode: Whether to use thick mode for Oracle client
             lib_dir: Optional Oracle client library directory
             read_only: When True (default) all write operations will be blocked.
+            pool_min: Connections opened when the pool is created
+            pool_max: Upper bound on pooled connections
         """
         self.connection_string = connection_string
         self.schema_manager: Optional[SchemaManager] = None  # Will be set by DatabaseContext
         self.target_schema: Optional[str] = target_schema
         self.thick_mode = use_thick_mode
         self.read_only = read_only
+        self.pool_min = pool_min
+        self.pool_max = max(pool_min, pool_max)
         self._pool = None
         self._pool_lock = asyncio.Lock()
+        # Connection pinned to the current task by pinned_connection()
+        self._pinned: ContextVar[Any] = ContextVar(f"pinned_connection_{id(self)}", default=None)
         
         # Debug: Log connector initialization with read_only state
         print(f"[DatabaseConnector Init] read_only={self.read_only}", file=sys.stderr)
@@ -49,18 +67,22 @@ class DatabaseConnector:
                     if self.thick_mode:
                         self._pool = oracledb.create_pool(
                             self.connection_string,
-                            min=2,
-                            max=10,
+                            min=self.pool_min,
+                            max=self.pool_max,
                             increment=1,
-                            getmode=oracledb.POOL_GETMODE_WAIT
+                            getmode=oracledb.POOL_GETMODE_WAIT,
+                            timeout=self.POOL_IDLE_TIMEOUT,
+                            stmtcachesize=200
                         )
                     else:
                         self._pool = oracledb.create_pool_async(
                             self.connection_string,
-                            min=2,
-                            max=10,
+                            min=self.pool_min,
+                            max=self.pool_max,
                             increment=1,
-                            getmode=oracledb.POOL_GETMODE_WAIT
+                            getmode=oracledb.POOL_GETMODE_WAIT,
+                            timeout=self.POOL_IDLE_TIMEOUT,
+                            stmtcachesize=200
                         )
                     print("Database connection pool initialized", file=sys.stderr)
                 except Exception as e:
@@ -68,7 +90,11 @@ class DatabaseConnector:
                     raise
 
     async def get_connection(self):
-        """Get a connection from the pool"""
+        """Get a connection from the pool, or the one pinned to this task"""
+        pinned = self._pinned.get()
+        if pinned is not None:
+            return pinned
+        
         if self._pool is None:
             await self.initialize_pool()
             
@@ -82,7 +108,9 @@ class DatabaseConnector:
             raise
 
     async def _close_connection(self, conn):
-        """Return connection to the pool"""
+        """Return connection to the pool (a pinned connection stays checked out)"""
+        if conn is self._pinned.get():
+            return
         try:
             if self.thick_mode:
                 self._pool.release(conn)
@@ -91,6 +119,51 @@ class DatabaseConnector:
         except Exception as e:
             print(f"Error releasing connection to pool: {e}", file=sys.stderr)
 
+    @asynccontextmanager
+    async def pinned_connection(self) -> AsyncIterator[Any]:
+        """Run every query of the enclosed block on one pooled connection.
+        
+        Oracle's session cursor cache and the driver statement cache are per
+        session, so handlers issuing many statements get cache hits only if
+        they stay on the same connection. Nested use reuses the outer pin.
+        The pinned connection must not be used by concurrent tasks.
+        """
+        pinned = self._pinned.get()
+        if pinned is not None:
+            yield pinned
+            return
+        
+        conn = await self.get_connection()
+        token = self._pinned.set(conn)
+        try:
+            yield conn
+        finally:
+            self._pinned.reset(token)
+            await self._close_connection(conn)
+
+    @property
+    def max_parallel_queries(self) -> int:
+        """How many statements concurrent tasks can usefully run at once.
+        
+        Thick mode calls block the event loop and a pinned connection must not
+        be shared, so both allow one. Otherwise one pooled connection is left
+        free for other requests.
+        """
+        if self.thick_mode or self._pinned.get() is not None:
+            return 1
+        return max(1, self.pool_max - 1)
+
+    def get_pool_stats(self) -> Optional[Dict[str, int]]:
+        """Return connection pool usage, or None before the pool exists"""
+        if self._pool is None:
+            return None
+        return {
+            "min": self.pool_min,
+            "max": self.pool_max,
+            "opened": self._pool.opened,
+            "busy": self._pool.busy,
+        }
+
     async def close_pool(self):
         """Close the connection pool"""
         if self._pool:
@@ -228,6 +301,20 @@ class DatabaseConnector:
         finally:
             await self._close_connection(conn)
     
+    async def _fetch_for_tables(self, cursor, sql: str, table_names: List[str], **params) -> List[Any]:
+        """Run a query once per chunk of table names and concatenate the rows.
+        
+        The query marks the table name list with {tables}; each chunk is bound
+        as :t0, :t1, ... Oracle allows at most 1000 expressions in an IN list.
+        """
+        rows = []
+        for start in range(0, len(table_names), 1000):
+            chunk = table_names[start:start + 1000]
+            binds = {f"t{i}": name for i, name in enumerate(chunk)}
+            tables = ", ".join(f":{key}" for key in binds)
+            rows.extend(await self._execute_cursor_fetch(cursor, sql.format(tables=tables), **params, **binds))
+        return rows
+    
     async def load_table_details(self, table_name: str, fetch_all_metadata: bool = False) -> Optional[Dict[str, Any]]:
         """Load detailed schema information for a specific table with optimized queries
         
@@ -235,43 +322,63 @@ class DatabaseConnector:
             table_name: Name of the table to load
             fetch_all_metadata: If True, fetches constraints, indexes, statistics, and comments in addition to basic schema
         """
+        details = await self.load_tables_details([table_name], fetch_all_metadata)
+        return details.get(table_name.upper())
+    
+    async def load_tables_details(self, table_names: List[str], fetch_all_metadata: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Load detailed schema information for several tables at once
+        
+        Each kind of metadata is fetched with one query over all requested
+        tables instead of one query per table. Tables that do not exist are
+        left out of the result.
+        
+        Args:
+            table_names: Names of the tables to load
+            fetch_all_metadata: If True, fetches constraints, indexes, statistics, and comments in addition to basic schema
+        """
+        names = list(dict.fromkeys(name.upper() for name in table_names))
+        if not names:
+            return {}
+        
         conn = await self.get_connection()
         try:
             cursor = conn.cursor()
             schema = await self._get_effective_schema(conn)
             
-            # Check if the table exists using result cache
-            table_exists = await self._execute_cursor_fetch(
+            # Check which tables exist; statistics come from the same rows
+            tables = await self._fetch_for_tables(
                 cursor,
                 """
-                SELECT /*+ RESULT_CACHE */ COUNT(*) 
+                SELECT /*+ RESULT_CACHE */ table_name, num_rows, blocks, avg_row_len, last_analyzed
                 FROM all_tables 
-                WHERE owner = :owner AND table_name = :table_name
+                WHERE owner = :owner AND table_name IN ({tables})
                 """,
-                owner=schema, 
-                table_name=table_name.upper()
+                names,
+                owner=schema
             )
             
-            if table_exists[0][0] == 0:
-                return None
+            if not tables:
+                return {}
+            
+            results = {row[0]: {"columns": [], "relationships": {}} for row in tables}
+            names = [name for name in names if name in results]
                 
             # Get column information with data length, precision, scale, and default values
-            columns = await self._execute_cursor_fetch(
+            columns = await self._fetch_for_tables(
                 cursor,
                 """
                 SELECT /*+ RESULT_CACHE INDEX(atc) */ 
-                    column_name, data_type, nullable, data_length, 
+                    table_name, column_name, data_type, nullable, data_length, 
                     data_precision, data_scale, data_default
                 FROM all_tab_columns atc
-                WHERE owner = :owner AND table_name = :table_name
-                ORDER BY column_id
+                WHERE owner = :owner AND table_name IN ({tables})
+                ORDER BY table_name, column_id
                 """,
-                owner=schema, 
-                table_name=table_name.upper()
+                names,
+                owner=schema
             )
             
-            column_info = []
-            for column, data_type, nullable, data_len, precision, scale, default_val in columns:
+            for table, column, data_type, nullable, data_len, precision, scale, default_val in columns:
                 col_dict = {
                     "name": column,
                     "type": data_type,
@@ -286,13 +393,14 @@ class DatabaseConnector:
                     col_dict["scale"] = scale
                 if default_val:
                     col_dict["default"] = str(default_val).strip()
-                column_info.append(col_dict)
+                results[table]["columns"].append(col_dict)
             
             # Get relationship information using optimized join order and result cache
-            relationships = await self._execute_cursor_fetch(
+            relationships = await self._fetch_for_tables(
                 cursor,
                 """
                 SELECT /*+ RESULT_CACHE */
+                    ac.table_name AS owning_table,
                     'OUTGOING' AS relationship_direction,
                     acc.column_name AS source_column,
                     rcc.table_name AS referenced_table,
@@ -304,36 +412,34 @@ class DatabaseConnector:
                                         AND rcc.owner = ac.r_owner
                 WHERE ac.constraint_type = 'R'
                 AND ac.owner = :owner
-                AND ac.table_name = :table_name
+                AND ac.table_name IN ({tables})
 
                 UNION ALL
 
                 SELECT /*+ RESULT_CACHE */
+                    pc.table_name AS owning_table,
                     'INCOMING' AS relationship_direction,
                     rcc.column_name AS source_column,
                     ac.table_name AS referenced_table,
                     acc.column_name AS referenced_column
                 FROM all_constraints ac
+                JOIN all_constraints pc ON pc.constraint_name = ac.r_constraint_name
+                                       AND pc.owner = ac.r_owner
                 JOIN all_cons_columns acc ON acc.constraint_name = ac.constraint_name
                                         AND acc.owner = ac.owner
                 JOIN all_cons_columns rcc ON rcc.constraint_name = ac.r_constraint_name
                                         AND rcc.owner = ac.r_owner
                 WHERE ac.constraint_type = 'R'
                 AND ac.r_owner = :owner
-                AND ac.r_constraint_name IN (
-                    SELECT constraint_name 
-                    FROM all_constraints
-                    WHERE owner = :owner
-                    AND table_name = :table_name
-                    AND constraint_type IN ('P', 'U')
-                )
+                AND pc.constraint_type IN ('P', 'U')
+                AND pc.table_name IN ({tables})
                 """,
-                owner=schema, 
-                table_name=table_name.upper()
+                names,
+                owner=schema
             )
             
-            relationship_info = {}
-            for direction, column, ref_table, ref_column in relationships:
+            for table, direction, column, ref_table, ref_column in relationships:
+                relationship_info = results[table]["relationships"]
                 if ref_table not in relationship_info:
                     relationship_info[ref_table] = []
                 relationship_info[ref_table].append({
@@ -342,95 +448,76 @@ class DatabaseConnector:
                     "direction": direction
                 })
             
-            result = {
-                "columns": column_info,
-                "relationships": relationship_info
-            }
-            
             # Fetch additional metadata if requested
             if fetch_all_metadata:
                 # Get table and column comments
                 try:
-                    table_comment = await self._execute_cursor_fetch(
+                    table_comments = await self._fetch_for_tables(
                         cursor,
                         """
-                        SELECT comments
+                        SELECT table_name, comments
                         FROM all_tab_comments
-                        WHERE owner = :owner AND table_name = :table_name
+                        WHERE owner = :owner AND table_name IN ({tables})
+                        AND comments IS NOT NULL
                         """,
-                        owner=schema,
-                        table_name=table_name.upper()
+                        names,
+                        owner=schema
                     )
                     
-                    column_comments = await self._execute_cursor_fetch(
+                    column_comments = await self._fetch_for_tables(
                         cursor,
                         """
-                        SELECT column_name, comments
+                        SELECT table_name, column_name, comments
                         FROM all_col_comments
-                        WHERE owner = :owner AND table_name = :table_name
+                        WHERE owner = :owner AND table_name IN ({tables})
                         AND comments IS NOT NULL
                         """,
-                        owner=schema,
-                        table_name=table_name.upper()
+                        names,
+                        owner=schema
                     )
                     
-                    comments = {}
-                    if table_comment and table_comment[0][0]:
-                        comments["table"] = table_comment[0][0]
-                    if column_comments:
-                        comments["columns"] = {col[0]: col[1] for col in column_comments}
-                    
-                    if comments:
-                        result["comments"] = comments
+                    for table, comment in table_comments:
+                        results[table].setdefault("comments", {})["table"] = comment
+                    for table, column, comment in column_comments:
+                        results[table].setdefault("comments", {}).setdefault("columns", {})[column] = comment
                 except Exception as e:
-                    print(f"Warning: Could not fetch comments for {table_name}: {e}", file=sys.stderr)
+                    print(f"Warning: Could not fetch comments for {', '.join(names)}: {e}", file=sys.stderr)
                 
-                # Get table statistics
-                try:
-                    stats = await self._execute_cursor_fetch(
-                        cursor,
-                        """
-                        SELECT num_rows, blocks, avg_row_len, last_analyzed
-                        FROM all_tables
-                        WHERE owner = :owner AND table_name = :table_name
-                        """,
-                        owner=schema,
-                        table_name=table_name.upper()
-                    )
+                # Table statistics were read with the existence check
+                for table, num_rows, blocks, avg_row_len, last_analyzed in tables:
+                    table_stats = {}
+                    if num_rows is not None:
+                        table_stats["row_count"] = num_rows
+                    if blocks is not None:
+                        table_stats["blocks"] = blocks
+                    if avg_row_len is not None:
+                        table_stats["avg_row_length"] = avg_row_len
+                    if last_analyzed:
+                        table_stats["last_analyzed"] = str(last_analyzed)
                     
-                    if stats and stats[0]:
-                        num_rows, blocks, avg_row_len, last_analyzed = stats[0]
-                        table_stats = {}
-                        if num_rows is not None:
-                            table_stats["row_count"] = num_rows
-                        if blocks is not None:
-                            table_stats["blocks"] = blocks
-                        if avg_row_len is not None:
-                            table_stats["avg_row_length"] = avg_row_len
-                        if last_analyzed:
-                            table_stats["last_analyzed"] = str(last_analyzed)
-                        
-                        if table_stats:
-                            result["table_stats"] = table_stats
-                except Exception as e:
-                    print(f"Warning: Could not fetch statistics for {table_name}: {e}", file=sys.stderr)
+                    if table_stats:
+                        results[table]["table_stats"] = table_stats
                 
                 # Get constraints
                 try:
-                    result["constraints"] = await self.get_table_constraints(table_name)
+                    constraints = await self._fetch_constraints(cursor, schema, names)
+                    for table in names:
+                        results[table]["constraints"] = constraints[table]
                 except Exception as e:
-                    print(f"Warning: Could not fetch constraints for {table_name}: {e}", file=sys.stderr)
+                    print(f"Warning: Could not fetch constraints for {', '.join(names)}: {e}", file=sys.stderr)
                 
                 # Get indexes
                 try:
-                    result["indexes"] = await self.get_table_indexes(table_name)
+                    indexes = await self._fetch_indexes(cursor, schema, names)
+                    for table in names:
+                        results[table]["indexes"] = indexes[table]
                 except Exception as e:
-                    print(f"Warning: Could not fetch indexes for {table_name}: {e}", file=sys.stderr)
+                    print(f"Warning: Could not fetch indexes for {', '.join(names)}: {e}", file=sys.stderr)
                 
-            return result
+            return results
             
         except oracledb.Error as e:
-            print(f"Error loading table details for {table_name}: {str(e)}", file=sys.stderr)
+            print(f"Error loading table details for {', '.join(names)}: {str(e)}", file=sys.stderr)
             raise
         finally:
             await self._close_connection(conn)
@@ -449,31 +536,20 @@ class DatabaseConnector:
                 where_clause += " AND object_name LIKE :name_pattern"
                 params["name_pattern"] = name_pattern.upper()
             
+            # Large schemas can hold thousands of objects: fetch in few round trips
+            # and let Oracle format the dates so rows map straight onto dicts
+            cursor.arraysize = 5000
             objects = await self._execute_cursor_fetch(cursor, f"""
-                SELECT object_name, object_type, status, created, last_ddl_time
+                SELECT object_name, object_type, owner, status,
+                       TO_CHAR(created, 'YYYY-MM-DD HH24:MI:SS'),
+                       TO_CHAR(last_ddl_time, 'YYYY-MM-DD HH24:MI:SS')
                 FROM all_objects
                 {where_clause}
                 ORDER BY object_name
             """, **params)
             
-            result = []
-            
-            for name, obj_type, status, created, last_modified in objects:
-                obj_info = {
-                    "name": name,
-                    "type": obj_type,
-                    "status": status,
-                    "owner": schema
-                }
-                
-                if created:
-                    obj_info["created"] = created.strftime("%Y-%m-%d %H:%M:%S")
-                if last_modified:
-                    obj_info["last_modified"] = last_modified.strftime("%Y-%m-%d %H:%M:%S")
-                
-                result.append(obj_info)
-            
-            return result
+            keys = ("name", "type", "owner", "status", "created", "last_modified")
+            return [dict(zip(keys, row)) for row in objects]
         finally:
             await self._close_connection(conn)
     
@@ -532,76 +608,89 @@ class DatabaseConnector:
         try:
             cursor = conn.cursor()
             schema = await self._get_effective_schema(conn)
+            constraints = await self._fetch_constraints(cursor, schema, [table_name.upper()])
+            return constraints[table_name.upper()]
+        finally:
+            await self._close_connection(conn)
+    
+    async def _fetch_constraints(self, cursor, schema: str, table_names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the constraints of several tables, keyed by table name
+        
+        Constraint columns and foreign key targets are read in one query each
+        for all tables rather than once per constraint.
+        """
+        # Get all constraints for the tables
+        constraints = await self._fetch_for_tables(cursor, """
+            SELECT ac.table_name,
+                   ac.constraint_name,
+                   ac.constraint_type,
+                   ac.search_condition
+            FROM all_constraints ac
+            WHERE ac.owner = :owner
+            AND ac.table_name IN ({tables})
+        """, table_names, owner=schema)
+        
+        # Get columns involved in these constraints
+        column_rows = await self._fetch_for_tables(cursor, """
+            SELECT acc.constraint_name,
+                   acc.column_name
+            FROM all_cons_columns acc
+            WHERE acc.owner = :owner
+            AND acc.table_name IN ({tables})
+            ORDER BY acc.constraint_name, acc.position
+        """, table_names, owner=schema)
+        
+        # For foreign keys, get the referenced table/columns
+        ref_rows = await self._fetch_for_tables(cursor, """
+            SELECT ac.constraint_name,
+                   rc.table_name,
+                   rcc.column_name
+            FROM all_constraints ac
+            JOIN all_constraints rc ON rc.constraint_name = ac.r_constraint_name
+                                   AND rc.owner = ac.r_owner
+            JOIN all_cons_columns rcc ON rcc.constraint_name = rc.constraint_name
+                                     AND rcc.owner = rc.owner
+            WHERE ac.owner = :owner
+            AND ac.constraint_type = 'R'
+            AND ac.table_name IN ({tables})
+            ORDER BY ac.constraint_name, rcc.position
+        """, table_names, owner=schema)
+        
+        constraint_columns: Dict[str, List[str]] = {}
+        for constraint_name, column_name in column_rows:
+            constraint_columns.setdefault(constraint_name, []).append(column_name)
+        
+        references: Dict[str, Dict[str, Any]] = {}
+        for constraint_name, ref_table, ref_column in ref_rows:
+            references.setdefault(constraint_name, {"table": ref_table, "columns": []})["columns"].append(ref_column)
+        
+        # Map constraint type codes to descriptions
+        type_map = {
+            'P': 'PRIMARY KEY',
+            'R': 'FOREIGN KEY',
+            'U': 'UNIQUE',
+            'C': 'CHECK'
+        }
+        
+        result: Dict[str, List[Dict[str, Any]]] = {name: [] for name in table_names}
+        
+        for table, constraint_name, constraint_type, condition in constraints:
+            constraint_info = {
+                "name": constraint_name,
+                "type": type_map.get(constraint_type, constraint_type),
+                "columns": constraint_columns.get(constraint_name, [])
+            }
             
-            # Get all constraints for the table
-            constraints = await self._execute_cursor_fetch(cursor, """
-                SELECT ac.constraint_name,
-                       ac.constraint_type,
-                       ac.search_condition
-                FROM all_constraints ac
-                WHERE ac.owner = :owner
-                AND ac.table_name = :table_name
-            """, owner=schema, table_name=table_name.upper())
+            if constraint_type == 'R' and constraint_name in references:
+                constraint_info["references"] = references[constraint_name]
             
-            result = []
+            # For check constraints, include the condition
+            if constraint_type == 'C' and condition:
+                constraint_info["condition"] = condition
             
-            for constraint_name, constraint_type, condition in constraints:
-                # Map constraint type codes to descriptions
-                type_map = {
-                    'P': 'PRIMARY KEY',
-                    'R': 'FOREIGN KEY',
-                    'U': 'UNIQUE',
-                    'C': 'CHECK'
-                }
-                
-                constraint_info = {
-                    "name": constraint_name,
-                    "type": type_map.get(constraint_type, constraint_type)
-                }
-                
-                # Get columns involved in this constraint
-                columns = await self._execute_cursor_fetch(cursor, """
-                    SELECT column_name
-                    FROM all_cons_columns
-                    WHERE owner = :owner
-                    AND constraint_name = :constraint_name
-                    ORDER BY position
-                """, owner=schema, constraint_name=constraint_name)
-                
-                constraint_info["columns"] = [col[0] for col in columns]
-                
-                # If it's a foreign key, get the referenced table/columns
-                if constraint_type == 'R':
-                    ref_info = await self._execute_cursor_fetch(cursor, """
-                        SELECT ac.table_name,
-                               acc.column_name
-                        FROM all_constraints ac
-                        JOIN all_cons_columns acc ON ac.constraint_name = acc.constraint_name
-                        WHERE ac.constraint_name = (
-                            SELECT r_constraint_name
-                            FROM all_constraints
-                            WHERE owner = :owner
-                            AND constraint_name = :constraint_name
-                        )
-                        AND acc.owner = ac.owner
-                        ORDER BY acc.position
-                    """, owner=schema, constraint_name=constraint_name)
-                    
-                    if ref_info:
-                        constraint_info["references"] = {
-                            "table": ref_info[0][0],
-                            "columns": [col[1] for col in ref_info]
-                        }
-                
-                # For check constraints, include the condition
-                if constraint_type == 'C' and condition:
-                    constraint_info["condition"] = condition
-                
-                result.append(constraint_info)
-            
-            return result
-        finally:
-            await self._close_connection(conn)
+            result.setdefault(table, []).append(constraint_info)
+        
+        return result
     
     async def get_table_indexes(self, table_name: str) -> List[Dict[str, Any]]:
         """Get table indexes"""
@@ -609,48 +698,58 @@ class DatabaseConnector:
         try:
             cursor = conn.cursor()
             schema = await self._get_effective_schema(conn)
+            indexes = await self._fetch_indexes(cursor, schema, [table_name.upper()])
+            return indexes[table_name.upper()]
+        finally:
+            await self._close_connection(conn)
+    
+    async def _fetch_indexes(self, cursor, schema: str, table_names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the indexes of several tables, keyed by table name"""
+        # Get all indexes for the tables
+        indexes = await self._fetch_for_tables(cursor, """
+            SELECT ai.table_name,
+                   ai.index_name,
+                   ai.uniqueness,
+                   ai.tablespace_name,
+                   ai.status
+            FROM all_indexes ai
+            WHERE ai.owner = :owner
+            AND ai.table_name IN ({tables})
+        """, table_names, owner=schema)
+        
+        # Get columns in these indexes
+        column_rows = await self._fetch_for_tables(cursor, """
+            SELECT aic.index_name,
+                   aic.column_name
+            FROM all_ind_columns aic
+            WHERE aic.index_owner = :owner
+            AND aic.table_name IN ({tables})
+            ORDER BY aic.index_name, aic.column_position
+        """, table_names, owner=schema)
+        
+        index_columns: Dict[str, List[str]] = {}
+        for index_name, column_name in column_rows:
+            index_columns.setdefault(index_name, []).append(column_name)
+        
+        result: Dict[str, List[Dict[str, Any]]] = {name: [] for name in table_names}
+        
+        for table, index_name, uniqueness, tablespace, status in indexes:
+            index_info = {
+                "name": index_name,
+                "unique": uniqueness == 'UNIQUE'
+            }
             
-            # Get all indexes for the table
-            indexes = await self._execute_cursor_fetch(cursor, """
-                SELECT ai.index_name,
-                       ai.uniqueness,
-                       ai.tablespace_name,
-                       ai.status
-                FROM all_indexes ai
-                WHERE ai.owner = :owner
-                AND ai.table_name = :table_name
-            """, owner=schema, table_name=table_name.upper())
+            if tablespace:
+                index_info["tablespace"] = tablespace
             
-            result = []
+            if status:
+                index_info["status"] = status
             
-            for index_name, uniqueness, tablespace, status in indexes:
-                index_info = {
-                    "name": index_name,
-                    "unique": uniqueness == 'UNIQUE'
-                }
-                
-                if tablespace:
-                    index_info["tablespace"] = tablespace
-                
-                if status:
-                    index_info["status"] = status
-                
-                # Get columns in this index
-                columns = await self._execute_cursor_fetch(cursor, """
-                    SELECT column_name
-                    FROM all_ind_columns
-                    WHERE index_owner = :owner
-                    AND index_name = :index_name
-                    ORDER BY column_position
-                """, owner=schema, index_name=index_name)
-                
-                index_info["columns"] = [col[0] for col in columns]
-                
-                result.append(index_info)
+            index_info["columns"] = index_columns.get(index_name, [])
             
-            return result
-        finally:
-            await self._close_connection(conn)
+            result.setdefault(table, []).append(index_info)
+        
+        return result
     
     async def get_dependent_objects(self, object_name: str) -> List[Dict[str, Any]]:
         """Get objects that depend on the specified object"""
@@ -873,6 +972,32 @@ class DatabaseConnector:
         finally:
             await self._close_connection(conn)
 
+    async def get_object_columns(self, object_name: str, owner: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get the columns of any table or view visible to the connection
+        
+        Args:
+            object_name: Exact (already canonicalized) table or view name
+            owner: Owning schema; defaults to the effective schema
+        """
+        conn = await self.get_connection()
+        try:
+            cursor = conn.cursor()
+            if owner is None:
+                owner = await self._get_effective_schema(conn)
+            rows = await self._execute_cursor_fetch(cursor, """
+                SELECT column_name, data_type, nullable
+                FROM all_tab_columns
+                WHERE owner = :owner AND table_name = :object_name
+                ORDER BY column_id
+            """, owner=owner, object_name=object_name)
+            
+            return [
+                {"name": column_name, "type": data_type, "nullable": nullable == 'Y'}
+                for column_name, data_type, nullable in rows
+            ]
+        finally:
+            await self._close_connection(conn)
+
 
     async def execute_sql_query(self, sql: str, params: Optional[Dict[str, Any]] = None, max_rows: int = 100) -> Dict[str, Any]:
         """
@@ -895,6 +1020,9 @@ class DatabaseConnector:
             
             # Check if this is a SELECT query (has description)
             if self._is_select_query(sql):
+                # Size fetches to the row limit: results of up to
+                # MAX_FETCH_ARRAYSIZE rows arrive with the execute round trip
+                cursor.arraysize = cursor.prefetchrows = max(1, min(max_rows, self.MAX_FETCH_ARRAYSIZE))
                 rows = await self._execute_cursor_fetch(cursor, sql, max_rows, **(params or {}))
                 
                 # Safely get column names
@@ -959,6 +1087,57 @@ class DatabaseConnector:
                     pass
             await self._close_connection(conn)
 
+    async def stream_sql_query(self, sql: str, params: Optional[Dict[str, Any]] = None, max_rows: int = 10000, batch_size: int = 500) -> AsyncIterator[Any]:
+        """
+        Executes a SELECT query and streams its results from the server cursor.
+        
+        Args:
+            sql: The SELECT query to execute.
+            params: A dictionary of bind parameters for the query.
+            max_rows: The maximum number of rows to stream.
+            batch_size: Number of rows fetched per round trip.
+            
+        Yields:
+            First the list of column names, then lists of row dicts of at most
+            batch_size rows each. Only one batch is held in memory at a time.
+        """
+        if not self._is_select_query(sql):
+            raise ValueError("Only SELECT statements can be streamed.")
+        self._assert_query_executable(sql)
+        
+        conn = await self.get_connection()
+        cursor = None
+        try:
+            cursor = conn.cursor()
+            cursor.arraysize = batch_size
+            cursor.prefetchrows = batch_size
+            if self.thick_mode:
+                cursor.execute(sql, **(params or {}))
+            else:
+                await cursor.execute(sql, **(params or {}))
+            
+            columns = [desc[0] for desc in cursor.description] if cursor.description else []
+            yield columns
+            
+            remaining = max_rows
+            while remaining > 0:
+                size = min(batch_size, remaining)
+                if self.thick_mode:
+                    rows = cursor.fetchmany(size)
+                else:
+                    rows = await cursor.fetchmany(size)
+                if not rows:
+                    break
+                remaining -= len(rows)
+                yield [dict(zip(columns, row)) for row in rows]
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+            await self._close_connection(conn)
+
     async def explain_query_plan(self, query: str) -> Dict[str, Any]:
         """
         Get the execution plan for a given SQL query and provide optimization suggestions.
@@ -15,6 +15,11 @@ class TableInfo:
     table_stats: Optional[Dict[str, Any]] = None
     comments: Optional[Dict[str, str]] = None  # table and column comments
 
+    def __post_init__(self) -> None:
+        # Callers may pass None for a table without relationships
+        if self.relationships is None:
+            self.relationships = {}
+
     def format_schema(self) -> str:
         """Format the schema information for the table, with smart relationship grouping.
         
@@ -32,6 +37,11 @@ class SchemaCache:
     tables: Dict[str, TableInfo]
     last_updated: float
     all_table_names: Set[str]  # Set of all table names in the database
+    # Number of fully loaded entries in tables; kept current by the schema manager
+    fully_loaded_count: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        self.fully_loaded_count = sum(1 for t in self.tables.values() if t.fully_loaded)
 
 class SchemaManager(Protocol):
     """Protocol defining the interface for schema management"""
@@ -95,6 +95,19 @@ MIN_PREFIX_LENGTH = 3                 # Minimum length for meaningful prefix gro
 # Output safety/UX limits
 MAX_CELL_WIDTH = 120                  # Truncate very wide cell values to prevent token bloat / prompt abuse
 
+# Common table naming patterns (compiled pattern, display name), tried in order
+TABLE_NAME_PATTERNS = tuple((re.compile(pattern), display) for pattern, display in (
+    (r'^HIST_', 'HIST_*'),
+    (r'^TMP_', 'TMP_*'),
+    (r'^BAK_', 'BAK_*'),
+    (r'^ARCH_', 'ARCH_*'),
+    (r'_HISTORY$', '*_HISTORY'),
+    (r'_ARCHIVE$', '*_ARCHIVE'),
+    (r'_BACKUP$', '*_BACKUP'),
+    (r'_\d{4,}$', '*_YYYY'),  # Tables with year suffixes
+    (r'_[A-Z]{2,3}$', '*_XX'),  # Tables with 2-3 letter suffixes
+))
+
 def format_schema(table_name: str, columns: List[Dict[str, Any]], 
                 relationships: Dict[str, Dict[str, Any]]) -> str:
     """Format complete schema information for a table."""
@@ -232,25 +245,13 @@ def _group_relationships(relationships: List[tuple]) -> List[Dict[str, Any]]:
 
 def _group_by_patterns(relationships: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
     """Group tables by common naming patterns like HIST_, TMP_, etc."""
-    common_patterns = {
-        r'^HIST_': 'HIST_*',
-        r'^TMP_': 'TMP_*',
-        r'^BAK_': 'BAK_*',
-        r'^ARCH_': 'ARCH_*',
-        r'_HISTORY$': '*_HISTORY',
-        r'_ARCHIVE$': '*_ARCHIVE',
-        r'_BACKUP$': '*_BACKUP',
-        r'_\d{4,}$': '*_YYYY',  # Tables with year suffixes
-        r'_[A-Z]{2,3}$': '*_XX',  # Tables with 2-3 letter suffixes
-    }
-    
     groups = defaultdict(lambda: {'pattern': '', 'tables': [], 'column_patterns': set()})
     unmatched = []
     
     for table, rel in relationships:
         matched = False
-        for pattern, display in common_patterns.items():
-            if re.search(pattern, table):
+        for pattern, display in TABLE_NAME_PATTERNS:
+            if pattern.search(table):
                 col_pattern = f"{rel['local_column']}->{rel['foreign_column']}"
                 groups[display]['pattern'] = display
                 groups[display]['tables'].append((table, rel))
@@ -1,10 +1,12 @@
+import asyncio
 import json
 import time
 from pathlib import Path
 import sys
-from typing import Dict, List, Set, Optional, Any
+from typing import AsyncIterator, Dict, List, Set, Optional, Any, Tuple
 
 from ..models import TableInfo, SchemaCache, SchemaManager as SchemaManagerProtocol
+from .name_index import TableNameIndex
 
 class SchemaManager(SchemaManagerProtocol):
     def __init__(self, db_connector: Any, cache_path: Path):
@@ -14,6 +16,12 @@ class SchemaManager(SchemaManagerProtocol):
         # Actual cache file path will be set after we get the schema name
         self.cache_path = None
         self.cache: Optional[SchemaCache] = None
+        # Bumped on every forced rebuild; see cache_version
+        self.version = 0
+        # Substring index over cache.all_table_names, rebuilt when the set is
+        # replaced or after _invalidate_name_index() (in-place changes)
+        self._name_index: Optional[TableNameIndex] = None
+        self._name_index_source: Optional[Set[str]] = None
         self.cache_stats = {
             'hits': 0,
             'misses': 0,
@@ -24,16 +32,38 @@ class SchemaManager(SchemaManagerProtocol):
             'constraints': {},
             'indexes': {},
             'types': {},
-            'related_tables': {}  # Added cache for related tables
+            'related_tables': {},  # Added cache for related tables
+            'dependencies': {}
         }
         self.ttl = {
             'plsql': 1800,        # 30 minutes
             'constraints': 3600,   # 1 hour
             'indexes': 3600,      # 1 hour
             'types': 3600,        # 1 hour
-            'related_tables': 1800 # 30 minutes - relationships might change more frequently
+            'related_tables': 1800, # 30 minutes - relationships might change more frequently
+            'dependencies': 1800   # 30 minutes
         }
 
+    @property
+    def cache_version(self) -> str:
+        """Identifies the current schema cache contents; changes whenever it is rebuilt"""
+        last_updated = self.cache.last_updated if self.cache else 0
+        return f"{last_updated}:{self.version}"
+
+    def _table_name_index(self) -> TableNameIndex:
+        """Return the name index, rebuilding it if the cached table name set changed"""
+        names = self.cache.all_table_names
+        # A rebuild replaces the set; every in-place change to it must call
+        # _invalidate_name_index()
+        if self._name_index_source is not names:
+            self._name_index = TableNameIndex(names)
+            self._name_index_source = names
+        return self._name_index
+
+    def _invalidate_name_index(self) -> None:
+        """Force a name index rebuild after cache.all_table_names changed in place"""
+        self._name_index_source = None
+
     async def _initialize_cache_path(self) -> None:
         """Initialize the cache file path using the schema name"""
         schema_name = await self.db_connector.get_effective_schema()
@@ -54,14 +84,30 @@ class SchemaManager(SchemaManagerProtocol):
         if fetch_all_metadata:
             print("Fetching complete metadata for all tables (this may take a while)...", file=sys.stderr)
             schema_index = {}
+            table_names = list(all_table_names)
             
-            # Fetch metadata for all tables
-            for i, table_name in enumerate(all_table_names, 1):
-                try:
-                    if i % 10 == 0:
-                        print(f"Progress: {i}/{len(all_table_names)} tables processed...", file=sys.stderr)
-                    
-                    table_details = await self.db_connector.load_table_details(table_name, fetch_all_metadata=True)
+            # Fetch metadata in batches, a few queries per batch instead of per
+            # table; batches run concurrently on separate pooled connections
+            batches = [table_names[start:start + 200] for start in range(0, len(table_names), 200)]
+            semaphore = asyncio.Semaphore(self.db_connector.max_parallel_queries)
+            processed = 0
+            
+            async def load_batch(batch: List[str]) -> Dict[str, Dict[str, Any]]:
+                nonlocal processed
+                async with semaphore:
+                    try:
+                        details = await self.db_connector.load_tables_details(batch, fetch_all_metadata=True)
+                    except Exception as e:
+                        print(f"Error loading metadata for tables {batch[0]}..{batch[-1]}: {e}", file=sys.stderr)
+                        details = {}
+                processed += len(batch)
+                print(f"Progress: {processed}/{len(table_names)} tables processed...", file=sys.stderr)
+                return details
+            
+            batch_details = await asyncio.gather(*(load_batch(batch) for batch in batches))
+            for batch, details in zip(batches, batch_details):
+                for table_name in batch:
+                    table_details = details.get(table_name)
                     if table_details:
                         schema_index[table_name] = TableInfo(
                             table_name=table_name,
@@ -81,15 +127,6 @@ class SchemaManager(SchemaManagerProtocol):
                             relationships={},
                             fully_loaded=False
                         )
-                except Exception as e:
-                    print(f"Error loading metadata for table {table_name}: {e}", file=sys.stderr)
-                    # Add with minimal info
-                    schema_index[table_name] = TableInfo(
-                        table_name=table_name,
-                        columns=[],
-                        relationships={},
-                        fully_loaded=False
-                    )
             
             print(f"Complete metadata indexing finished for {len(schema_index)} tables", file=sys.stderr)
         else:
@@ -132,7 +169,8 @@ class SchemaManager(SchemaManagerProtocol):
                     
                     # Load additional object caches if they exist
                     if 'object_cache' in data:
-                        self.object_cache = data['object_cache']
+                        # Merge so cache types added since the file was written still exist
+                        self.object_cache.update(data['object_cache'])
                     if 'cache_stats' in data:
                         self.cache_stats = data['cache_stats']
                     
@@ -175,49 +213,118 @@ class SchemaManager(SchemaManagerProtocol):
 
     async def get_schema_info(self, table_name: str) -> Optional[TableInfo]:
         """Get schema information for a specific table, loading it if necessary"""
+        infos = await self.get_schema_infos([table_name])
+        return infos[table_name]
+
+    async def get_schema_infos(self, table_names: List[str]) -> Dict[str, Optional[TableInfo]]:
+        """Get schema information for several tables, loading missing ones in one batch
+        
+        Returns a dict mapping each requested name to its TableInfo, or None
+        when the table does not exist.
+        """
         if not self.cache:
             self.cache = await self.load_or_build_cache()
-            
-        table_name = table_name.upper()
         
-        # Check if we know about this table
-        if table_name not in self.cache.all_table_names:
-            return None
-            
-        # Check if we have the table in our cache
-        if table_name not in self.cache.tables:
-            self.cache.tables[table_name] = TableInfo(
-                columns=[], 
-                relationships={}, 
-                fully_loaded=False
-            )
-            
-        # If the table isn't fully loaded, load it now
-        if not self.cache.tables[table_name].fully_loaded:
-            print(f"Lazily loading details for table {table_name}...", file=sys.stderr)
-            table_details = await self.db_connector.load_table_details(table_name, fetch_all_metadata=True)
-            if table_details:
-                table_info = TableInfo(
-                    table_name=table_name,
-                    columns=table_details.get("columns", []),
-                    relationships=table_details.get("relationships", {}),
-                    constraints=table_details.get("constraints"),
-                    indexes=table_details.get("indexes"),
-                    table_stats=table_details.get("table_stats"),
-                    comments=table_details.get("comments"),
-                    fully_loaded=True
-                )
-                self.cache.tables[table_name] = table_info
-                # Save the updated cache to disk
-                await self.save_cache()
-            else:
-                # Table doesn't actually exist, remove it from our cache
-                self.cache.tables.pop(table_name, None)
-                self.cache.all_table_names.discard(table_name)
-                await self.save_cache()
-                return None
-                
-        return self.cache.tables.get(table_name)
+        canonical = {name: name.upper() for name in table_names}
+        
+        # Only tables we know about and have not fully loaded yet hit the database
+        to_load = [
+            name for name in dict.fromkeys(canonical.values())
+            if name in self.cache.all_table_names
+            and not (name in self.cache.tables and self.cache.tables[name].fully_loaded)
+        ]
+        
+        if to_load:
+            print(f"Lazily loading details for tables {', '.join(to_load)}...", file=sys.stderr)
+            details = await self.db_connector.load_tables_details(to_load, fetch_all_metadata=True)
+            for name in to_load:
+                table_details = details.get(name)
+                current = self.cache.tables.get(name)
+                if current is not None and current.fully_loaded:
+                    # A concurrent request loaded it while we were waiting
+                    continue
+                if table_details:
+                    self.cache.tables[name] = TableInfo(
+                        table_name=name,
+                        columns=table_details.get("columns", []),
+                        relationships=table_details.get("relationships", {}),
+                        constraints=table_details.get("constraints"),
+                        indexes=table_details.get("indexes"),
+                        table_stats=table_details.get("table_stats"),
+                        comments=table_details.get("comments"),
+                        fully_loaded=True
+                    )
+                    # The entry replaced above was not fully loaded
+                    self.cache.fully_loaded_count += 1
+                else:
+                    # Table doesn't actually exist, remove it from our cache
+                    self.cache.tables.pop(name, None)
+                    self.cache.all_table_names.discard(name)
+                    self._invalidate_name_index()
+            # Save the updated cache to disk
+            await self.save_cache()
+        
+        return {
+            name: self.cache.tables.get(upper) if upper in self.cache.all_table_names else None
+            for name, upper in canonical.items()
+        }
+
+    async def invalidate_table(self, table_name: str, exists: bool = True) -> None:
+        """Forget cached metadata for a table after DDL changed it
+        
+        The next lookup reloads its details; exists=False (DROP TABLE) also
+        removes the name. Bumps the cache version, so responses rendered from
+        the old details are not reused.
+        """
+        if not self.cache:
+            return
+        self._forget_table(table_name, exists)
+        self.version += 1
+        await self.save_cache()
+
+    async def invalidate_index(self, index_name: str) -> None:
+        """Forget cached metadata for the table an index belonged to, after DROP INDEX
+        
+        DROP INDEX does not name the table, so it is looked up in the cached
+        table details and index lists; nothing happens if neither has the index.
+        """
+        if not self.cache:
+            return
+        tables = {
+            name for name, info in self.cache.tables.items()
+            if any(index.get('name') == index_name for index in info.indexes or [])
+        }
+        entries = self.object_cache['indexes']
+        for key, entry in list(entries.items()):
+            if any(index.get('name') == index_name for index in entry.get('data') or []):
+                tables.add(key.upper())
+                del entries[key]
+        if not tables:
+            return
+        for table_name in tables:
+            self._forget_table(table_name, exists=True)
+        self.version += 1
+        await self.save_cache()
+
+    def _forget_table(self, table_name: str, exists: bool) -> None:
+        """Drop a table's cached details and per-table object cache entries"""
+        info = self.cache.tables.pop(table_name, None)
+        if info is not None and info.fully_loaded:
+            self.cache.fully_loaded_count -= 1
+        if exists:
+            self.cache.all_table_names.add(table_name)
+        else:
+            self.cache.all_table_names.discard(table_name)
+        self._invalidate_name_index()
+        for cache_type, key in (
+            ('constraints', table_name),
+            ('indexes', table_name),
+            ('related_tables', f"related_{table_name}"),
+            ('dependencies', table_name),
+        ):
+            entries = self.object_cache[cache_type]
+            for stale in [k for k in entries if k.upper() == key.upper()]:
+                del entries[stale]
 
     async def search_tables(self, search_term: str, limit: int = 20) -> List[str]:
         """
@@ -230,10 +337,7 @@ class SchemaManager(SchemaManagerProtocol):
         search_term = search_term.upper()
         
         # First try exact/substring matches in cache
-        matching_tables = [
-            table_name for table_name in self.cache.all_table_names
-            if search_term in table_name
-        ]
+        matching_tables = self._table_name_index().search(search_term)
         
         # If we don't have enough results, search in the database
         if len(matching_tables) < limit:
@@ -247,6 +351,7 @@ class SchemaManager(SchemaManagerProtocol):
                 # Update cache with any new tables found
                 if new_tables:
                     self.cache.all_table_names.update(new_tables)
+                    self._invalidate_name_index()
                     await self.save_cache()
                     
             except Exception as e:
@@ -257,22 +362,27 @@ class SchemaManager(SchemaManagerProtocol):
 
     async def search_columns(self, search_term: str, limit: int = 50) -> Dict[str, List[Dict[str, Any]]]:
         """Search for columns matching the given pattern across all tables"""
+        return {table_name: columns async for table_name, columns in self.iter_search_columns(search_term, limit)}
+
+    async def iter_search_columns(self, search_term: str, limit: int = 50) -> AsyncIterator[Tuple[str, List[Dict[str, Any]]]]:
+        """Yield (table name, matching columns) pairs for up to 'limit' tables as they are found"""
         if not self.cache:
             await self.initialize()
             
         search_term = search_term.upper()
-        result = {}
+        result = set()
         
         # First check in cached tables to avoid database queries for already loaded tables
-        for table_name, table_info in self.cache.tables.items():
+        for table_name, table_info in list(self.cache.tables.items()):
             if not table_info.fully_loaded:
                 continue
-                
-            for column in table_info.columns:
-                if search_term in column["name"].upper():
-                    if table_name not in result:
-                        result[table_name] = []
-                    result[table_name].append(column)
+            
+            columns = [column for column in table_info.columns if search_term in column["name"].upper()]
+            if columns:
+                result.add(table_name)
+                yield table_name, columns
+                if len(result) >= limit:
+                    return
         
         # If we don't have enough results, search in uncached tables
         if len(result) < limit:
@@ -281,6 +391,7 @@ class SchemaManager(SchemaManagerProtocol):
                 if t not in self.cache.tables or not self.cache.tables[t].fully_loaded
             ]
             
+            found = []
             if uncached_tables:
                 try:
                     # Search for columns in uncached tables using database connector
@@ -289,7 +400,7 @@ class SchemaManager(SchemaManagerProtocol):
                     # Merge database results with cache results
                     for table_name, columns in db_results.items():
                         if table_name not in result:  # Only add if not already in cache results
-                            result[table_name] = columns
+                            found.append((table_name, columns))
                             
                             # Update cache with the new column information
                             if table_name not in self.cache.tables:
@@ -298,12 +409,14 @@ class SchemaManager(SchemaManagerProtocol):
                                     relationships={},
                                     fully_loaded=True
                                 )
+                                self.cache.fully_loaded_count += 1
                                 await self.save_cache()
                                 
                 except Exception as e:
                     print(f"Error during database column search: {str(e)}", file=sys.stderr)
-        
-        return dict(list(result.items())[:limit])
+            
+            for table_name, columns in found[:limit - len(result)]:
+                yield table_name, columns
 
     async def initialize(self) -> None:
         """Initialize the database context and build initial cache"""
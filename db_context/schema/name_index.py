@@ -0,0 +1,34 @@
+"""Substring index over the cached table names.
+
+Every suffix of every table name is kept in one sorted list, so the tables
+containing a search term are the entries in the contiguous run of suffixes
+starting with that term. A lookup is a binary search plus a walk over the
+matches instead of a substring test against every table name.
+"""
+
+from bisect import bisect_left
+from typing import Iterable, List
+
+
+class TableNameIndex:
+    """Sorted-suffix index answering "which names contain this term"."""
+
+    def __init__(self, table_names: Iterable[str]):
+        entries = sorted(
+            (name[start:], name)
+            for name in table_names
+            for start in range(len(name))
+        )
+        self._suffixes = [suffix for suffix, _ in entries]
+        self._names = [name for _, name in entries]
+
+    def search(self, term: str) -> List[str]:
+        """Return the indexed names containing term, sorted. Matching is case-sensitive."""
+        if not term:
+            return sorted(set(self._names))
+        matches = set()
+        position = bisect_left(self._suffixes, term)
+        while position < len(self._suffixes) and self._suffixes[position].startswith(term):
+            matches.add(self._names[position])
+            position += 1
+        return sorted(matches)
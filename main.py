@@ -11,7 +11,7 @@ import uuid  # retained for potential future use elsewhere
 import oracledb
 
 from db_context import DatabaseContext, MultiDatabaseContext
-from db_context.utils import wrap_untrusted
+from db_context.utils import is_read_statement, split_search_terms, wrap_untrusted
 from db_context.schema.formatter import format_sql_query_result
 
 # Load environment variables from .env file
@@ -266,17 +266,17 @@ async def rebuild_schema_cache(database_name: str, fetch_all_metadata: bool = Fa
     """
     db_context = validate_database(ctx, database_name)
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         metadata_mode = "with complete metadata" if fetch_all_metadata else "with lazy loading"
         print(f"Rebuilding cache {metadata_mode}...", file=sys.stderr)
         
         await db_context.rebuild_cache(fetch_all_metadata=fetch_all_metadata)
         
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         cache_size = len(db_context.schema_manager.cache.all_table_names) if db_context.schema_manager.cache else 0
         
         # Count fully loaded tables
-        fully_loaded = sum(1 for t in db_context.schema_manager.cache.tables.values() if t.fully_loaded) if db_context.schema_manager.cache else 0
+        fully_loaded = db_context.schema_manager.cache.fully_loaded_count if db_context.schema_manager.cache else 0
         
         result = f"Schema cache for '{database_name}' rebuilt successfully in {elapsed:.2f} seconds.\n"
         result += f"Indexed {cache_size} tables ({fully_loaded} with full metadata)."
@@ -309,8 +309,9 @@ async def get_tables_schema(database_name: str, table_names: List[str], ctx: Con
     db_context = validate_database(ctx, database_name)
     results = []
     
-    for table_name in table_names:
-        table_info = await db_context.get_schema_info(table_name)
+    # One batched metadata load for every table that is not cached yet
+    table_infos = await db_context.batch_get_schema_info(table_names)
+    for table_name, table_info in table_infos.items():
         if not table_info:
             results.append(f"\nTable '{table_name}' not found in database '{database_name}'.")
             continue
@@ -335,8 +336,7 @@ async def search_tables_schema(database_name: str, search_term: str, ctx: Contex
     db_context = validate_database(ctx, database_name)
     
     # Split search term by commas and whitespace and remove empty strings
-    search_terms = [term.strip() for term in search_term.replace(',', ' ').split()]
-    search_terms = [term for term in search_terms if term]
+    search_terms = split_search_terms(search_term)
     
     if not search_terms:
         return "No valid search terms provided"
@@ -364,9 +364,9 @@ async def search_tables_schema(database_name: str, search_term: str, ctx: Contex
     
     matching_tables = limited_tables
     
-    # Now load the schema for each matching table
-    for table_name in matching_tables:
-        table_info = await db_context.get_schema_info(table_name)
+    # Now load the schema for the matching tables in one batch
+    table_infos = await db_context.batch_get_schema_info(matching_tables)
+    for table_info in table_infos.values():
         if not table_info:
             continue
         
@@ -786,8 +786,7 @@ async def execute_write_sql(database_name: str, sql: str, ctx: Context) -> str:
     
     try:
         # Validate it's not a SELECT (use run_sql_query for that)
-        sql_upper = sql.strip().upper()
-        if sql_upper.startswith('SELECT') or sql_upper.startswith('WITH'):
+        if is_read_statement(sql):
             return wrap_untrusted(
                 f"[{database_name}] Use 'run_sql_query' tool for SELECT statements. "
                 "This tool is for write operations only (INSERT, UPDATE, DELETE, DDL)."
@@ -810,10 +809,14 @@ async def execute_write_sql(database_name: str, sql: str, ctx: Context) -> str:
             "Contact your database administrator to enable write mode if needed."
         )
     except oracledb.Error as e:
-        error_code = getattr(e.args[0] if e.args else None, 'code', 'Unknown')
+        # full_code carries the prefix too (ORA-00942, DPY-4011, ...)
+        try:
+            error_code = e.args[0].full_code
+        except (IndexError, AttributeError):
+            error_code = "ORA-Unknown"
         error_msg = str(e)
         return wrap_untrusted(
-            f"[{database_name}] ✗ Database error (ORA-{error_code}): {error_msg}\n\n"
+            f"[{database_name}] ✗ Database error ({error_code}): {error_msg}\n\n"
             "Common issues:\n"
             "- Insufficient privileges\n"
             "- Constraint violation (foreign key, unique, check)\n"
@@ -893,15 +896,15 @@ async def generate_sample_queries(database_name: str, ctx: Context) -> str:
         
         # Get metadata for up to 5 tables to generate diverse queries
         tables_to_analyze = all_tables[:min(5, len(all_tables))]
-        table_metadata = []
-        
-        for table_name in tables_to_analyze:
-            try:
-                table_info = await db_context.get_schema_info(table_name)
-                if table_info and table_info.columns:
-                    table_metadata.append(table_info)
-            except Exception as e:
-                print(f"Could not load metadata for {table_name}: {e}", file=sys.stderr)
+        try:
+            table_infos = await db_context.batch_get_schema_info(tables_to_analyze)
+        except Exception as e:
+            print(f"Could not load metadata for {', '.join(tables_to_analyze)}: {e}", file=sys.stderr)
+            table_infos = {}
+        table_metadata = [
+            table_info for table_info in table_infos.values()
+            if table_info and table_info.columns
+        ]
         
         if not table_metadata:
             return wrap_untrusted(f"[{database_name}] Could not load table metadata for query generation.")
@@ -2774,11 +2777,18 @@ if __name__ == "__main__":
     # Handle different transport modes
     if args.transport == "http-api":
         # Run FastAPI REST API server
-        from api.app import run_fastapi_server
-        asyncio.run(run_fastapi_server(args.host, args.port))
+        from api.app import run_server
+        run_server(args.host, args.port)
     elif args.transport in ("sse", "http"):
-        # Run HTTP/SSE transport for MCP
-        asyncio.run(run_http_server(args.host, args.port))
+        # Run HTTP/SSE transport for MCP, on uvloop where it is installed
+        try:
+            import uvloop
+        except ImportError:  # uvloop is not available on Windows
+            uvloop = None
+        if uvloop is not None:
+            uvloop.run(run_http_server(args.host, args.port))
+        else:
+            asyncio.run(run_http_server(args.host, args.port))
     else:
         # Run stdio transport for MCP
         mcp.run(transport="stdio")